@@ -0,0 +1,214 @@
+# The animations module that handles loading every animation frame once and looking them up by sprite and state.
+# Tanner Fry
+# tefnq2@mst.edu
+import settings
+
+import pygame
+
+# Every menu interaction is drawn with the same frames, only how fast they're played changes
+INTERACTING_LOCATION = (settings.DIR_SPRITES_CHAR_BASE
+                        + '/Interacting/Feedback/Sprite_Char_Base_96_Trimmed_Interacting_Feedback')
+# The table of every sprite's animations. Each state points at the location of its frames, how many frames there are,
+# and how many ticks each frame is shown for. A location is followed by the frame number and '.png' when it has
+# frames, otherwise it's a single complete file. A speed is either a number, a setting's name so the user's settings
+# are honored, or None to keep the speed of the previous state.
+ANIMATIONS = {
+    'Char_Base': {
+        'None': {
+            'Location': settings.DIR_SPRITES_CHAR_BASE + '/Idle/Sprite_Char_Base_96_Trimmed_Idle.png',
+            'Frames': 0,
+            'Speed': None
+        },
+        'Climbing': {
+            'Location': settings.DIR_SPRITES_CHAR_BASE + '/Climbing/Sprite_Char_Base_96_Trimmed_Climbing',
+            'Frames': 3,
+            'Speed': 'ANIM_CLIMBING_SPEED'
+        },
+        'Crying': {
+            'Location': settings.DIR_SPRITES_CHAR_BASE + '/Crying/Sprite_Char_Base_96_Trimmed_Crying',
+            'Frames': 14,
+            'Speed': None
+        },
+        'Falling': {
+            'Location': settings.DIR_SPRITES_CHAR_BASE + '/Falling/Sprite_Char_Base_96_Trimmed_Falling',
+            'Frames': 2,
+            'Speed': 'ANIM_FALLING_SPEED'
+        },
+        'Idle': {
+            'Location': settings.DIR_SPRITES_CHAR_BASE + '/Breathing/Sprite_Char_Base_96_Trimmed_Breathing',
+            'Frames': 4,
+            'Speed': 'ANIM_IDLE_SPEED'
+        },
+        'Interacting_With_Exit': {
+            'Location': INTERACTING_LOCATION,
+            'Frames': 8,
+            'Speed': 'ANIM_INTERACT_EXIT_SPEED'
+        },
+        'Interacting_With_Feedback': {
+            'Location': INTERACTING_LOCATION,
+            'Frames': 8,
+            'Speed': 'ANIM_INTERACT_FEEDBACK_SPEED'
+        },
+        'Interacting_With_Help': {
+            'Location': INTERACTING_LOCATION,
+            'Frames': 8,
+            'Speed': 'ANIM_INTERACT_HELP_SPEED'
+        },
+        'Interacting_With_Load': {
+            'Location': INTERACTING_LOCATION,
+            'Frames': 8,
+            'Speed': None
+        },
+        'Interacting_With_Options': {
+            'Location': INTERACTING_LOCATION,
+            'Frames': 8,
+            'Speed': 'ANIM_INTERACT_OPTIONS_SPEED'
+        },
+        'Running': {
+            'Location': settings.DIR_SPRITES_CHAR_BASE + '/Running/Sprite_Char_Base_96_Trimmed_Running',
+            'Frames': 7,
+            'Speed': 'ANIM_RUNNING_SPEED'
+        },
+        'Walking': {
+            'Location': settings.DIR_SPRITES_CHAR_BASE + '/Running/Sprite_Char_Base_96_Trimmed_Running',
+            'Frames': 7,
+            'Speed': 'ANIM_WALKING_SPEED'
+        }
+    },
+    'NPC_Squishy': {
+        'None': {
+            'Location': settings.DIR_SPRITES_NPC + '/Squishy/Idle/Sprite_NPC_Base_96_Trimmed_Idle.png',
+            'Frames': 0,
+            'Speed': None
+        },
+        'Idle': {
+            'Location': settings.DIR_SPRITES_NPC + '/Squishy/Breathing/Sprite_NPC_Base_96_Trimmed_Breathing',
+            'Frames': 2,
+            'Speed': 6
+        },
+        'Running': {
+            'Location': settings.DIR_SPRITES_NPC + '/Squishy/Running/Sprite_NPC_Base_96_Trimmed_Running',
+            'Frames': 6,
+            'Speed': 10
+        }
+    }
+}
+
+
+class FrameSet(object):
+    """Class. Used to hold the frames of one animation facing both directions along with how fast it's played."""
+    def __init__(self, frames: list, speed=None):
+        """
+        Constructor. Used to store the right facing frames and flip them, once, for the left facing frames.
+
+        @param frames: the frames of the animation facing right
+        @type frames: list
+        @param speed: the ticks each frame is shown for, a setting's name, or None to keep the previous speed
+        @type speed: int
+        """
+        self.frames_left = tuple(pygame.transform.flip(frame, True, False) for frame in frames)
+        self.frames_right = tuple(frames)
+        self.speed = speed
+
+    def __len__(self):
+        return len(self.frames_right)
+
+    def get_frames(self, direction: str):
+        """
+        Accessor. Grab the frames that face a direction.
+
+        @param direction: the direction the sprite is facing, 'Left' or 'Right'
+        @type direction: str
+        @return: the frames facing the direction
+        @rtype: tuple
+        """
+        if direction == 'Left':
+            return self.frames_left
+        return self.frames_right
+
+    def get_speed(self):
+        """
+        Accessor. Grab the ticks each frame is shown for.
+
+        @return: the ticks each frame is shown for or None to keep the previous speed
+        @rtype: int
+        """
+        if isinstance(self.speed, str):
+            return getattr(settings, self.speed)
+        return self.speed
+
+
+class AnimationLibrary(object):
+    """
+    Class. Used to load every animation frame from disk once, so changing animations is only a matter of pointing at a
+    different frame set instead of loading images in the middle of the game.
+    """
+    def __init__(self):
+        """
+        Constructor. Used to initialize an empty library.
+        """
+        self.frame_sets = {}  # (location, frames, speed) -> FrameSet
+        self.images = {}  # File location -> image, so states that share frames share the same images
+        self.sprites = {}  # Sprite name -> {state: FrameSet}
+
+    def load_image(self, location: str):
+        """
+        A function to load an image from disk, only the first time it's asked for.
+
+        @param location: the file location of the image
+        @type location: str
+        @return: the image
+        @rtype: surface
+        """
+        image = self.images.get(location)
+        if image is None:
+            image = pygame.image.load(location).convert_alpha()
+            self.images[location] = image
+        return image
+
+    def load_frames(self, location: str, frames: int, speed=None):
+        """
+        A function to load the frames of an animation, only the first time they're asked for.
+
+        @param location: the file location of the frames without the frame number and '.png', or of a single image if
+                         there are no frames
+        @type location: str
+        @param frames: the number of frames, numbered from 1, or 0 for a single image
+        @type frames: int
+        @param speed: the ticks each frame is shown for, a setting's name, or None to keep the previous speed
+        @type speed: int
+        @return: the frames of the animation
+        @rtype: FrameSet
+        """
+        key = (location, frames, speed)
+        frame_set = self.frame_sets.get(key)
+        if frame_set is None:
+            if frames == 0:
+                images = [self.load_image(location)]
+            else:
+                images = [self.load_image(location + str(i) + '.png') for i in range(1, frames + 1)]
+            frame_set = FrameSet(images, speed)
+            self.frame_sets[key] = frame_set
+        return frame_set
+
+    def load_sprite(self, sprite_name: str):
+        """
+        A function to load every animation of a sprite from the animation table, only the first time it's asked for.
+
+        @param sprite_name: the name of the sprite in the animation table
+        @type sprite_name: str
+        @return: the frames of every state of the sprite
+        @rtype: dict
+        """
+        states = self.sprites.get(sprite_name)
+        if states is None:
+            states = {}
+            for state, animation in ANIMATIONS[sprite_name].items():
+                states[state] = self.load_frames(animation['Location'], animation['Frames'], animation['Speed'])
+            self.sprites[sprite_name] = states
+            print('[Debug - Info]: Loaded', len(states), 'animations for', sprite_name + '.')
+        return states
+
+
+# The library shared by the whole engine
+library = AnimationLibrary()
@@ -0,0 +1,246 @@
+# The benchmark module that times the engine's hot paths and recorded play sessions and compares them to a baseline.
+# Tanner Fry
+# tefnq2@mst.edu
+import collision
+import engine
+import engineLib
+import level
+import settings
+
+import json
+import logging
+import os
+import pygame
+import random
+import statistics
+import sys
+import time
+
+DIR_BENCHMARKS = 'Bin/Benchmarks'  # Recorded play sessions to replay, '.inp' files made with 'engine.py --record'
+FILE_BASELINE = DIR_BENCHMARKS + '/baseline.json'
+BENCHMARK_LEVEL = 1  # The level every level benchmark loads
+REGRESSION_THRESHOLD = 0.1  # How much slower than the baseline, as a fraction, a benchmark can get before it's flagged
+REPEATS = 5  # Times every benchmark is timed, the median is kept
+
+
+def time_function(function, number: int, repeats=REPEATS):
+    """
+    A function to time how long a function takes to run.
+
+    @param function: the function to time, it's called with no arguments
+    @type function: function
+    @param number: the number of calls to average over for each timing
+    @type number: int
+    @param repeats: the number of timings
+    @type repeats: int
+    @return: the median and fastest milliseconds per call, and the number of calls
+    @rtype: dict
+    """
+    times = []
+    for _ in range(repeats):
+        time_start = time.perf_counter()
+        for _ in range(number):
+            function()
+        times.append((time.perf_counter() - time_start) * 1000 / number)
+    return {'ms': statistics.median(times), 'ms_min': min(times), 'calls': number * repeats}
+
+
+def load_tileset():
+    """
+    A function to load the tileset with its images, the same way the game does.
+
+    @return: the tileset
+    @rtype: level.Tileset
+    """
+    tileset_manifest = engineLib.load_tileset(settings.FILE_TILESET)
+    environment_spritesheet = engineLib.SpriteSheet(settings.DIR_SPRITES_GAME_ENVI + '/' + tileset_manifest['sheet'],
+                                                    tileset_manifest['colorkey'])
+    return level.Tileset(tileset_manifest, environment_spritesheet.get_tiles(tileset_manifest))
+
+
+def benchmark_level(tileset: level.Tileset):
+    """
+    A function to time loading a level and making its walls, without a save.
+
+    @param tileset: the tileset the level's tiles belong to
+    @type tileset: level.Tileset
+    @return: the timings of each benchmark by name
+    @rtype: dict
+    """
+    results = {}
+    level_text = level.Level(BENCHMARK_LEVEL, tileset)
+    path_text = level_text.get_path(1)
+    results['level_load_text'] = time_function(lambda: level.SubLevel.load(1, path_text, tileset), 20)
+    level.compile_level(BENCHMARK_LEVEL, tileset)
+
+    def load_compiled():
+        level_compiled = level.Level.load_compiled(BENCHMARK_LEVEL, tileset)
+        level_compiled.get_sub_level(1)
+        level_compiled.close()
+    results['level_load_compiled'] = time_function(load_compiled, 20)
+    sub_level = level_text.get_sub_level(1)
+    level_text.close()
+    # A new sub-level every time so the sprites are always made, not taken from the last call
+    results['level_sprites'] = time_function(
+        lambda: level.SubLevel(1, bytearray(sub_level.tiles)).get_sprites(tileset), 20)
+    results['level_merge_tiles'] = time_function(lambda: level.merge_tiles(sub_level.tiles), 20)
+
+    # Rects the size of the character all over the screen, the same ones every run
+    collision_layer = collision.CollisionLayer(sub_level)
+    rects = [pygame.Rect(x, y, 32, 64) for x, y in zip(random.Random(0).choices(range(settings.SCREEN_WIDTH), k=100),
+                                                       random.Random(1).choices(range(settings.SCREEN_HEIGHT), k=100))]
+    results['collision_query'] = time_function(lambda: [collision_layer.query(rect) for rect in rects], 100)
+    return results
+
+
+def benchmark_game(file_save_name: str):
+    """
+    A function to time the parts of a running game, from a save, without a window.
+
+    @param file_save_name: the name of the save to load
+    @type file_save_name: str
+    @return: the timings of each benchmark by name
+    @rtype: dict
+    """
+    results = {}
+    engine_game = engine.start_headless(file_save_name, BENCHMARK_LEVEL, seed=0)
+    if engine_game is None:
+        logging.error('* Error - Unable to set up the game for the game benchmarks.')
+        return results
+    results['character_check_collision'] = time_function(engine_game.character.check_collision, 1000)
+    results['game_tick'] = time_function(engine_game.game_tick, 200)
+    results['game_draw'] = time_function(engine_game.game_draw, 100)
+    engine_game.level_tiles.close()
+    engine_main_menu = engine.MainMenu(engine_game)
+    results['menu_draw'] = time_function(engine_main_menu.menu_draw, 100)
+    return results
+
+
+def benchmark_scenarios():
+    """
+    A function to time replaying every recorded play session in the benchmarks folder.
+
+    @return: the timings of each scenario by name, in milliseconds per tick
+    @rtype: dict
+    """
+    results = {}
+    if not os.path.isdir(DIR_BENCHMARKS):
+        return results
+    for file_name in sorted(os.listdir(DIR_BENCHMARKS)):
+        name, extension = os.path.splitext(file_name)
+        if extension != '.inp':
+            continue
+        times = []
+        for _ in range(REPEATS):
+            replay = engine.replay_headless(DIR_BENCHMARKS + '/' + file_name)
+            if replay is None:
+                break
+            times.append(replay['seconds'] * 1000 / max(replay['ticks'], 1))
+        if len(times) == 0:
+            logging.error('* Error - Unable to replay the scenario: %s.', file_name)
+            continue
+        results['scenario_' + name] = {'ms': statistics.median(times), 'ms_min': min(times),
+                                       'calls': replay['ticks'] * REPEATS}
+    return results
+
+
+def run_benchmarks(file_save_name=None):
+    """
+    A function to run every benchmark that can run. Benchmarks that need a save are skipped without one, and a
+    benchmark that fails is logged and left out instead of stopping the others.
+
+    @param file_save_name: the name of the save to run the game benchmarks on, or None to skip them
+    @type file_save_name: str
+    @return: the timings of each benchmark by name
+    @rtype: dict
+    """
+    # Nothing is shown, the display only has to exist for images to be converted
+    os.environ['SDL_VIDEODRIVER'] = 'dummy'
+    pygame.init()
+    pygame.display.set_mode((settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT))
+    results = {}
+    try:
+        results.update(benchmark_level(load_tileset()))
+    except Exception:
+        logging.exception('* Error - Unable to run the level benchmarks.')
+    if file_save_name is not None:
+        try:
+            results.update(benchmark_game(file_save_name))
+        except Exception:
+            logging.exception('* Error - Unable to run the game benchmarks.')
+    try:
+        results.update(benchmark_scenarios())
+    except Exception:
+        logging.exception('* Error - Unable to run the scenario benchmarks.')
+    return results
+
+
+def compare(results: dict, baseline: dict, threshold=REGRESSION_THRESHOLD):
+    """
+    A function to compare timings to a baseline.
+
+    @param results: the timings of each benchmark by name, see run_benchmarks()
+    @type results: dict
+    @param baseline: the timings to compare to, in the same form
+    @type baseline: dict
+    @param threshold: how much slower than the baseline, as a fraction, a benchmark can get before it's flagged
+    @type threshold: float
+    @return: the name, baseline milliseconds, milliseconds, change as a fraction, and whether it's a regression, of
+             every benchmark in both, by name
+    @rtype: list
+    """
+    comparison = []
+    for name in sorted(results):
+        if name not in baseline:
+            continue
+        ms_baseline = baseline[name]['ms']
+        ms = results[name]['ms']
+        change = (ms - ms_baseline) / ms_baseline if ms_baseline > 0 else 0.0
+        comparison.append((name, ms_baseline, ms, change, change > threshold))
+    return comparison
+
+
+def format_report(results: dict, baseline: dict, threshold=REGRESSION_THRESHOLD):
+    """
+    A function to write the timings, and how they compare to a baseline, as a table.
+
+    @param results: the timings of each benchmark by name, see run_benchmarks()
+    @type results: dict
+    @param baseline: the timings to compare to, in the same form
+    @type baseline: dict
+    @param threshold: how much slower than the baseline, as a fraction, a benchmark can get before it's flagged
+    @type threshold: float
+    @return: the lines of the report
+    @rtype: list
+    """
+    lines = ['%-28s %12s %12s %9s' % ('Benchmark', 'Baseline ms', 'Now ms', 'Change')]
+    compared = {name: (ms_baseline, change, regressed)
+                for name, ms_baseline, _, change, regressed in compare(results, baseline, threshold)}
+    for name in sorted(results):
+        if name in compared:
+            ms_baseline, change, regressed = compared[name]
+            lines.append('%-28s %12.4f %12.4f %+8.1f%%%s' % (name, ms_baseline, results[name]['ms'], change * 100,
+                                                              '  REGRESSION' if regressed else ''))
+        else:
+            lines.append('%-28s %12s %12.4f %9s' % (name, '-', results[name]['ms'], 'new'))
+    return lines
+
+
+if __name__ == '__main__':
+    # python benchmark.py [save name] [--update], run from the Engine folder. The baseline is made on the first run
+    # and replaced with --update, otherwise every run is compared to it and fails if anything got slower
+    arguments = [arg for arg in sys.argv[1:] if arg != '--update']
+    timings = run_benchmarks(arguments[0] if len(arguments) > 0 else None)
+    timings_baseline = {}
+    if os.path.isfile(FILE_BASELINE):
+        with open(FILE_BASELINE, 'r') as file:
+            timings_baseline = json.load(file)
+    for report_line in format_report(timings, timings_baseline):
+        print(report_line)
+    if '--update' in sys.argv or len(timings_baseline) == 0:
+        os.makedirs(DIR_BENCHMARKS, exist_ok=True)
+        with open(FILE_BASELINE, 'w') as file:
+            json.dump(timings, file, indent=4, sort_keys=True)
+        print('[Debug - Info]: Saved the baseline to', FILE_BASELINE + '.')
+    elif any(regressed for _, _, _, _, regressed in compare(timings, timings_baseline)):
+        sys.exit(1)
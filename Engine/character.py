@@ -1,12 +1,15 @@
 # The character module that handles all interactions between the game, the engine itself and the character.
 # Tanner Fry
 # tefnq2@mst.edu
+import animations
+import collision
+import physics
 import settings
 
 import pygame
 
 
-class Character(pygame.sprite.Sprite):
+class Character(physics.PhysicsSprite):
     """Class. To handle events, actions, and information regarding the character and their impacts on the game."""
     def __init__(self, name: str, file_save_name: str, engine_game: object, x: int, y: int):
         """
@@ -26,7 +29,7 @@ class Character(pygame.sprite.Sprite):
         self.engine_game = engine_game
         self.engine_menu = object  # Used only for the sample character to access the menu object
         self.groups = engine_game.sprites_important
-        pygame.sprite.Sprite.__init__(self, self.groups)
+        physics.PhysicsSprite.__init__(self, self.groups)
         self.name = name
         self.file_save_name = file_save_name
         # Variables
@@ -79,10 +82,10 @@ class Character(pygame.sprite.Sprite):
         self.trait_strength_increase_modifier = settings.CHAR_STRENGTH_INCREASE_MODIFIER
         self.trait_strength_decrease_time_modifier = settings.CHAR_STRENGTH_DECREASE_TIME_MODIFIER
         self.trait_strength_increase_time_modifier = settings.CHAR_STRENGTH_INCREASE_TIME_MODIFIER
-        # Images
-        self.images = []
-        self.images.append(pygame.image.load(settings.DIR_SPRITES_CHAR_BASE
-                                             + '/Idle/Sprite_Char_Base_96_Trimmed_Idle.png').convert_alpha())
+        # Images, every animation is loaded up front so changing states only changes which frames are pointed at
+        self.animations = animations.library.load_sprite('Char_Base')
+        self.frame_set = self.animations['None']
+        self.images = self.frame_set.get_frames(self.direction)
         self.image_index = 0
         self.image = self.images[self.image_index]
         self.rect = self.image.get_rect()
@@ -103,7 +106,8 @@ class Character(pygame.sprite.Sprite):
         @return: none
         @rtype: none
         """
-        keys_pressed = pygame.key.get_pressed()
+        # Live from the keyboard, or from a recording when one is being replayed
+        keys_pressed = self.engine_game.inputs.get_pressed()
 
         # TODO: Create the handling of key bindings set by the user in 'bindings.py'
         # Handling keys for jumping
@@ -237,104 +241,27 @@ class Character(pygame.sprite.Sprite):
 
         # Change animation via state
         if self.state_changed:
-            self.images.clear()
             # Reset values since we are changing animations
             self.image_index = 0
             self.state_changed = False
             self.timer_images = 0
-            if self.state == 'Idle':
-                # No need for images facing left. We can just transform.flip the character
-                for i in range(1, 5):
-                    self.images.append(pygame.image.load(settings.DIR_SPRITES_CHAR_BASE
-                                                         + '/Breathing/Sprite_Char_Base_96_Trimmed_Breathing' + str(i)
-                                                         + '.png').convert_alpha())
-            elif self.state == 'Climbing':
-                for i in range(1, 4):
-                    self.images.append(pygame.image.load(settings.DIR_SPRITES_CHAR_BASE
-                                                         + '/Climbing/Sprite_Char_Base_96_Trimmed_Climbing' + str(i)
-                                                         + '.png').convert_alpha())
-            elif self.state == 'Crying':
-                for i in range(1, 15):
-                    self.images.append(pygame.image.load(settings.DIR_SPRITES_CHAR_BASE
-                                                         + '/Crying/Sprite_Char_Base_96_Trimmed_Crying' + str(i)
-                                                         + '.png').convert_alpha())
-            elif self.state == 'Falling':
-                for i in range(1, 3):
-                    self.images.append(pygame.image.load(settings.DIR_SPRITES_CHAR_BASE
-                                                         + '/Falling/Sprite_Char_Base_96_Trimmed_Falling' + str(i)
-                                                         + '.png').convert_alpha())
-            # TODO: Finish this for special menu interactions
-            elif self.state == 'Interacting_With_Exit':
-                for i in range(1, 9):
-                    self.images.append(pygame.image.load(settings.DIR_SPRITES_CHAR_BASE
-                                                         + '/Interacting/Feedback/Sprite_Char_Base_96_Trimmed'
-                                                         + '_Interacting_Feedback' + str(i) + '.png').convert_alpha())
-            elif self.state == 'Interacting_With_Feedback':
-                for i in range(1, 9):
-                    self.images.append(pygame.image.load(settings.DIR_SPRITES_CHAR_BASE
-                                                         + '/Interacting/Feedback/Sprite_Char_Base_96_Trimmed'
-                                                         + '_Interacting_Feedback' + str(i) + '.png').convert_alpha())
-            elif self.state == 'Interacting_With_Help':
-                for i in range(1, 9):
-                    self.images.append(pygame.image.load(settings.DIR_SPRITES_CHAR_BASE
-                                                         + '/Interacting/Feedback/Sprite_Char_Base_96_Trimmed'
-                                                         + '_Interacting_Feedback' + str(i) + '.png').convert_alpha())
-            elif self.state == 'Interacting_With_Load':
-                for i in range(1, 9):
-                    self.images.append(pygame.image.load(settings.DIR_SPRITES_CHAR_BASE
-                                                         + '/Interacting/Feedback/Sprite_Char_Base_96_Trimmed'
-                                                         + '_Interacting_Feedback' + str(i) + '.png').convert_alpha())
-            elif self.state == 'Interacting_With_Options':
-                for i in range(1, 9):
-                    self.images.append(pygame.image.load(settings.DIR_SPRITES_CHAR_BASE
-                                                         + '/Interacting/Feedback/Sprite_Char_Base_96_Trimmed'
-                                                         + '_Interacting_Feedback' + str(i) + '.png').convert_alpha())
-            elif self.state == 'Running' or self.state == 'Walking':
-                # No need for images facing left. We can just transform.flip the character
-                for i in range(1, 8):
-                    self.images.append(pygame.image.load(settings.DIR_SPRITES_CHAR_BASE
-                                                         + '/Running/Sprite_Char_Base_96_Trimmed_Running' + str(i)
-                                                         + '.png').convert_alpha())
+            # No need for loading images or images facing left, the library already has both. States without an
+            # animation of their own, such as jumping, keep the last one
+            self.frame_set = self.animations.get(self.state, self.frame_set)
             print('State changed to ' + self.state)
 
     def check_character_apply_physics(self):
         """
-        Apply physics to the character's velocity
+        A function to update what depends on the character's physics, after physics.step() has moved the character.
 
         @return: none
         @rtype: none
         """
-        # Gravity
-        if self.jumping:
-            self.falling = False
-            self.rect.y -= self.y_velocity
-            self.y_velocity = self.y_velocity - settings.GRAVITY
-            if self.y_velocity < 0:
-                self.falling = True
-                self.jumping = False
-                self.y_velocity = 0
-            # Apply air resistance
-            # if self.x_velocity > 0:
-            #     self.x_velocity -= settings.AIR_RESISTANCE
-            # elif self.x_velocity < 0:
-            #     self.x_velocity += settings.AIR_RESISTANCE
-        elif self.falling is True and self.climbing is False:
-            self.jumping = False
-            self.rect.y += self.y_velocity
-            self.y_velocity = self.y_velocity + settings.GRAVITY
-            # Apply air resistance
-            # if self.x_velocity > 0:
-            #     self.x_velocity -= settings.AIR_RESISTANCE
-            # elif self.x_velocity < 0:
-            #     self.x_velocity += settings.AIR_RESISTANCE
-
         if self.climbing:
-            self.rect.y += self.y_velocity
             if settings.DOUBLE_JUMP is True:
                 self.jump_count = 0
         elif self.jumping is False and self.falling is False:
             self.jump_count = 0
-            self.y_velocity = 0
 
         # Update traits based on character interactions
         # Endurance
@@ -351,28 +278,6 @@ class Character(pygame.sprite.Sprite):
         # Resolve
         # Strength
 
-        # Apply friction and air resistance
-        if self.x_velocity > 0:
-            # Apply friction
-            if self.falling is False and self.jumping is False:
-                self.x_velocity -= settings.FRICTION
-            # Apply air resistance
-            elif self.falling is True:
-                self.x_velocity -= settings.AIR_RESISTANCE
-            if self.x_velocity <= 0.4:
-                self.x_velocity = 0
-        elif self.x_velocity < 0:
-            # Apply friction
-            if self.falling is False and self.jumping is False:
-                self.x_velocity += settings.FRICTION
-            # Apply air resistance
-            elif self.falling is True:
-                self.x_velocity += settings.AIR_RESISTANCE
-            if self.x_velocity >= -0.4:
-                self.x_velocity = 0
-        # Update character
-        self.rect.x += self.x_velocity
-
     def check_collision(self):
         """
         A function to check the character against in game objects for collisions as well as updating other character
@@ -381,7 +286,8 @@ class Character(pygame.sprite.Sprite):
         @return: none
         @rtype: none
         """
-        wall_hit_list = pygame.sprite.spritecollide(self, self.engine_game.sprites_active_walls, False)
+        # Only the tiles under the character are checked
+        wall_hit_list = self.engine_game.collision_layer.query(self.rect)
 
         # Check special collision sets
         if self.collision_sets != 'None':
@@ -396,75 +302,8 @@ class Character(pygame.sprite.Sprite):
 
         # Check tile collision sets
         if len(wall_hit_list) > 0:
-            for wall in wall_hit_list:
-                # Check falling/walking into a wall from above
-                if self.rect.collidepoint(wall.rect.midtop):
-                    # Could fix, not important atm
-                    self.rect.bottom = wall.rect.top + 1  # 1 works perfectly... don't ask cause idk
-                    self.falling = False
-                # Check falling into corner, lets clip through it
-                if self.rect.collidepoint(wall.rect.topleft) and not self.rect.collidepoint(wall.rect.midleft) and self.falling is True:
-                    pass
-                # Check falling into corner, lets clip through it
-                if self.rect.collidepoint(wall.rect.topright) and not self.rect.collidepoint(wall.rect.midright) and self.falling is True:
-                    pass
-                # Check hitting into a wall from above-left
-                if self.rect.collidepoint(wall.rect.topleft) and not self.rect.collidepoint(wall.rect.midleft) \
-                        and self.falling is False and self.climbing is False:
-                    # Check if character is close to the corner of above-left and not trying to hang/climb down
-                    # TODO: Create the ability for the character to hang on the tile if they are at an edge to hang on whether left or right
-                    # TODO: NOTE - This could get intensive as it requires a function to determine if the character is at an edge.
-                    self.rect.bottom = wall.rect.top + 1  # 1 works perfectly
-                    self.falling = False
-                # Check hitting into a wall from above-right
-                if self.rect.collidepoint(wall.rect.topright) and not self.rect.collidepoint(wall.rect.midright) \
-                        and self.falling is False and self.climbing is False:
-                    # Check if character is close to the corner of above-right and not trying to hang/climb down
-                    # TODO: Create the ability for the character to hang on the tile if they are at an edge to hang on
-                    self.rect.bottom = wall.rect.top + 1  # 1 works perfectly
-                    self.falling = False
-                # Check hitting into a wall from the left
-                if self.rect.collidepoint(wall.rect.midleft):
-                    # Check climbing ability
-                    if self.try_climb and self.trait_endurance > settings.REQ_CLIMBING_ENDURANCE:
-                        self.climbing = True
-                        # Make sure new y velocity won't collide when going up
-                        if self.rect.collidepoint(wall.rect.bottomright) or self.rect.collidepoint(wall.rect.midbottom):
-                            self.rect.top = wall.rect.bottom + 1
-                        elif self.rect.collidepoint(wall.rect.topright) or self.rect.collidepoint(wall.rect.midtop):
-                            self.rect.bottom = wall.rect.top - 1
-                    else:
-                        # Fall if climbing button is not pressed while against wall
-                        self.climbing = False
-                        if not self.rect.collidepoint(wall.rect.midtop):
-                            self.falling = True
-                    # Check if movement would have went through wall
-                    if self.rect.x + self.rect.width >= wall.rect.x:
-                        self.rect.right = wall.rect.left + 1
-                # Check hitting into a wall from the right
-                elif self.rect.collidepoint(wall.rect.midright):
-                    # Check climbing ability
-                    if self.try_climb and self.trait_endurance > settings.REQ_CLIMBING_ENDURANCE:
-                        self.climbing = True
-                        # Make sure new y velocity won't collide when going up
-                        if self.rect.collidepoint(wall.rect.bottomleft) or self.rect.collidepoint(wall.rect.midbottom):
-                            self.rect.top = wall.rect.bottom + 1
-                        elif self.rect.collidepoint(wall.rect.topleft) or self.rect.collidepoint(wall.rect.midtop):
-                            self.rect.bottom = wall.rect.top - 1
-                    else:
-                        # Fall if climbing button is not pressed while against wall
-                        self.climbing = False
-                        if not self.rect.collidepoint(wall.rect.midtop):
-                            self.falling = True
-                    # Check if movement would have went through wall
-                    if self.rect.x <= wall.rect.x + wall.rect.width:
-                        self.rect.left = wall.rect.right - 1
-                # Check hitting into a wall from below
-                if self.rect.collidepoint(wall.rect.midbottom):
-                    self.y_velocity = 0
-                    self.rect.top = wall.rect.bottom + 1
-                    if not self.rect.collidepoint(wall.rect.midtop) and self.climbing is False and self.falling is False:
-                        self.falling = True
+            can_climb = self.try_climb and self.trait_endurance > settings.REQ_CLIMBING_ENDURANCE
+            collision.resolve_walls(self, wall_hit_list, can_climb)
         # Check if not touching anything
         else:
             # Climbing
@@ -490,24 +329,11 @@ class Character(pygame.sprite.Sprite):
         """
         # TODO: Change what value is set to self.timer_images_trigger after all skills are implemented since the animation speed will
         # CONT: depend on how fast the character is going, which is based on their traits
-        if self.state == 'Climbing':
-            self.timer_images_trigger = settings.ANIM_CLIMBING_SPEED
-        elif self.state == 'Jumping':
-            self.timer_images_trigger = settings.ANIM_JUMPING_SPEED
-        elif self.state == 'Falling':
-            self.timer_images_trigger = settings.ANIM_FALLING_SPEED
-        elif self.state == 'Interacting_With_Exit':
-            self.timer_images_trigger = settings.ANIM_INTERACT_EXIT_SPEED
-        elif self.state == 'Interacting_With_Feedback':
-            self.timer_images_trigger = settings.ANIM_INTERACT_FEEDBACK_SPEED
-        elif self.state == 'Interacting_With_Help':
-            self.timer_images_trigger = settings.ANIM_INTERACT_HELP_SPEED
-        elif self.state == 'Interacting_With_Options':
-            self.timer_images_trigger = settings.ANIM_INTERACT_OPTIONS_SPEED
-        # TODO: Create/fix this
-        elif self.state == 'Inventory':
-            pass
-        elif self.state == 'Idle':
+        # The speed of each state comes from the animation table
+        frame_set = self.animations.get(self.state)
+        if frame_set is not None and frame_set.get_speed() is not None:
+            self.timer_images_trigger = frame_set.get_speed()
+        if self.state == 'Idle':
             # TODO: Make the idle animation slower if the endurance is closer to its maximum
             if self.trait_endurance < self.trait_endurance_max / 2:
                 # Slow down the speed by half of the current speed. We subtract to the timer because it'll take a
@@ -516,25 +342,18 @@ class Character(pygame.sprite.Sprite):
                 self.timer_images_trigger = settings.ANIM_IDLE_SPEED - (settings.ANIM_IDLE_SPEED / 2)
             elif self.trait_endurance == self.trait_endurance_max:
                 self.timer_images_trigger = settings.ANIM_IDLE_SPEED + (settings.ANIM_IDLE_SPEED / 2)
-            else:
-                self.timer_images_trigger = settings.ANIM_IDLE_SPEED
-        elif self.state == 'Running':
-            self.timer_images_trigger = settings.ANIM_RUNNING_SPEED
-        elif self.state == 'Walking':
-            self.timer_images_trigger = settings.ANIM_WALKING_SPEED
+        # Point at the frames facing the character's direction, they were flipped when they were loaded
+        self.images = self.frame_set.get_frames(self.direction)
         self.timer_images += 1
         # Change animation image
         if self.timer_images >= self.timer_images_trigger:
             # Make sure index isn't out of range
-            if self.image_index == len(self.images) - 1:
+            if self.image_index >= len(self.images) - 1:
                 self.image_index = 0
             else:
                 self.image_index += 1
             self.timer_images = 0
-        # Check direction and flip image if need be
         self.image = self.images[self.image_index]
-        if self.direction == 'Left':
-            self.image = pygame.transform.flip(self.image, True, False)
 
     def update(self):
         """
@@ -567,7 +386,9 @@ class Buff(object):
         self.active = True
         self.buff_time_length = 0
         self.debuff_time_length = 0
-        self.image = pygame.image.load('Bin/Sprites/Char_Base/Buff/Chamomile_Tea_96_Buff1.png').convert_alpha()
+        self.frames_buff = animations.FrameSet([])  # The buff's images facing both directions
+        self.frames_debuff = animations.FrameSet([])  # The debuff's images facing both directions
+        self.image = animations.library.load_image('Bin/Sprites/Char_Base/Buff/Chamomile_Tea_96_Buff1.png')
         self.image_rect = self.image.get_rect()
         self.image_timer = 0
         self.images_buff = []
@@ -663,10 +484,14 @@ class Buff(object):
             if self.name == buff:
                 print('[Debug - Info]: Initializing', self.name, 'images.')
                 buff = self.dict_buffs[buff]
-                # Set the appropriate images
-                for i in range(1, buff['Image Count']):
-                    self.images_buff.append(pygame.image.load(buff['Image Buff Location'] + str(i) + '.png').convert_alpha())
-                    self.images_debuff.append(pygame.image.load(buff['Image DeBuff Location'] + str(i) + '.png').convert_alpha())
+                # Set the appropriate images, the library only loads them the first time any buff asks for them
+                if buff['Image Count'] > 1:
+                    self.frames_buff = animations.library.load_frames(buff['Image Buff Location'],
+                                                                      buff['Image Count'] - 1)
+                    self.frames_debuff = animations.library.load_frames(buff['Image DeBuff Location'],
+                                                                        buff['Image Count'] - 1)
+                self.images_buff = list(self.frames_buff.frames_right)
+                self.images_debuff = list(self.frames_debuff.frames_right)
                 self.image = self.images_buff[self.index]
                 self.buff_time_length = buff['Buff Time Length']
                 self.debuff_time_length = buff['DeBuff Time Length']
@@ -799,9 +624,7 @@ class BuffHandler(object):
                         buff.index += 1
                     buff.image_timer = 0
                     # Push appropriate image after cleansing
-                    buff.image = buff.images_buff[buff.index]
-                    if self.character.direction == 'Left':
-                        buff.image = pygame.transform.flip(buff.image, True, False)
+                    buff.image = buff.frames_buff.get_frames(self.character.direction)[buff.index]
 
                 # Update image location and display
                 buff.image_rect = buff.image.get_rect()
@@ -824,9 +647,7 @@ class BuffHandler(object):
                         buff.index += 1
                         buff.image_timer = 0
                     # Push appropriate image after cleansing
-                    buff.image = buff.images_debuff[buff.index]
-                    if self.character.direction == 'Left':
-                        buff.image = pygame.transform.flip(buff.image, True, False)
+                    buff.image = buff.frames_debuff.get_frames(self.character.direction)[buff.index]
 
                 # Update image location and display
                 buff.image_rect = buff.image.get_rect()
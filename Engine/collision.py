@@ -0,0 +1,132 @@
+# The collision module that handles finding and resolving collisions against the tiles of a sub-level.
+# Tanner Fry
+# tefnq2@mst.edu
+import level
+import settings
+
+import array
+import pygame
+
+
+class CollisionLayer(object):
+    """
+    Class. Used to find the walls a rectangle touches by looking up only the few cells of the sub-level's tile grid
+    underneath it, instead of checking the rectangle against every wall in the sub-level. Walls are the sub-level's
+    tiles merged into large rectangles so there are fewer of them to resolve and no seams between tiles to catch on.
+    """
+    def __init__(self, sub_level=None, tile_size=settings.TILE_SIZE):
+        """
+        Constructor. Used to set up collisions against a sub-level.
+
+        @param sub_level: the sub-level whose tiles are walls, or None for no walls
+        @type sub_level: level.SubLevel
+        @param tile_size: the width and height of each tile
+        @type tile_size: int
+        """
+        self.cells = array.array('H')  # Cell -> index of the wall covering it plus one, 0 for no wall
+        self.revision = -1  # The revision of the sub-level's tiles the walls were made from
+        self.sub_level = sub_level
+        self.tile_size = tile_size
+        self.walls = []  # Every wall of the sub-level
+
+    def update(self):
+        """
+        A function to make the walls from the sub-level's merged rectangles if the tiles changed since they were made.
+
+        @return: none
+        @rtype: none
+        """
+        if self.revision == self.sub_level.revision:
+            return
+        tile_size = self.tile_size
+        self.cells = array.array('H', bytes(2 * level.TILES_WIDE * level.TILES_HIGH))
+        self.walls = []
+        for col, row, width, height in self.sub_level.get_rects():
+            self.walls.append(pygame.Rect(col * tile_size, row * tile_size, width * tile_size, height * tile_size))
+            wall_number = len(self.walls)
+            for row_wall in range(row, row + height):
+                index = row_wall * level.TILES_WIDE + col
+                self.cells[index:index + width] = array.array('H', [wall_number]) * width
+        self.revision = self.sub_level.revision
+
+    def query(self, rect: pygame.Rect):
+        """
+        A function to find the walls that a rectangle overlaps.
+
+        @param rect: the rectangle to check, such as a sprite's rect
+        @type rect: pygame.Rect
+        @return: the rect of every wall the rectangle overlaps
+        @rtype: list
+        """
+        if self.sub_level is None:
+            return []
+        self.update()
+        tile_size = self.tile_size
+        # Only the cells the rectangle covers, clipped to the grid since sprites can hang off the edge of the screen
+        col_start = max(rect.left // tile_size, 0)
+        col_end = min((rect.right - 1) // tile_size, level.TILES_WIDE - 1)
+        row_start = max(rect.top // tile_size, 0)
+        row_end = min((rect.bottom - 1) // tile_size, level.TILES_HIGH - 1)
+        cells = self.cells
+        wall_numbers = set()
+        for row in range(row_start, row_end + 1):
+            index = row * level.TILES_WIDE
+            wall_numbers.update(cells[index + col_start:index + col_end + 1])
+        wall_numbers.discard(0)
+        return [self.walls[wall_number - 1] for wall_number in sorted(wall_numbers)]
+
+
+def resolve_walls(entity: pygame.sprite.Sprite, walls: list, can_climb=False):
+    """
+    A function to push a character or npc out of the walls it overlaps and update whether it's falling or climbing.
+    Shared by everything that moves so they all collide with walls the same way. Each wall pushes the entity out the
+    way it overlaps the least, so landing on a wide floor and walking into the side of a tall wall are told apart by
+    how far the entity went into them rather than by which of the wall's points it touches.
+
+    @param entity: the character or npc, it needs a rect, falling, climbing, and y_velocity
+    @type entity: pygame.sprite.Sprite
+    @param walls: the rects of the walls the entity overlaps, see CollisionLayer.query()
+    @type walls: list
+    @param can_climb: whether the entity is trying to climb and is able to
+    @type can_climb: bool
+    @return: none
+    @rtype: none
+    """
+    landed = False  # Standing on any wall wins over sliding down the side of another
+    rect = entity.rect
+    for wall in walls:
+        if not rect.colliderect(wall):
+            # An earlier wall already pushed the entity out of this one
+            continue
+        overlap_top = rect.bottom - wall.top
+        overlap_bottom = wall.bottom - rect.top
+        overlap_left = rect.right - wall.left
+        overlap_right = wall.right - rect.left
+        overlap_vertical = min(overlap_top, overlap_bottom)
+        # Ties go to the top and bottom so walking across a floor never catches on its edge
+        if overlap_vertical <= min(overlap_left, overlap_right):
+            # Something falling can only have come from above, even if it went more than halfway through
+            if overlap_top <= overlap_bottom or entity.falling is True:
+                # Falling/walking onto a wall from above, left sunk by 1 so it keeps touching the floor
+                rect.bottom = wall.top + 1
+                landed = True
+            else:
+                # Hitting into a wall from below
+                entity.y_velocity = 0
+                rect.top = wall.bottom + 1
+                if entity.climbing is False and entity.falling is False:
+                    entity.falling = True
+        else:
+            if can_climb:
+                entity.climbing = True
+            else:
+                # Fall if climbing button is not pressed while against wall
+                entity.climbing = False
+                entity.falling = True
+            # Left overlapping by 1 so it keeps touching the wall it's climbing
+            if overlap_left <= overlap_right:
+                rect.right = wall.left + 1
+            else:
+                rect.left = wall.right - 1
+    if landed:
+        entity.falling = False
@@ -16,12 +16,11 @@ class CharacterHandler(object):
         # Displays current character animation on the screen frame by frame nicely
         prev_x = 50  # Start display pos
         prev_y = 100  # Start display pos
+        # The character's images already face the direction the character is facing
         for image in self.character.images:
             rect = image.get_rect()
             rect.x = prev_x
             rect.y = prev_y
 
             prev_x += 96
-            if self.character.direction == 'Left':
-                image = pygame.transform.flip(image, True, False)
             self.engine.screen.blit(image, rect)
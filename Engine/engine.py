@@ -2,31 +2,48 @@
 # Tanner Fry
 # tefnq2@mst.edu
 import character
+import collision
 import devLib
 import engineLib
+import inputs
+import level
+import loop
 import npc
+import physics
+import render
+import saves
 import settings
+import settings_store
 
 import importlib
 import logging
 import os
 import pygame
+import random
+import sys
+import time
 from pygame.locals import *
 
 
 class Game:
     """Class. Used to handle the creation, modification, and deletion of all game assets."""
 
-    def __init__(self):
+    def __init__(self, headless=False):
         """
         Constructor. Used to initialize all handlers, timers, and other variables for the game to function properly.
+
+        @param headless: whether the game is only simulated, without a window or drawing, see run_headless()
+        @type headless: bool
         """
         # Initialize the game engine with necessary variables
+        self.autosave = object  # Saves the game in the background, see saves.AutosaveService
         self.buff_handler = object  # The handler for the main character's buffs and debuffs
         self.character = pygame.sprite.Sprite  # The main character that the player will use
-        self.clock = pygame.time.Clock()  # The frames per second
-        self.clock.tick(settings.FPS)
+        self.collision_layer = collision.CollisionLayer()  # Finds the walls of the current sub-level under a rect
         self.engine_handler = engineLib.EngineHandler(self)
+        self.file_input_record = None  # Where to save the inputs of the next game, or None to not record them
+        self.headless = headless  # Whether the game is only simulated, without a window or drawing
+        self.inputs = inputs.GameInput()  # The keys, mouse, and events of every tick, live or from a recording
         self.level_current = 1
         self.level_directions = ''  # The directions that the character can go to get to adjacent levels
         self.level_directions_down = 'None'  # The level number of the level below the current level
@@ -35,22 +52,30 @@ class Game:
         self.level_directions_up = 'None'  # The level number of the level above the current level
         self.level_matrix = []  # A 2-d matrix representing a 'map' of the level each position is a sub-level
         self.level_matrix_location = [0, 0]  # The character's current location in the level matrix
+        # The level and sub-level to start in with a fresh character, instead of where the save left off, for games
+        # that have to start the same way every time, or None to continue the save
+        self.level_start = None
         self.level_sub_current = 1
         self.level_sub_current_total = 0  # The number of total sub-levels in the current level
         self.level_sub_total = 0  # The number of total sub-levels
+        self.level_tiles = object  # The tile grids of every sub-level of the current level
         self.level_total = settings.TOTAL_LEVELS
+        self.loop_scheduler = loop.LoopScheduler()  # Runs the game at a fixed tick rate and limits the frames
+        self.level_surface_cache = render.LevelSurfaceCache(self)  # Pre-baked tiles of each sub-level
         self.popups = []
+        self.renderer = None  # Draws only the parts of the screen that changed, made with the screen in game_setup()
         self.running = False
+        self.save_file = object  # The save being played, see saves.SaveFile
         self.screen = pygame.Surface
+        self.seed = None  # The seed of everything random, only set when the game is recorded or replayed
         self.sprites_important = pygame.sprite.Group()
-        self.sprites_active_walls = pygame.sprite.Group()
-        self.sprites_walls = pygame.sprite.Group()
+        self.sprite_interpolator = loop.SpriteInterpolator()  # Smooths sprite movement between ticks
+        self.sprites_active_walls = pygame.sprite.Group()  # The walls of the current sub-level as sprites
         self.state = 'Play'
-        self.texts_to_display = []
         self.window = pygame.Surface
 
         # Initialize environment assets
-        self.type_tiles = {}  # Used to correlate in game environment assets to specific images
+        self.tileset = object  # Used to correlate the tile ids of the level grids to specific images
 
         # Initialize government assets (In tab order)
         self.img_gov_leader_selected = pygame.Surface
@@ -78,7 +103,11 @@ class Game:
         self.img_inv_exit_selected = pygame.Surface
         self.img_inv_exit_selected_rect = pygame.Rect
 
+        # Initialize inventory
+        self.inventory = object  # Draws the inventory and finds which tab or slot was clicked
+
         # Initialize npc assets
+        self.npc_handler = object  # Keeps the npc load usable and simulates the crowds of simple npcs
         self.npc_squishy = object
 
     def game_new(self, file_save_name: str, character_name='None'):
@@ -91,163 +120,153 @@ class Game:
         @rtype: none
         """
         try:
-            # Initialize assets for new game
-            pygame.display.set_caption(settings.TITLE_GAME)
-            self.screen = pygame.Surface((settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT))
-            self.window = pygame.display.set_mode((self.engine_handler.gather_engine_info(self, 'calculate_window')), DOUBLEBUF)
-            # NOTE: Reimport all libraries for easier code change and testing
-            importlib.reload(engineLib)
-            self.engine_handler.reimport_all()
-            self.engine_handler.init_finish()
-
-            # Gather information
-            self.engine_handler.gather_engine_info(self, 'get_levels')
-
-            # Generate new settings file for the character to use, whether from defaults or the character save
-            if character_name != 'None':
-                self.engine_handler.save_new_game(character_name, file_save_name)
+            if self.file_input_record is not None:
+                # Everything random has to turn out the same when the recording is replayed
+                self.seed = random.randrange(2 ** 32)
+                # A replay starts from the start of the first level, so the recording has to start there too
+                self.level_start = (1, 1)
             else:
-                self.engine_handler.load_saved_game(file_save_name)
-                character_name = settings.CHAR_NAME
-
-            # Initialize all environment assets for new game
-            # NOTE: these assets had to be initialized early due to performance issues
-            environment_spritesheet = engineLib.SpriteSheet(settings.DIR_SPRITES_GAME_ENVI
-                                                            + '/Ground_Grass_384_432_Spritesheet.png')
-            self.type_tiles = {'GL0': environment_spritesheet.get_image(0, 0, 32, 32),
-                               'GL1': environment_spritesheet.get_image(0, 32, 32, 32),
-                               'GL2': environment_spritesheet.get_image(0, 64, 32, 32),
-                               'GL3': environment_spritesheet.get_image(0, 96, 32, 32),
-                               'GL4': environment_spritesheet.get_image(0, 128, 32, 32),
-                               'GL5': environment_spritesheet.get_image(0, 160, 32, 32),
-                               'GL6': environment_spritesheet.get_image(0, 192, 32, 32),
-                               'GM0': environment_spritesheet.get_image(32, 32, 32, 32),
-                               'GM1': environment_spritesheet.get_image(64, 32, 32, 32),
-                               'GM2': environment_spritesheet.get_image(96, 32, 32, 32),
-                               'GM3': environment_spritesheet.get_image(128, 32, 32, 32),
-                               'GM4': environment_spritesheet.get_image(160, 32, 32, 32),
-                               'GM5': environment_spritesheet.get_image(192, 32, 32, 32),
-                               'GM6': environment_spritesheet.get_image(224, 32, 32, 32),
-                               'GT0': environment_spritesheet.get_image(32, 0, 32, 32),
-                               'GT1': environment_spritesheet.get_image(64, 0, 32, 32),
-                               'GT2': environment_spritesheet.get_image(96, 0, 32, 32),
-                               'GT3': environment_spritesheet.get_image(128, 0, 32, 32),
-                               'GT4': environment_spritesheet.get_image(160, 0, 32, 32),
-                               'GT5': environment_spritesheet.get_image(192, 0, 32, 32),
-                               'GT6': environment_spritesheet.get_image(224, 0, 32, 32),
-                               'GR0': environment_spritesheet.get_image(256, 0, 32, 32),
-                               'GR1': environment_spritesheet.get_image(256, 32, 32, 32),
-                               'GR2': environment_spritesheet.get_image(256, 64, 32, 32),
-                               'GR3': environment_spritesheet.get_image(256, 96, 32, 32),
-                               'GR4': environment_spritesheet.get_image(256, 128, 32, 32),
-                               'GR5': environment_spritesheet.get_image(256, 160, 32, 32),
-                               'GR6': environment_spritesheet.get_image(256, 192, 32, 32),
-                               'HL0': environment_spritesheet.get_image(96, 240, 32, 32),
-                               'HL1': environment_spritesheet.get_image(96, 272, 32, 32),
-                               'HL2': environment_spritesheet.get_image(96, 304, 32, 32),
-                               'HL3': environment_spritesheet.get_image(96, 336, 32, 32),
-                               'HL4': environment_spritesheet.get_image(96, 368, 32, 32),
-                               'HL5': environment_spritesheet.get_image(96, 400, 32, 32),
-                               'HT0': environment_spritesheet.get_image(0, 336, 32, 32),
-                               'HT1': environment_spritesheet.get_image(32, 336, 32, 32),
-                               'HT2': environment_spritesheet.get_image(64, 336, 32, 32),
-                               'HT3': environment_spritesheet.get_image(128, 240, 32, 32),
-                               'HT4': environment_spritesheet.get_image(160, 240, 32, 32),
-                               'HT5': environment_spritesheet.get_image(224, 240, 32, 32),
-                               'HT6': environment_spritesheet.get_image(288, 336, 32, 32),
-                               'HT7': environment_spritesheet.get_image(320, 336, 32, 32),
-                               'HT8': environment_spritesheet.get_image(352, 336, 32, 32),
-                               'HR0': environment_spritesheet.get_image(256, 240, 32, 32),
-                               'HR1': environment_spritesheet.get_image(256, 272, 32, 32),
-                               'HR2': environment_spritesheet.get_image(256, 304, 32, 32),
-                               'HR3': environment_spritesheet.get_image(256, 336, 32, 32),
-                               'HR4': environment_spritesheet.get_image(352, 368, 32, 32),
-                               'HR5': environment_spritesheet.get_image(352, 400, 32, 32)}
-
-            try:
-                # Initialize all sprites within each sub-level that's within current selected level
-                for i in range(1, self.level_sub_total - 1):  # TODO: Fix this hard code pos
-                    row_current = 0
-                    path_to_level = 'Levels/Level_' + str(self.level_current) \
-                                    + '/Sub_Level_' + str(i) \
-                                    + '.txt'
-                    # Generate the new level across the screen
-                    try:
-                        with open(path_to_level, 'r') as file:
-                            for line in file:
-                                col_current = 0
-                                data_from_file = line.split(' ')
-                                for data in data_from_file:
-                                    self.engine_handler.generate_level_walls(self, data, col_current,
-                                                                             True, row_current, i)
-                                    col_current += 1
-                                row_current += 1
-                    except FileNotFoundError:
-                        logging.error('* Error - File not found within the current level: %s %s.',
-                                      self.level_current, i)
-            except Exception:
-                logging.error('* Error - Unexpected.')
-
-
-            # Initialize the character and other character assets for new game
-            self.character = character.Character(character_name, file_save_name, self,  settings.SCREEN_WIDTH / 2,
-                                                 settings.SCREEN_HEIGHT / 2)
-            # NOTE: Test npc, will end up using a general platform for npc and assign personalities to them
-            # NOTE: so they can give specific outcomes based on the given personality
-            self.npc_squishy = npc.NPCSquishy('npc_squishy', self, settings.SCREEN_WIDTH / 1.5, settings.SCREEN_HEIGHT / 2)
-            self.buff_handler = character.BuffHandler(self.character, self.screen)
-
-            # Initialize UI images for new game
-            # Inventory system
-            img_dir = settings.DIR_SPRITES_UI + '/Inventory'
-            self.img_inv_inv_base = pygame.image.load(img_dir + '/Inventory_Base.png').convert_alpha()
-            self.img_inv_inv_base_rect = self.img_inv_inv_base.get_rect()
-            self.img_inv_inv_selected = pygame.image.load(img_dir + '/Inventory_Selected.png').convert_alpha()
-            self.img_inv_inv_selected_rect = self.img_inv_inv_selected.get_rect()
-            self.img_inv_saves_selected = pygame.image.load(img_dir + '/Saves_Selected.png').convert_alpha()
-            self.img_inv_saves_selected_rect = self.img_inv_saves_selected.get_rect()
-            self.img_inv_opt_selected = pygame.image.load(img_dir + '/Options_Selected.png').convert_alpha()
-            self.img_inv_opt_selected_rect = self.img_inv_opt_selected.get_rect()
-            self.img_inv_feed_selected = pygame.image.load(img_dir + '/Feedback_Selected.png').convert_alpha()
-            self.img_inv_feed_selected_rect = self.img_inv_feed_selected.get_rect()
-            self.img_inv_exit_selected = pygame.image.load(img_dir + '/Exit_Selected.png').convert_alpha()
-            self.img_inv_exit_selected_rect = self.img_inv_exit_selected.get_rect()
-            # Government management
-            img_dir = settings.DIR_SPRITES_UI + '/Government_Management'
-            img_dir_menu = img_dir + '/Main_Menu'
-            img_dir_judge = img_dir + '/Judge'
-            self.img_gov_menu = pygame.image.load(img_dir + '/Main_Menu/Gov_Base.png').convert_alpha()
-            self.img_gov_menu_rect = self.img_gov_menu.get_rect()
-            # Government leader assets
-            self.img_gov_leader_selected = pygame.image.load(img_dir_menu + '/Gov_Leader_Selected.png').convert_alpha()
-            self.img_gov_leader_selected_rect = self.img_gov_leader_selected.get_rect()
-            # Government party assets
-            self.img_gov_party_selected = pygame.image.load(img_dir_menu + '/Gov_Party_Selected.png').convert_alpha()
-            self.img_gov_party_selected_rect = self.img_gov_party_selected.get_rect()
-            # Government judge assets
-            self.img_gov_judge_selected = pygame.image.load(img_dir_menu + '/Gov_Judge_Selected.png').convert_alpha()
-            self.img_gov_judge_selected_rect = self.img_gov_judge_selected.get_rect()
-            # Government info assets
-            self.img_gov_info_selected = pygame.image.load(img_dir_menu + '/Gov_Information_Selected.png').convert_alpha()
-            self.img_gov_info_selected_rect = self.img_gov_info_selected.get_rect()
-            # Government map assets
-            self.img_gov_map_selected = pygame.image.load(img_dir_menu + '/Gov_Map_Selected.png').convert_alpha()
-            self.img_gov_map_selected_rect = self.img_gov_map_selected.get_rect()
-
-            # Generate assets and start the game
-            print(self.level_sub_current)
-            for sprite in self.sprites_walls:
-
-                    if sprite.level_sub == self.level_sub_current:
-                        sprite.add(self.sprites_active_walls)
-
-            # self.level_matrix.lvl = self.engine_handler.generate_level_matrix(self.engine_main)
-            self.engine_handler.generate_level_matrix(self)
+                self.level_start = None
+            self.game_setup(file_save_name, character_name)
+            if self.file_input_record is not None:
+                # A new character was saved by the setup so a replay loads the save like any other
+                self.inputs.record(inputs.InputRecording(file_save_name, self.level_current, self.level_sub_current,
+                                                         self.seed))
             self.running = True
             self.game_run()
+            # Save where the game was left off, unless it didn't continue the save
+            self.autosave.close(self if self.level_start is None else None)
+            self.level_tiles.close()
+            self.engine_handler.reload_default_settings()
+            if self.inputs.mode == 'Record':
+                self.inputs.stop().save(self.file_input_record)
+                self.seed = None
         except Exception:
             logging.error('* Error - Unexpected.')
 
+    def game_setup(self, file_save_name: str, character_name='None'):
+        """
+        The main function to load a save and the current level and set up every game asset, without starting the game
+        loop.
+
+        @param file_save_name: the name of the file to use for the engine to start up
+        @param character_name: the name of the new character that the user customized
+        @return: none
+        @rtype: none
+        """
+        # Initialize assets for new game
+        if self.seed is not None:
+            random.seed(self.seed)
+        pygame.display.set_caption(settings.TITLE_GAME)
+        self.screen = render.DirtySurface((settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT))
+        if self.headless is True:
+            # Nothing is shown or scaled, the display only has to exist for images to be converted
+            self.window = pygame.display.set_mode((settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT))
+        else:
+            self.window = pygame.display.set_mode((self.engine_handler.gather_engine_info(self, 'calculate_window')),
+                                                  DOUBLEBUF)
+        self.renderer = render.DirtyRectRenderer(self.screen)
+        # NOTE: Reimport all libraries for easier code change and testing
+        importlib.reload(engineLib)
+        self.engine_handler.reimport_all()
+        self.engine_handler.init_finish()
+
+        # Gather information
+        self.engine_handler.gather_engine_info(self, 'get_levels')
+
+        # Generate new settings file for the character to use, whether from defaults or the character save
+        if character_name != 'None':
+            self.save_file = self.engine_handler.save_new_game(character_name, file_save_name)
+        else:
+            self.save_file = self.engine_handler.load_saved_game(file_save_name)
+            character_name = settings.CHAR_NAME
+        if self.level_start is None:
+            saves.apply_position(self, self.save_file.state)
+        else:
+            self.level_current, self.level_sub_current = self.level_start
+        # A game that doesn't continue the save doesn't save over it
+        self.autosave = saves.AutosaveService(self.save_file, settings.SAVE_AUTOSAVE_INTERVAL
+                                              if self.level_start is None else None)
+
+        # Initialize all environment assets for new game
+        # NOTE: these assets had to be initialized early due to performance issues
+        self.level_surface_cache.invalidate()
+        # The tile codes and where they are on the sprite sheet are shared with the tile editor
+        tileset_manifest = engineLib.load_tileset(settings.FILE_TILESET)
+        environment_spritesheet = engineLib.SpriteSheet(settings.DIR_SPRITES_GAME_ENVI + '/'
+                                                        + tileset_manifest['sheet'], tileset_manifest['colorkey'])
+        self.tileset = level.Tileset(tileset_manifest, environment_spritesheet.get_tiles(tileset_manifest))
+
+        # Open the current level, from the compiled level when there is one. Sub-levels are only loaded when
+        # they're needed, the ones next to the current sub-level are loaded ahead of time in the background
+        self.level_tiles = level.load_level(self.level_current, self.tileset)
+
+        # Initialize the character and other character assets for new game
+        self.character = character.Character(character_name, file_save_name, self,  settings.SCREEN_WIDTH / 2,
+                                             settings.SCREEN_HEIGHT / 2)
+        if self.level_start is None:
+            # Put the character, and the tiles changed in the level, back where the save left them
+            saves.apply_state(self, self.save_file.state)
+        # NOTE: Test npc, will end up using a general platform for npc and assign personalities to them
+        # NOTE: so they can give specific outcomes based on the given personality
+        self.npc_squishy = npc.NPCSquishy('npc_squishy', self, settings.SCREEN_WIDTH / 1.5, settings.SCREEN_HEIGHT / 2)
+        self.npc_handler = npc.NPCHandler(self)
+        self.npc_handler.active_npcs.append(self.npc_squishy)
+        if settings.NPC_CROWD_SIZE > 0:
+            # Crowds away from the current sub-level start frozen, they land and wander when they're reached
+            for level_sub in self.level_tiles.get_graph().positions:
+                self.npc_handler.spawn_crowd(level_sub, settings.NPC_CROWD_SIZE)
+        self.buff_handler = character.BuffHandler(self.character, self.screen)
+
+        # Initialize UI images for new game
+        # Inventory system
+        img_dir = settings.DIR_SPRITES_UI + '/Inventory'
+        self.img_inv_inv_base = pygame.image.load(img_dir + '/Inventory_Base.png').convert_alpha()
+        self.img_inv_inv_base_rect = self.img_inv_inv_base.get_rect()
+        self.img_inv_inv_selected = pygame.image.load(img_dir + '/Inventory_Selected.png').convert_alpha()
+        self.img_inv_inv_selected_rect = self.img_inv_inv_selected.get_rect()
+        self.img_inv_saves_selected = pygame.image.load(img_dir + '/Saves_Selected.png').convert_alpha()
+        self.img_inv_saves_selected_rect = self.img_inv_saves_selected.get_rect()
+        self.img_inv_opt_selected = pygame.image.load(img_dir + '/Options_Selected.png').convert_alpha()
+        self.img_inv_opt_selected_rect = self.img_inv_opt_selected.get_rect()
+        self.img_inv_feed_selected = pygame.image.load(img_dir + '/Feedback_Selected.png').convert_alpha()
+        self.img_inv_feed_selected_rect = self.img_inv_feed_selected.get_rect()
+        self.img_inv_exit_selected = pygame.image.load(img_dir + '/Exit_Selected.png').convert_alpha()
+        self.img_inv_exit_selected_rect = self.img_inv_exit_selected.get_rect()
+        self.inventory = engineLib.GameInventory(self)
+        # Government management
+        img_dir = settings.DIR_SPRITES_UI + '/Government_Management'
+        img_dir_menu = img_dir + '/Main_Menu'
+        img_dir_judge = img_dir + '/Judge'
+        self.img_gov_menu = pygame.image.load(img_dir + '/Main_Menu/Gov_Base.png').convert_alpha()
+        self.img_gov_menu_rect = self.img_gov_menu.get_rect()
+        # Government leader assets
+        self.img_gov_leader_selected = pygame.image.load(img_dir_menu + '/Gov_Leader_Selected.png').convert_alpha()
+        self.img_gov_leader_selected_rect = self.img_gov_leader_selected.get_rect()
+        # Government party assets
+        self.img_gov_party_selected = pygame.image.load(img_dir_menu + '/Gov_Party_Selected.png').convert_alpha()
+        self.img_gov_party_selected_rect = self.img_gov_party_selected.get_rect()
+        # Government judge assets
+        self.img_gov_judge_selected = pygame.image.load(img_dir_menu + '/Gov_Judge_Selected.png').convert_alpha()
+        self.img_gov_judge_selected_rect = self.img_gov_judge_selected.get_rect()
+        # Government info assets
+        self.img_gov_info_selected = pygame.image.load(img_dir_menu + '/Gov_Information_Selected.png').convert_alpha()
+        self.img_gov_info_selected_rect = self.img_gov_info_selected.get_rect()
+        # Government map assets
+        self.img_gov_map_selected = pygame.image.load(img_dir_menu + '/Gov_Map_Selected.png').convert_alpha()
+        self.img_gov_map_selected_rect = self.img_gov_map_selected.get_rect()
+
+        # Generate assets and start the game
+        print(self.level_sub_current)
+        # Only the current sub-level's walls are made into sprites, for collisions
+        self.sprites_active_walls = self.level_tiles.get_sprites(self.level_sub_current)
+        self.collision_layer = collision.CollisionLayer(self.level_tiles.get_sub_level(self.level_sub_current))
+        if self.headless is False:
+            self.level_surface_cache.get_surface(self.level_sub_current)
+
+        # self.level_matrix.lvl = self.engine_handler.generate_level_matrix(self.engine_main)
+        self.engine_handler.generate_level_matrix(self)
+
     def game_run(self):
         """
         The main function to run the game loop.
@@ -256,25 +275,62 @@ class Game:
         @rtype: str
         """
         try:
+            # Don't let the time spent loading be simulated as soon as the game starts
+            self.loop_scheduler.reset()
             while self.running:
                 if self.engine_handler.state == 'Game_Run':
-                    self.game_events()
-                    self.game_update()
-                    self.game_draw()
+                    self.loop_scheduler.run_frame(self.game_tick, self.game_draw, self.game_frame)
                 # TODO: The game might need to be paused while in inventory as it
                 # CONT: might be too resource intensive or handle other game objects
                 # CONT: while in the inventory
                 elif self.engine_handler.state == 'Game_Inventory':
-                    self.game_events()
-                    self.game_update()
-                    self.game_draw()
+                    self.loop_scheduler.run_frame(self.game_tick, self.game_draw, self.game_frame)
                 elif self.engine_handler.state == 'Game_Government_Management':
-                    self.game_events()
-                    self.game_update()
-                    self.game_draw()
+                    self.loop_scheduler.run_frame(self.game_tick, self.game_draw, self.game_frame)
         except Exception:
             logging.error('* Error - Unexpected.')
 
+    def game_frame(self):
+        """
+        The main function to start a frame, once before all of the frame's ticks.
+
+        @return: none
+        @rtype: none
+        """
+        self.npc_handler.start_frame()
+
+    def game_tick(self):
+        """
+        The main function to advance the game by exactly one fixed tick. Everything that moves or counts frames has to
+        happen in here so the game runs at the same speed on every computer.
+
+        @return: none
+        @rtype: none
+        """
+        self.sprite_interpolator.snapshot(self.sprites_important)
+        self.game_events()
+        self.game_update()
+        # The tick is done, so the game is in one piece for a snapshot
+        self.autosave.update(self)
+        settings_store.store.update()
+
+    def game_step(self, ticks: int):
+        """
+        The main function to advance the game by a number of ticks as fast as possible, with nothing drawn in between.
+
+        @param ticks: the number of ticks to simulate
+        @type ticks: int
+        @return: the number of ticks simulated, fewer if the game stopped running
+        @rtype: int
+        """
+        for tick in range(ticks):
+            if self.running is False:
+                return tick
+            # Nothing is drawn, so every tick is a frame of its own
+            self.game_frame()
+            self.game_tick()
+        return ticks
+
     def game_events(self):
         """
         The main function to handle events in the game.
@@ -284,10 +340,11 @@ class Game:
         """
         try:
             # Handle events for the character, popups, buttons, other sprites,
-            for event in pygame.event.get():
+            self.inputs.poll()
+            for event in self.inputs.events:
                 self.engine_handler.handle_events(self, event, self.character,
                                                   self.sprites_important,
-                                                  self.sprites_walls)
+                                                  self.sprites_active_walls)
 
             # Handle movements of the character
             self.character.handle_keys()
@@ -297,13 +354,11 @@ class Game:
 
             # Update map if switching levels or sublevels
             if self.engine_handler.screen_switch is True:
-                # Remove the now old sprites from the group to display
-                for sprite in self.sprites_active_walls:
-                    sprite.remove(self.sprites_active_walls)
-                # Figure out which sprites to display
-                for sprite in self.sprites_walls:
-                    if sprite.level_sub == self.level_sub_current:
-                        sprite.add(self.sprites_active_walls)
+                # Each sub-level keeps its own group of walls, so switching is swapping which group is active
+                self.sprites_active_walls = self.level_tiles.get_sprites(self.level_sub_current)
+                self.collision_layer = collision.CollisionLayer(self.level_tiles.get_sub_level(self.level_sub_current))
+                if self.headless is False:
+                    self.level_surface_cache.get_surface(self.level_sub_current)
                 self.engine_handler.generate_level_directions()
                 self.engine_handler.screen_switch = False
         except Exception:
@@ -317,8 +372,11 @@ class Game:
         @rtype: none
         """
         try:
-            # Check extra sprite information to update
+            # Move everything at once, then check extra sprite information to update
+            physics.step(self.sprites_important)
             self.sprites_important.update()
+            # Crowds move, collide, and animate all at once
+            self.npc_handler.handler_cycle()
             # Check popups for purging
             if len(self.popups) > 0:
                 new_popups = []
@@ -331,10 +389,12 @@ class Game:
         except Exception:
             logging.error('* Error - Unexpected.')
 
-    def game_draw(self):
+    def game_draw(self, alpha=1.0):
         """
         The main function to draw all of the information, old or new.
 
+        @param alpha: how far, from 0 to 1, the frame is between the last two ticks, used to smooth movement
+        @type alpha: float
         @return: none
         @rtype: none
         """
@@ -346,12 +406,29 @@ class Game:
             # Draw background
 
             # Draw level
-            self.screen.fill(settings.DARK_GRAY)
+            if settings.RENDER_DIRTY_RECTS is True:
+                # Only the areas drawn over last frame are restored, from a background that already has the walls
+                self.renderer.begin_frame(self.level_surface_cache.get_background(self.level_sub_current))
+            else:
+                self.screen.fill(settings.DARK_GRAY)
             # self.game_draw_grid()
 
             # Draw characters, objects, and walls
+            self.sprite_interpolator.apply(self.sprites_important, alpha)
             self.sprites_important.draw(self.screen)
-            self.sprites_active_walls.draw(self.screen)
+            crowd_areas = self.npc_handler.draw(self.screen, alpha)
+            # NOTE: Walls never move so they are baked into one surface when their sub-level becomes active
+            if settings.RENDER_DIRTY_RECTS is True:
+                # Walls are drawn in front of sprites so only redraw them where a sprite was just drawn
+                level_surface = self.level_surface_cache.get_surface(self.level_sub_current)
+                for sprite in self.sprites_important:
+                    sprite_area = pygame.Rect(sprite.rect.topleft, sprite.image.get_size())
+                    self.screen.blit(level_surface, sprite_area, sprite_area)
+                for crowd_area in crowd_areas:
+                    self.screen.blit(level_surface, crowd_area, crowd_area)
+            else:
+                self.level_surface_cache.draw(self.screen, self.level_sub_current)
+            self.sprite_interpolator.restore()
             # Draw other things in front of the character or on top of
 
             # Draw character effects
@@ -373,96 +450,8 @@ class Game:
             # Draw inventory system
             # TODO: FINISH INVENTORY MOCK UP
             if self.engine_handler.state == 'Game_Inventory':
-                # Cycle #
-                #########
-                # 1. move all image types to their location
-                # 2. determine which to display based on user interaction with text
-                # 3. draw inventory slots, then items
-                # TODO: Create a list of these to loop through to change their
-                # CONT: values? Create list where the imgs are initialized maybe?
-                self.img_inv_inv_base_rect.x = self.character.rect.x + self.character.rect.width / 2 - 245
-                self.img_inv_inv_base_rect.y = 45
-                self.img_inv_inv_selected_rect.x = self.character.rect.x + self.character.rect.width / 2 - 245
-                self.img_inv_inv_selected_rect.y = 45
-                self.img_inv_saves_selected_rect.x = self.character.rect.x + self.character.rect.width / 2 - 245
-                self.img_inv_saves_selected_rect.y = 45
-                self.img_inv_opt_selected_rect.x = self.character.rect.x + self.character.rect.width / 2 - 245
-                self.img_inv_opt_selected_rect.y = 45
-                self.img_inv_feed_selected_rect.x = self.character.rect.x + self.character.rect.width / 2 - 245
-                self.img_inv_feed_selected_rect.y = 45
-                self.img_inv_exit_selected_rect.x = self.character.rect.x + self.character.rect.width / 2 - 245
-                self.img_inv_exit_selected_rect.y = 45
-                # Display inventory background animation based on the state; interaction with inventory
-                if self.engine_handler.state_inventory == 'Base':
-                    self.screen.blit(self.img_inv_inv_base, self.img_inv_inv_base_rect)
-                elif self.engine_handler.state_inventory == 'Inventory':
-                    self.screen.blit(self.img_inv_inv_selected, self.img_inv_inv_selected_rect)
-                elif self.engine_handler.state_inventory == 'Saves':
-                    self.screen.blit(self.img_inv_saves_selected, self.img_inv_saves_selected_rect)
-                elif self.engine_handler.state_inventory == 'Options':
-                    self.screen.blit(self.img_inv_opt_selected, self.img_inv_opt_selected_rect)
-                elif self.engine_handler.state_inventory == 'Feedback':
-                    self.screen.blit(self.img_inv_feed_selected, self.img_inv_feed_selected_rect)
-                elif self.engine_handler.state_inventory == 'Exit':
-                    self.screen.blit(self.img_inv_exit_selected, self.img_inv_exit_selected_rect)
-                # TODO: Recode somewhere so we aren't constantly creating new text
-                # TODO: every frame
-                tab_selected = 'Inventory'
-                tab_size = 18
-                tab_y = 93
-                text_color = settings.BLACK
-                text_selected = engineLib.GameText('Title', tab_selected, 26, text_color, self.character.rect.x
-                                                   + self.character.rect.width / 2 - 59, 48, True, False)
-                text_inventory = engineLib.GameText('Tab_Inventory', 'Inventory', tab_size, text_color,
-                                                    self.character.rect.x + self.character.rect.width / 2 - 221,
-                                                    tab_y, True, False)
-                text_saves = engineLib.GameText('Tab_Saves', 'Saves', tab_size, text_color, self.character.rect.x
-                                                + self.character.rect.width / 2 - 110, tab_y, True, False)
-                text_options = engineLib.GameText('Tab_Options', 'Options', tab_size, text_color,
-                                                  self.character.rect.x + self.character.rect.width / 2 - 25,
-                                                  tab_y, True, False)
-                text_feedback = engineLib.GameText('Tab_Feedback', 'Feedback', tab_size, text_color,
-                                                   self.character.rect.x + self.character.rect.width / 2 + 82,
-                                                   tab_y, True, False)
-                text_exit = engineLib.GameText('Tab_Exit', 'Exit', tab_size, text_color, self.character.rect.x
-                                               + self.character.rect.width / 2 + 195, tab_y, True, False)
-                self.texts_to_display = [text_selected, text_inventory, text_saves, text_options, text_feedback, text_exit]
-                # Display text
-                for text in self.texts_to_display:
-                    text.draw(self.screen)
-                # Draw inventory slots
-                x_start = self.character.rect.x + self.character.rect.width / 2 - 240
-                y_start = 140
-                buffer_x = 10.5
-                buffer_y = 10.5
-                for i in range(12):  # number of slots for items
-                    x_spacing = (i * 32) + buffer_x
-                    for j in range(5):
-                        y_spacing = (j * 32) + buffer_y
-                        pygame.draw.lines(self.screen, settings.DARK_GRAY, True,
-                                          ((x_start + x_spacing, y_start + y_spacing),
-                                           (x_start + x_spacing, y_start + y_spacing + 32),
-                                           (x_start + x_spacing + 32, y_start + y_spacing + 32),
-                                           (x_start + x_spacing + 32, y_start + y_spacing)))
-                        buffer_y += 7.5
-                    buffer_y = 10.5
-                    buffer_x += 7.5
-                buffer_x = 12
-                buffer_y = 10.5
-                item_count = 0
-                # Display inventory items
-                # TODO: Should there be a loaded dict for the inventory items so it's faster with the imgs ready? yaaa
-                # TODO: Change the loop to account for x amt of items that would push the next item to the second level in
-                # CONT: the inventory system.
-                for item in settings.CHAR_INVENTORY:
-                    img = pygame.image.load(settings.DIR_SPRITES_GAME_INV + '/' + str(item) + '.png').convert_alpha()
-                    img_rect = img.get_rect()
-                    x_spacing = (item_count * 32) + buffer_x
-                    y_spacing = (item_count * 0 * 32) + buffer_y
-                    img_rect.x, img_rect.y = (x_start + x_spacing), (y_start + y_spacing)
-                    self.screen.blit(img, img_rect)
-                    buffer_x += 7.5
-                    item_count += 1
+                # The panel is only put back together when the selected tab or the items change
+                self.inventory.draw(self.screen)
             elif self.engine_handler.state == 'Game_Government_Management':
                 # TODO: init assets based on user interaction
                 # TODO: display assets based on handled events
@@ -492,11 +481,14 @@ class Game:
             # Display important popups
             for popup in self.popups:
                 popup.draw(self.screen)
-            # Scale screen to the size of user's specified resolution
-            # TODO: This line is causing issues regarding the updating of resolutions and other settings
-            pygame.transform.scale(self.screen, (settings.WINDOW_WIDTH, settings.WINDOW_HEIGHT), self.window)
-            # Pygame draws everything that has been sent to it's display which is represented by self.screen
-            pygame.display.flip()
+            if settings.RENDER_DIRTY_RECTS is True:
+                self.renderer.end_frame()
+            else:
+                # Scale screen to the size of user's specified resolution
+                # TODO: This line is causing issues regarding the updating of resolutions and other settings
+                pygame.transform.scale(self.screen, (settings.WINDOW_WIDTH, settings.WINDOW_HEIGHT), self.window)
+                # Pygame draws everything that has been sent to it's display which is represented by self.screen
+                pygame.display.flip()
         except Exception:
             logging.error('* Error - Unexpected.')
 
@@ -513,19 +505,22 @@ class MainMenu:
         """
         # Initialize the menu with the necessities
         pygame.display.set_caption(settings.TITLE_GAME)
-        self.clock = pygame.time.Clock()
-        self.clock.tick(30)
         self.engine_game = engine_game
         self.engine_handler = engineLib.EngineHandler(engine_game)  # Atm pretty useless in menu
         self.menu_handler = engineLib.MenuHandler(self)
+        self.loop_scheduler = loop.LoopScheduler()  # Runs the menu at a fixed tick rate and limits the frames
         self.running = True
         self.sprites_all = pygame.sprite.Group()
+        self.sprite_interpolator = loop.SpriteInterpolator()  # Smooths sprite movement between ticks
         self.state = 'Main'
 
         # Initializing screen
-        self.screen = pygame.Surface((settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT))
+        self.screen = render.DirtySurface((settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT))
         self.window = pygame.display.set_mode((self.engine_handler.gather_engine_info(self.engine_game,
                                                                                       'calculate_window')))
+        self.renderer = render.DirtyRectRenderer(self.screen)
+        self.menu_background = None  # Background images of the current menu screen flattened into one surface
+        self.menu_background_images = []
         # Initialize sample character
         self.character_sample = character.Character('Caesar', 'Caesar.py', self.engine_game, 100,
                                                     settings.SCREEN_HEIGHT / 2)
@@ -619,6 +614,7 @@ class MainMenu:
                 self.screen.blit(img, img_rect)
                 pygame.transform.scale(self.screen, (settings.WINDOW_WIDTH, settings.WINDOW_HEIGHT), self.window)
                 pygame.display.flip()
+                self.renderer.invalidate()
         except Exception:
             logging.error('* Error - Unexpected.')
 
@@ -881,13 +877,24 @@ class MainMenu:
         @rtype: none
         """
         try:
+            self.loop_scheduler.reset()
             while self.running:
-                self.menu_events()
-                self.menu_update()
-                self.menu_draw()
+                self.loop_scheduler.run_frame(self.menu_tick, self.menu_draw)
         except Exception:
             logging.error('* Error - Unexpected.')
 
+    def menu_tick(self):
+        """
+        A function to advance the menu, and the sample character running across it, by exactly one fixed tick.
+
+        @return: none
+        @rtype: none
+        """
+        self.sprite_interpolator.snapshot(self.sprites_all)
+        self.menu_events()
+        self.menu_update()
+        settings_store.store.update()
+
     def menu_events(self):
         """
         A function to handle all capture and handle all menu events for the menu to function properly.
@@ -911,12 +918,12 @@ class MainMenu:
         @rtype: none
         """
         try:
-            self.screen.fill(settings.WHITE)
             # TODO: Only update those.
             # Some input buttons require an update based on text input into them
             for button in self.buttons:
                 button.update()
             # Update character
+            physics.step(self.sprites_all)
             self.sprites_all.update()
 
             # Update animations that are applied
@@ -935,28 +942,37 @@ class MainMenu:
         except Exception:
             logging.error('* Error - Unexpected.')
 
-    def menu_draw(self):
+    def menu_draw(self, alpha=1.0):
         """
         A function to draw all the buttons, visual effects, and scale the game
         screen to the specified resolution.
 
+        @param alpha: how far, from 0 to 1, the frame is between the last two ticks, used to smooth movement
+        @type alpha: float
         @return: none
         @rtype: none
         """
         try:
             # Display backgrounds
-            for image in self.menu_blit_bg_images:
-                self.screen.blit(image, image.get_rect())
+            if settings.RENDER_DIRTY_RECTS is True:
+                self.renderer.begin_frame(self.menu_get_background())
+            else:
+                # Cleared here rather than in menu_update since a frame can be drawn without a tick before it
+                self.screen.fill(settings.WHITE)
+                for image in self.menu_blit_bg_images:
+                    self.screen.blit(image, image.get_rect())
             # Display the sample character running across the screen
+            self.sprite_interpolator.apply(self.sprites_all, alpha)
             self.sprites_all.draw(self.screen)
+            self.sprite_interpolator.restore()
             # TODO: Debugging
             # CONT: for obj_interactable in objs:
             # CONT:     # Draw box around obj
             for obj in self.menu_handler.objs_interact:
-                pygame.draw.lines(self.screen, settings.RED, True,
-                                  ((obj.rect.x, obj.rect.y), (obj.rect.x, obj.rect.y + obj.rect.height),
-                                   (obj.rect.x + obj.rect.width, obj.rect.y + obj.rect.height),
-                                   (obj.rect.x + obj.rect.width, obj.rect.y)))
+                self.screen.mark(pygame.draw.lines(self.screen, settings.RED, True,
+                                                   ((obj.rect.x, obj.rect.y), (obj.rect.x, obj.rect.y + obj.rect.height),
+                                                    (obj.rect.x + obj.rect.width, obj.rect.y + obj.rect.height),
+                                                    (obj.rect.x + obj.rect.width, obj.rect.y))))
             # TODO: End of Debugging
             # Display overlays via options for the user
             for image in self.menu_blit_layer_1_images:
@@ -978,13 +994,32 @@ class MainMenu:
             # Display dev information
             # self.engine_dev.push_animation_to_screen()
             # Scale screen
-            pygame.transform.scale(self.screen, (settings.WINDOW_WIDTH, settings.WINDOW_HEIGHT), self.window)
-            pygame.display.flip()
+            if settings.RENDER_DIRTY_RECTS is True:
+                self.renderer.end_frame()
+            else:
+                pygame.transform.scale(self.screen, (settings.WINDOW_WIDTH, settings.WINDOW_HEIGHT), self.window)
+                pygame.display.flip()
         except Exception:
             logging.error('* Error - Unexpected.')
 
+    def menu_get_background(self):
+        """
+        Accessor. Grab the background images of the current menu screen flattened into one opaque surface, only
+        flattening them again once the menu screen changes.
+
+        @return: the opaque background surface of the current menu screen
+        @rtype: surface
+        """
+        if self.menu_background is None or self.menu_background_images != self.menu_blit_bg_images:
+            self.menu_background = pygame.Surface((settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT)).convert()
+            self.menu_background.fill(settings.WHITE)
+            for image in self.menu_blit_bg_images:
+                self.menu_background.blit(image, image.get_rect())
+            self.menu_background_images = list(self.menu_blit_bg_images)
+        return self.menu_background
 
-def main():
+
+def main(file_input_record=None):
     try:
         logging.basicConfig(level="INFO", format='%(asctime)s %(levelname)s %(message)s',
                             filename='Bin/Logs/logs.txt',
@@ -1001,7 +1036,9 @@ def main():
         os.environ['SDL_VIDEO_WINDOW_POS'] = '%d,%d' % (1920 + 300, 100)  # Suggested window location
         # NOTE: End Dev debugging
         logging.info('* Info - Starting pygame.')
+        settings_store.store.load()
         engine_game = Game()
+        engine_game.file_input_record = file_input_record
         engine_main_menu = MainMenu(engine_game)
 
         # Menu state handler #
@@ -1032,7 +1069,7 @@ def main():
                 elif engine_game.state == 'Exit_To_Menu':
                     engine_main_menu.state = 'Main'
                     engine_game.sprites_important.empty()
-                    engine_game.sprites_walls.empty()
+                    engine_game.sprites_active_walls.empty()
                 else:
                     logging.error('* Error - Unexpected engine state: %s', engine_game.state)
                     exit()
@@ -1044,12 +1081,127 @@ def main():
                 logging.error('* Error - engine_main_menu.menu_start() returned an invalid state.')
 
         logging.info('* End of main.')
+        settings_store.store.flush()
         pygame.quit()
         return 0
     except Exception:
         logging.error('* Error - Unexpected.')
 
 
+def start_headless(file_save_name: str, level_number=1, level_sub=1, seed=None):
+    """
+    A function to load a save and a level without a window, ready to be simulated with Game.game_step(). Works on
+    computers with no display.
+
+    @param file_save_name: the name of the save to load
+    @type file_save_name: str
+    @param level_number: the level to load
+    @type level_number: int
+    @param level_sub: the sub-level to start in
+    @type level_sub: int
+    @param seed: the seed of everything random, or None for a different game every time
+    @type seed: int
+    @return: the game, running, or None if it couldn't be set up
+    @rtype: Game
+    """
+    # SDL has to be told before pygame starts
+    os.environ['SDL_VIDEODRIVER'] = 'dummy'
+    pygame.init()
+    engine_game = Game(headless=True)
+    engine_game.seed = seed
+    engine_game.level_start = (level_number, level_sub)
+    try:
+        engine_game.game_setup(file_save_name)
+    except Exception:
+        logging.error('* Error - Unexpected.')
+        if isinstance(engine_game.level_tiles, level.Level):
+            engine_game.level_tiles.close()
+        return None
+    engine_game.running = True
+    return engine_game
+
+
+def run_headless(file_save_name: str, ticks: int, level_number=1, level_sub=1):
+    """
+    A function to load a save and a level without a window and simulate a number of ticks as fast as possible, for
+    soak tests and benchmarks.
+
+    @param file_save_name: the name of the save to load
+    @type file_save_name: str
+    @param ticks: the number of ticks to simulate
+    @type ticks: int
+    @param level_number: the level to load
+    @type level_number: int
+    @param level_sub: the sub-level to start in
+    @type level_sub: int
+    @return: the ticks simulated, the seconds they took, and the ticks simulated every second, or None if the game
+             couldn't be set up
+    @rtype: dict
+    """
+    engine_game = start_headless(file_save_name, level_number, level_sub)
+    if engine_game is None:
+        return None
+    return time_game_steps(engine_game, ticks)
+
+
+def replay_headless(file_replay: str, ticks=None):
+    """
+    A function to replay a recording of a play session without a window as fast as possible. The session starts from
+    the same save, level, and seed as when it was recorded, so every replay of it plays out the same.
+
+    @param file_replay: the location of the recording, made with 'python engine.py --record <file>'
+    @type file_replay: str
+    @param ticks: the number of ticks to simulate, or None for every tick of the recording
+    @type ticks: int
+    @return: the ticks simulated, the seconds they took, and the ticks simulated every second, or None if the game
+             couldn't be set up
+    @rtype: dict
+    """
+    recording = inputs.InputRecording.load(file_replay)
+    engine_game = start_headless(recording.file_save_name, recording.level_number, recording.level_sub,
+                                 recording.seed)
+    if engine_game is None:
+        return None
+    engine_game.inputs.replay(recording)
+    return time_game_steps(engine_game, len(recording) if ticks is None else ticks)
+
+
+def time_game_steps(engine_game: Game, ticks: int):
+    """
+    A function to time simulating a number of ticks of a headless game, then close its level.
+
+    @param engine_game: the game, see start_headless()
+    @type engine_game: Game
+    @param ticks: the number of ticks to simulate
+    @type ticks: int
+    @return: the ticks simulated, the seconds they took, and the ticks simulated every second
+    @rtype: dict
+    """
+    time_start = time.perf_counter()
+    ticks_run = engine_game.game_step(ticks)
+    seconds = time.perf_counter() - time_start
+    engine_game.level_tiles.close()
+    return {'ticks': ticks_run, 'seconds': seconds, 'ticks_per_second': ticks_run / seconds if seconds > 0 else 0}
+
+
 if __name__ == '__main__':
-    main()
+    if len(sys.argv) > 1 and sys.argv[1] == '--headless':
+        # python engine.py --headless <save name> <ticks> [level] [sub-level]
+        results = run_headless(sys.argv[2], *[int(arg) for arg in sys.argv[3:]])
+        if results is None:
+            print('* [Debug - Error]: The game couldn\'t be set up.')
+            sys.exit(1)
+        print('[Debug - Info]: Simulated', results['ticks'], 'ticks in', round(results['seconds'], 3), 'seconds.')
+    elif len(sys.argv) > 1 and sys.argv[1] == '--replay':
+        # python engine.py --replay <recording> [ticks]
+        results = replay_headless(sys.argv[2], *[int(arg) for arg in sys.argv[3:]])
+        if results is None:
+            print('* [Debug - Error]: The game couldn\'t be set up.')
+            sys.exit(1)
+        print('[Debug - Info]: Replayed', results['ticks'], 'ticks in', round(results['seconds'], 3), 'seconds.')
+    elif len(sys.argv) > 1 and sys.argv[1] == '--record':
+        # python engine.py --record <recording>, the inputs of the next game played are saved to the recording
+        main(sys.argv[2])
+    else:
+        main()
     logging.info('* Info - Exiting ' + settings.TITLE_GAME + '.')
@@ -5,11 +5,15 @@ import animations
 import bindings
 import character
 import engine
+import fonts
+import level
+import saves
 import settings
+import settings_store
 
-from shutil import copy2
 from typing import NewType
 import importlib
+import json
 import logging
 import os
 import pygame
@@ -76,7 +80,7 @@ class EngineHandler:
         @return: none
         @rtype: none
         """
-        self.mouse_pos = pygame.mouse.get_pos()
+        self.mouse_pos = engine_game.inputs.mouse_pos
         # Needed to fix the mouse position after the screen is scaled
         self.mouse_pos = (self.mouse_pos[0] / settings.RES_WIDTH_RATIO, self.mouse_pos[1] / settings.RES_HEIGHT_RATIO)
         if event.type == pygame.KEYUP:
@@ -129,26 +133,29 @@ class EngineHandler:
             # We handle it here instead of the individual buttons so that it's faster to just check if's and else's
             # instead of doing function calls to handle events on each piece of text.
             elif self.state == 'Game_Inventory':
-                for text in engine_game.texts_to_display:
-                    if text.text_rect.collidepoint(self.mouse_pos[0], self.mouse_pos[1]):
-                        if text.name == 'Tab_Inventory':
-                            self.state_inventory = 'Inventory'
-                        if text.name == 'Tab_Saves':
-                            self.state_inventory = 'Saves'
-                        if text.name == 'Tab_Options':
-                            self.state_inventory = 'Options'
-                        if text.name == 'Tab_Feedback':
-                            self.state_inventory = 'Feedback'
-                        if text.name == 'Tab_Exit':
-                            self.state_inventory = 'Exit'
-                            # TODO: Create a popup to ask if they want to exit the whole game or to the main screen
-                            ask_you_sure = GamePopUp('Popup_Exit', 'Would you like to exit to the main menu or the game'
-                                                     '?', 20, settings.DEEP_GRAY, 'Exit To Main Menu', 15,
-                                                     settings.DEEP_GRAY, 'Exit To Desktop', 15, settings.DEEP_GRAY,
-                                                     'Cancel', 15, settings.DEEP_GRAY, settings.LIGHT_GRAY,
-                                                     settings.BLACK, settings.SCREEN_WIDTH / 2 + 25,
-                                                     settings.SCREEN_HEIGHT / 2, True)
-                            engine_game.popups.append(ask_you_sure)
+                # Tabs and slots are found from the panel's layout instead of checking every piece of text
+                tab = engine_game.inventory.get_tab(self.mouse_pos)
+                slot = engine_game.inventory.get_slot(self.mouse_pos)
+                if slot is not None:
+                    engine_game.inventory.slot_selected = slot
+                if tab == 'Tab_Inventory':
+                    self.state_inventory = 'Inventory'
+                elif tab == 'Tab_Saves':
+                    self.state_inventory = 'Saves'
+                elif tab == 'Tab_Options':
+                    self.state_inventory = 'Options'
+                elif tab == 'Tab_Feedback':
+                    self.state_inventory = 'Feedback'
+                elif tab == 'Tab_Exit':
+                    self.state_inventory = 'Exit'
+                    # TODO: Create a popup to ask if they want to exit the whole game or to the main screen
+                    ask_you_sure = GamePopUp('Popup_Exit', 'Would you like to exit to the main menu or the game'
+                                             '?', 20, settings.DEEP_GRAY, 'Exit To Main Menu', 15,
+                                             settings.DEEP_GRAY, 'Exit To Desktop', 15, settings.DEEP_GRAY,
+                                             'Cancel', 15, settings.DEEP_GRAY, settings.LIGHT_GRAY,
+                                             settings.BLACK, settings.SCREEN_WIDTH / 2 + 25,
+                                             settings.SCREEN_HEIGHT / 2, True)
+                    engine_game.popups.append(ask_you_sure)
             # Handle character inventory text and item clicking
             # We handle it here instead of the individual buttons so that it's faster to just check if's and else's
             # instead of doing function calls to handle events on each piece of text.
@@ -209,22 +216,15 @@ class EngineHandler:
         @return: none
         @rtype: none
         """
-        # Screen size: 40 tiles wide by 30 tiles tall
-        row_current = 0
-        path_to_level = 'Levels/Level_' + str(level_number) + '/Sub_Level_' + str(level_sub_number) + '.txt'
-
-        try:
-            with open(path_to_level, 'r') as file:
-                for line in file:
-                    col_current = 0
-                    data_from_file = line.split(' ')
-                    for data in data_from_file:
-                        self.generate_level_walls(engine_game, data, col_current, False, row_current)
-                        col_current += 1
-                    row_current += 1
-        except FileNotFoundError:
-            raise FileNotFoundError('File doesn\' exist.')
+        path_to_level = settings.DIR_LEVELS + '/Level_' + str(level_number) + '/Sub_Level_' + str(level_sub_number) \
+                        + '.txt'
+        if not os.path.isfile(path_to_level):
             engine_game.running = False
+            raise FileNotFoundError('File doesn\' exist.')
+        if engine_game.level_tiles.number != level_number:
+            engine_game.level_tiles = level.Level(level_number, engine_game.tileset)
+        engine_game.level_tiles.load_sub_level(level_sub_number)
+        engine_game.level_surface_cache.invalidate(level_sub_number)
 
     def generate_level_directions(self):
         """
@@ -235,50 +235,21 @@ class EngineHandler:
         @return: none
         @rtype: none
         """
-        print('[Gather - Pending]: Generating level directions.')
         self.engine_game.level_directions = ''
-        found_directions = False
-        level_matrix_location = [0, 0]
-        row = 0
-        # Find current location
-        for line in self.engine_game.level_matrix:
-            col = 0
-            for data in line:
-                if data == self.engine_game.level_sub_current:
-                    level_matrix_location = [row, col]
-                col += 1
-            row += 1
+        graph = self.engine_game.level_tiles.get_graph()
         # Update current location and determine level directions
-        self.engine_game.level_matrix_location = level_matrix_location
-        try:
-            # Check for level left
-            if '######' != self.engine_game.level_matrix[level_matrix_location[0] - 0][level_matrix_location[1] - 1]:
-                self.engine_game.level_directions += 'Left'
-                self.engine_game.level_directions_left = self.engine_game.level_matrix[level_matrix_location[0] - 0][level_matrix_location[1] - 1]
-                found_directions = True
-            # Check for level above
-            if '######' != self.engine_game.level_matrix[level_matrix_location[0] - 1][level_matrix_location[1] - 0]:
-                self.engine_game.level_directions += 'Up'
-                self.engine_game.level_directions_up = self.engine_game.level_matrix[level_matrix_location[0] - 1][level_matrix_location[1] - 0]
-                found_directions = True
-            # Check for level right
-            if '######' != self.engine_game.level_matrix[level_matrix_location[0] + 0][level_matrix_location[1] + 1]:
-                self.engine_game.level_directions += 'Right'
-                self.engine_game.level_directions_right = self.engine_game.level_matrix[level_matrix_location[0] + 0][level_matrix_location[1] + 1]
-                found_directions = True
-            # Check for level down
-            if '######' != self.engine_game.level_matrix[level_matrix_location[0] + 1][level_matrix_location[1] + 0]:
-                self.engine_game.level_directions += 'Down'
-                self.engine_game.level_directions_down = self.engine_game.level_matrix[level_matrix_location[0] + 1][level_matrix_location[1] + 0]
-                found_directions = True
-            if found_directions is True:
-                print('[Gather - Success]: Level directions found.')
-            else:
-                print('[Gather - Failed: Level directions not found.]')
-        except:
-            print(Exception)
-            print('[Debug - Error]: Popped out of range on level_matrix?')
+        level_matrix_location = graph.get_position(self.engine_game.level_sub_current) or (0, 0)
+        self.engine_game.level_matrix_location = list(level_matrix_location)
+        neighbours = graph.get_neighbours(self.engine_game.level_sub_current)
+        for direction, level_sub in neighbours.items():
+            self.engine_game.level_directions += direction
+            setattr(self.engine_game, 'level_directions_' + direction.lower(), level_sub)
+        if len(neighbours) == 0:
+            print('[Gather - Failed: Level directions not found.]')
         print('[Debug - Info]: Surrounding Levels -', self.engine_game.level_directions)
+        # Load the sub-levels the character can go to next before they're needed, nearest first
+        level_subs_next = list(graph.get_distances(self.engine_game.level_sub_current, 1))[1:]
+        self.engine_game.level_tiles.prefetch(level_subs_next)
 
     def generate_level_matrix(self, engine_game: object):
         """
@@ -291,201 +262,81 @@ class EngineHandler:
         @return: none
         @rtype: none
         """
-        data_counter = 0
-        line_counter = 0
-        path_to_matrix = 'Levels/Level_' + str(engine_game.level_current) + '/level_matrix.lvl'
-        # Gather map length from file
-        with open(path_to_matrix, 'r') as file:
-            for _ in file:
-                line_counter += 1
-        # Set up level matrix height for each row in file
-        level_matrix = [[] for row in range(line_counter)]  # [row][col] = ###### or LVL123
-        line_counter = 0
-        with open(path_to_matrix, 'r') as file:
-            for line in file:
-                data_from_line = line.split(' ')
-                # Gather map width from file
-                for _ in data_from_line:
-                    data_counter += 1
-                # Set up level matrix width for each col in file
-                level_matrix[line_counter] = ['' for _ in range(data_counter)]
-                data_counter = 0
-                for data_other in data_from_line:
-                    data_other = data_other.split('\n')
-                    # Modify each level information in the matrix from what's in the file
-                    if not '#' in data_other[0]:
-                        data_other[0] = int(data_other[0].strip('LVL'))
-                    level_matrix[line_counter][data_counter] = data_other[0]
-                    data_counter += 1
-                data_counter = 0
-                line_counter += 1
+        # The matrix comes with the compiled level, otherwise it's read from its text file once
+        level_matrix = engine_game.level_tiles.get_matrix()  # [row][col] = ###### or sub-level number
 
         # Change data needed and then generate directions from current level
         engine_game.level_matrix = level_matrix
         self.generate_level_directions()
 
-    def generate_level_walls(self, engine_game: object, data: str, col_current: int, level_switch: bool,
-                             row_current: int, sub_level: int):
-        """
-        A function for generating all of the specific walls and pieces in a level.
-
-        @param engine_game: the engine which controls the network/functions of the game when it starts after the menu
-        @type engine_game: object
-        @param data: the desired sprite, representing a tile for walls, that will be used for generation
-        @type data: str
-        @param col_current: an integer representing the tile's column location within the sub-level tile matrix
-        @type col_current: int
-        @param level_switch: the trigger for whether or not to modify how level generation works based on if we are
-                             switching levels
-        @type level_switch: bool
-        @param row_current: an integer representing the tile's row location within the sub-level tile matrix
-        @return: none
-        @rtype: none
-        """
-        # Convert for pixel match in game
-        x = 32 * col_current
-        y = 32 * row_current
-        type_tile = data.rstrip()
-        if level_switch is None:
-            # Move new level off the screen according to the direction the character is going
-            if self.screen_switch_dir is 'Down':
-                y += self.screen_switch_counter
-            elif self.screen_switch_dir is 'Left':
-                x -= self.screen_switch_counter
-            elif self.screen_switch_dir is 'Right':
-                x += self.screen_switch_counter
-            elif self.screen_switch_dir is 'Up':
-                y -= self.screen_switch_counter
-            if type_tile == 'N/A' or type_tile == 'N/A\n' or type_tile == ' ':
-                # Do nothing
-                pass
-            else:
-                # Check all types of tiles against the given data and if one is found, init it
-                TileSpriteInit(engine_game, type_tile, x, y, sub_level)
-        else:
-            if type_tile == 'N/A' or type_tile == 'N/A\n' or type_tile == ' ':
-                # Do nothing
-                pass
-            else:
-                # Check all types of tiles against the given data and if one is found, init it
-                TileSpriteInit(engine_game, type_tile, x, y, sub_level)
-
     def load_saved_game(self, file_save_name: str):
         """
-        A function to load a game, from the loading screen, that was previously saved.
+        A function to load a game, from the loading screen, that was previously saved. The character's settings are
+        swapped in right away, in memory, the rest of the save is put back by the game once its level and character
+        are made. An old save, a copy of settings.py, is converted the first time it's loaded.
 
-        @param file_save_name: the name of the save file to be loaded. No need for '.py'
+        @param file_save_name: the name of the save to be loaded. No need for an extension
         @type file_save_name: str
-        @return: none
-        @rtype: none
-        """
-        file_path_full = 'Bin/Saves/' + file_save_name + '.py'
-        # Make sure settings.py has a backup
-        with open('settings.py', 'r') as file:
-            lines = file.readlines()
-        if (os.path.isfile('settings_defaults.py')) is not True:
-            with open('settings_defaults.py', 'w') as file:
-                file.writelines(lines)
-            print('[Debug - Info]: Default settings backup started.')
-        # Load settings from a save file into the engine file
-        if (os.path.isfile('settings_defaults.py')) is True:
-            print('[Debug - Info]: Default settings backup finished.')
-            with open(file_path_full, 'r') as file:
-                lines_new = file.readlines()
-            with open('settings.py', 'w') as file:
-                file.writelines(lines_new)
-            print('[Debug - Info]: Character settings imported.')
-        # Reload file
-        importlib.reload(settings)
+        @return: the save
+        @rtype: saves.SaveFile
+        """
+        path_save = saves.get_path(file_save_name)
+        path_save_old = saves.get_path(file_save_name, saves.SAVE_EXTENSION_OLD)
+        if not os.path.isfile(path_save) and os.path.isfile(path_save_old):
+            save_file = saves.SaveFile(path_save)
+            save_file.write(saves.read_old_save(path_save_old))
+            print('[Debug - Info]:', file_save_name, 'converted to the new save format.')
+        else:
+            save_file = saves.SaveFile.load(path_save)
+        saves.apply_profile(save_file.state)
+        print('[Debug - Info]: Character settings imported.')
+        return save_file
 
     def reload_default_settings(self):
         """
-        A function to save the default settings back into the settings.py file.
+        A function to put the default settings back in place of the character's, such as after leaving a game. The
+        defaults are only ever kept in memory, so there's nothing to copy back.
 
         @return: none
         @rtype: none
         """
-        if (os.path.isfile('settings_defaults.py')) is True:
-            with open('settings_defaults.py', 'r') as file:
-                lines = file.readlines()
-            with open('settings.py', 'w') as file:
-                file.writelines(lines)
-            print('[Debug - Info]: \'settings.py\' was updated successfully from settings_defaults.py.')
-        else:
-            # Try to load settings from the backup.
-            # NOTE: There should never be a rewrite to the 'settings_defaults.py' file in the Backup folder
-            print('* [Debug - Error]: \'settings_defaults.py\' was not found when trying to rewrite settings. Retrying '
-                  'from backups.')
-            path_defaults_full = 'Bin/Backup/settings_defaults.py'
-            if (os.path.isfile(path_defaults_full)) is True:
-                with open(path_defaults_full, 'r') as file:
-                    lines = file.readlines()
-                with open('settings.py', 'w') as file:
-                    file.writelines(lines)
-                print('[Debug - Info]: \'settings.py\' was updated \'from Bin/Backup/settings_defaults.py '
-                      '\'successfully.')
-                # Copy from backup settings to a new settings_defaults file in Bin/
-                try:
-                    copy2('Bin/Backup/settings_defaults.py', 'Engine')
-                except Exception as excep:
-                    print('[Debug - Critical Error]: \'settings_defaults.py\' failed to copy from the backup folder. '
-                          'Provide info to the developers via the feedback tab')
-                    print('[Debug - Exception]: ' + str(excep))
-            else:
-                print('[Debug - Critical Error]: \'settings_defaults.py\' was not found in \'Bin/Backup/\'.')
+        settings_store.store.set_profile({})
+        print('[Debug - Info]: Default settings restored.')
 
     # TODO: Create the in-game pause menu features to save the game as well.
-    def save_current_game(self, file_save_name: str):
+    def save_current_game(self, engine_game: object):
         """
-        A function to save a game that has already been saved before.
+        A function to save a game that has already been saved before. Only what changed since the last save is
+        written, in the background so the game doesn't wait on it, see saves.AutosaveService.
 
-        @param file_save_name: the name of the file being saved. No need for '.py'
-        @type file_save_name: str
-        @return: none
-        @rtype: none
+        @param engine_game: the game being played
+        @type engine_game: object
+        @return: whether the save was started, not if the last save is still being written
+        @rtype: bool
         """
-        path_saves_full = 'Bin/Saves/' + file_save_name + '.py'
-        # Create save file from current settings
-        with open('settings.py', 'r') as file:
-            lines = file.readlines()
-        with open(path_saves_full, 'w') as file:
-            file.writelines(lines)
-        print('[Debug - Info]:', file_save_name, 'saved.')
+        return engine_game.autosave.save(engine_game)
 
     def save_new_game(self, character_name: str, file_save_name: str):
         """
-        A function to save a game that was just created.
+        A function to save a game that was just created, with the default settings for the character.
         # NOTE: Later if coop is in the game we can list both character's being
         # NOTE: played and allow the user to select which character to save.
 
         @param character_name: the name that the user gave for their new character
         @type character_name: str
-        @param file_save_name: the name of the file being saved. No need for '.py'
+        @param file_save_name: the name of the file being saved. No need for an extension
         @type file_save_name: str
-        @return: none
-        @rtype: none
-        """
-        path_saves_full = 'Bin/Saves/' + file_save_name + '.py'
-        # Create a copy of default settings file and save it in Bin/Saves/ as well as in the main directory so that
-        # we can copy back the defaults after the game is done.
-        # NOTE: This could cause some bad corruption since the default settings have a chance to not be copied back to
-        # NOTE: the settings.py file, thus leaving the previous character's settings still in the system
-        with open('settings.py', 'r') as file:
-            lines = file.readlines()
-        # Create save file from default settings and a backup for default settings
-        with open(path_saves_full, 'w') as file:
-            file.writelines(lines)
-        # TODO: The below two lines I don't think belong since we use settings_defaults for the system defaults and
-        # CONT: those don't need to be changed.
-        # with open('settings_defaults.py', 'w') as file:
-        #     file.writelines(lines)
-        # TODO: I don't think I need to update the settings again right here. We can just set the settings.CHAR_NAME
-        # CONT: equal to the character_name given from game_new()
-        # Update the new save file
-        # self.update_settings('CHAR_NAME', character_name, 'string', file_location=path_saves_full)
+        @return: the save
+        @rtype: saves.SaveFile
+        """
+        # The settings may still be another character's, so the new character starts from the defaults
+        state = {'profile': {name: settings_store.store.defaults[name] for name in saves.PROFILE_SETTINGS}}
+        state['profile']['CHAR_NAME'] = character_name
+        saves.apply_profile(state)
+        save_file = saves.SaveFile(saves.get_path(file_save_name))
+        save_file.write(state)
         print('[Debug - Info]:', file_save_name, 'saved.')
-        # Load the saved settings into the current engine settings
-        # self.load_saved_game(file_save_name)
+        return save_file
 
     # Misc Functions
 
@@ -586,23 +437,25 @@ class EngineHandler:
         @return: none
         @rtype: none
         """
-        # Info to display
-        font_debug_info = pygame.font.Font('Bin/Fonts/Adventure_Merienda/Merienda-Regular.ttf', 15)
-        font_level_surf = font_debug_info.render('Level: ' + str(engine_game.level_current) + ' of '
-                                                 + str(engine_game.level_total), False, settings.WHITE,
-                                                 settings.DARK_GRAY)
-        font_level_sub_surf = font_debug_info.render('Sub Level: ' + str(engine_game.level_sub_current) + ' of '
-                                                     + str(engine_game.level_sub_current_total) + '. Total: '
-                                                     + str(engine_game.level_sub_total), False, settings.WHITE,
-                                                     settings.DARK_GRAY)
-        font_char_state_surf = font_debug_info.render('State: ' + character_main.state, False, settings.WHITE,
-                                                      settings.DARK_GRAY)
-        font_char_x_vel_surf = font_debug_info.render('X-Velocity: ' + str(character_main.x_velocity), False,
-                                                      settings.WHITE, settings.DARK_GRAY)
-        font_char_y_vel_surf = font_debug_info.render('Y-Velocity: ' + str(character_main.y_velocity), False,
-                                                      settings.WHITE, settings.DARK_GRAY)
-        font_char_jump_count_surf = font_debug_info.render('Jump Count: ' + str(character_main.jump_count), False,
-                                                           settings.WHITE, settings.DARK_GRAY)
+        # Info to display, labels that didn't change since last frame come straight from the text cache
+        font_level_surf = fonts.render_text('Level: ' + str(engine_game.level_current) + ' of '
+                                            + str(engine_game.level_total), 15, settings.WHITE, False,
+                                            background=settings.DARK_GRAY)
+        font_level_sub_surf = fonts.render_text('Sub Level: ' + str(engine_game.level_sub_current) + ' of '
+                                                + str(engine_game.level_sub_current_total) + '. Total: '
+                                                + str(engine_game.level_sub_total), 15, settings.WHITE, False,
+                                                background=settings.DARK_GRAY)
+        font_char_state_surf = fonts.render_text('State: ' + character_main.state, 15, settings.WHITE, False,
+                                                 background=settings.DARK_GRAY)
+        font_char_x_vel_surf = fonts.render_text('X-Velocity: ' + str(character_main.x_velocity), 15, settings.WHITE,
+                                                 False, background=settings.DARK_GRAY)
+        font_char_y_vel_surf = fonts.render_text('Y-Velocity: ' + str(character_main.y_velocity), 15, settings.WHITE,
+                                                 False, background=settings.DARK_GRAY)
+        font_char_jump_count_surf = fonts.render_text('Jump Count: ' + str(character_main.jump_count), 15,
+                                                      settings.WHITE, False, background=settings.DARK_GRAY)
+        # Frame timings change every frame so caching them would only push the other labels out of the cache
+        font_frame_stats_surf = fonts.get_font(fonts.FONT_MERIENDA, 15).render(
+            engine_game.loop_scheduler.stats.get_report(), False, settings.WHITE, settings.DARK_GRAY)
         # Character Collision help
         # pygame.draw.lines(screen, settings.RED, True, ((character_main.rect.x, character_main.rect.y),
         #   (character_main.rect.x, character_main.rect.y + character_main.rect.height),
@@ -615,6 +468,7 @@ class EngineHandler:
         screen.blit(font_char_x_vel_surf, (251, 25))  # 256 - 5 for the offset of 5 for the other debug info
         screen.blit(font_char_y_vel_surf, (251, 45))
         screen.blit(font_char_jump_count_surf, (251, 65))
+        screen.blit(font_frame_stats_surf, (5, settings.SCREEN_HEIGHT - 25))
 
     def draw_ui_game(self, screen: object, character_main: object):
         """
@@ -628,12 +482,10 @@ class EngineHandler:
         @rtype: none
         """
         # Info to display such as character name and stats
-        font_ui = pygame.font.Font('Bin/Fonts/Adventure_Merienda/Merienda-Regular.ttf', 15)
-        font_ui_name = pygame.font.Font('Bin/Fonts/Adventure_Merienda/Merienda-Regular.ttf', 17)
-        font_ui_char_name_surf = font_ui_name.render(settings.CHAR_NAME, True, settings.YELLOW)
+        font_ui_char_name_surf = fonts.render_text(settings.CHAR_NAME, 17, settings.YELLOW)
         font_ui_char_name_rect = font_ui_char_name_surf.get_rect()
-        font_ui_trait_endurance_surf = font_ui.render('Endurance: ' + str(character_main.trait_endurance), False,
-                                                      settings.WHITE, settings.DARK_GRAY)
+        font_ui_trait_endurance_surf = fonts.render_text('Endurance: ' + str(character_main.trait_endurance), 15,
+                                                         settings.WHITE, False, background=settings.DARK_GRAY)
         # Ready all other elements of ui
 
         # Display ui system
@@ -712,8 +564,8 @@ class EngineHandler:
             resolution_modes = pygame.display.list_modes(32)
             if not resolution_modes:
                 print('[Gather - Fail]: There are no resolutions that support 32 pixel ratio.')
-                self.update_settings('RES_WIDTH_RATIO', str(settings.WINDOW_WIDTH / settings.SCREEN_WIDTH), 'int')
-                self.update_settings('RES_HEIGHT_RATIO', str(settings.WINDOW_HEIGHT / settings.SCREEN_HEIGHT), 'int')
+                self.update_settings('RES_WIDTH_RATIO', str(settings.WINDOW_WIDTH / settings.SCREEN_WIDTH))
+                self.update_settings('RES_HEIGHT_RATIO', str(settings.WINDOW_HEIGHT / settings.SCREEN_HEIGHT))
                 # TODO: Put pop-up message here signaling the user to restart the game to fix resolution querks.
                 # TODO: Remember, we import 'settings0.py' so when it's changed it doesn't change the instance we have
                 # CONT: open on import.
@@ -726,18 +578,17 @@ class EngineHandler:
                     return settings.WINDOW_WIDTH, settings.WINDOW_HEIGHT
                 else:
                     print('[Gather - Success]: Resolution found, best is ' + str(resolution_modes[0]) + '.')
-                    self.update_settings('WINDOW_WIDTH', str(resolution_modes[0][0]), 'int')
-                    self.update_settings('WINDOW_HEIGHT', str(resolution_modes[0][1]), 'int')
-                    self.update_settings('RES_WIDTH_RATIO', str(resolution_modes[0][0] / settings.SCREEN_WIDTH), 'int')
-                    self.update_settings('RES_HEIGHT_RATIO', str(resolution_modes[0][1] / settings.SCREEN_HEIGHT),
-                                         'int')
+                    self.update_settings('WINDOW_WIDTH', str(resolution_modes[0][0]))
+                    self.update_settings('WINDOW_HEIGHT', str(resolution_modes[0][1]))
+                    self.update_settings('RES_WIDTH_RATIO', str(resolution_modes[0][0] / settings.SCREEN_WIDTH))
+                    self.update_settings('RES_HEIGHT_RATIO', str(resolution_modes[0][1] / settings.SCREEN_HEIGHT))
                     return resolution_modes[0]
 
     @staticmethod
     def reimport_all():
         """
         A function to reimport all files associated with the game. The only catch, this file needs its own reimport
-        outside of this function use.
+        outside of this function use. The settings aren't reimported, they're kept in memory, see settings_store.py.
 
         @return: none
         @rtype: none
@@ -747,53 +598,27 @@ class EngineHandler:
         importlib.reload(bindings)
         importlib.reload(character)
         importlib.reload(engine)
-        importlib.reload(settings)
 
-    def update_settings(self, setting: str, value: str, value_type='string', file_location='settings.py'):
+    def update_settings(self, setting: str, value: object):
         """
-        A function to update the settings of the current game for the user.
+        A function to update the settings of the current game for the user. The change is used right away and saved to
+        the settings file along with any other changes made around the same time, see settings_store.SettingsStore.
         # TODO: There needs to be a separate settings file specified to the current user to hold all of their
         # CONT: own settings separately instead of one settings file as there will be multiple accounts on a
         # CONT: computer due to local coop probably being in the game.
 
         @param setting: the specific setting to change
         @type setting: str
-        @param value: the new value of the desired setting
-        @type value: str
-        @param value_type: is either 'string', 'int', 'decimal', etc
-        @type value_type: str
-        @param file_location: the location of the file that is to be changed
-        @type file_location: str
+        @param value: the new value of the desired setting, turned into the type the setting already has
+        @type value: object
         @return: none
         @rtype: none
 
         Example:
-        update_settings('RES_CHANGED', False, 'bool')
-        """
-        with open(file_location, 'r') as file:
-            lines = file.readlines()
-        # Find specific setting and split it
-        line_counter = 0
-        line_desired = 0
-        line_changed = ''
-        for line in lines:
-            if line.find(setting) == 0:
-                line_desired = line_counter
-                split_line = line.split('=')
-                if value_type is 'string':
-                    line_changed = split_line[0] + '= \'' + value + '\'\n'
-                elif value_type is 'bool':
-                    line_changed = split_line[0] + '= ' + str(value) + '\n'
-                else:
-                    line_changed = split_line[0] + '= ' + value + '\n'
-            line_counter += 1
-        lines[line_desired] = line_changed
-
-        # Change specific setting
-        with open(file_location, 'w') as file:
-            file.writelines(lines)
-        importlib.reload(settings)
-        print('[Debug - Info]: Setting = %s, Value = %s in %s' % (setting, value, file_location))
+        update_settings('RES_CHANGED', False)
+        """
+        if settings_store.store.set(setting, value):
+            print('[Debug - Info]: Setting = %s, Value = %s' % (setting, value))
 
 
 class GameText(object):
@@ -825,8 +650,8 @@ class GameText(object):
         self.text = text
         self.text_color = text_color
         self.text_size = text_size
-        self.font = pygame.font.Font('Bin/Fonts/Adventure_Merienda/Merienda-Regular.ttf', self.text_size)
-        self.text_image = self.font.render(self.text, True, self.text_color)
+        self.font = fonts.get_font(fonts.FONT_MERIENDA, self.text_size)
+        self.text_image = fonts.render_text(self.text, self.text_size, self.text_color)
         self.text_rect = self.text_image.get_rect()
         self.text_rect.x = x
         self.text_rect.y = y
@@ -886,8 +711,8 @@ class GameButton(object):
         self.text = text
         self.text_color = text_color
         self.text_size = text_size
-        self.font = pygame.font.Font('Bin/Fonts/Adventure_Merienda/Merienda-Regular.ttf', self.text_size)
-        self.text_image = self.font.render(self.text, True, self.text_color)
+        self.font = fonts.get_font(fonts.FONT_MERIENDA, self.text_size)
+        self.text_image = fonts.render_text(self.text, self.text_size, self.text_color)
         self.text_rect = self.text_image.get_rect()
         self.text_rect.x = x
         self.text_rect.y = y
@@ -926,13 +751,11 @@ class GameButton(object):
         # Check mouse pos for hover events
         if self.rect.collidepoint(mouse_pos[0], mouse_pos[1]):
             self.hover = True
-            # Handle special buttons via their name
-            if self.special:
-                self.font.set_underline(True)
         else:
             self.hover = False
-            self.font.set_underline(False)
-        self.text_image = self.font.render(self.text, True, self.text_color)
+        # Special buttons are underlined while hovered over
+        self.text_image = fonts.render_text(self.text, self.text_size, self.text_color,
+                                            underline=self.hover and self.special)
 
         # Check mouse interaction with buttons
         if event.type == pygame.MOUSEBUTTONDOWN:
@@ -963,6 +786,166 @@ class GameButton(object):
             screen.blit(self.text_image, self.text_rect)
 
 
+class GameInventory(object):
+    """
+    Class. Used to draw the character's inventory from one panel that is only put back together when the selected tab
+    or the items in the inventory change, and to find which tab or slot the mouse is over from the panel's layout.
+    """
+    # Tab name, text, and horizontal position of the tab relative to the left of the panel
+    TABS = (('Tab_Inventory', 'Inventory', 24), ('Tab_Saves', 'Saves', 135), ('Tab_Options', 'Options', 220),
+            ('Tab_Feedback', 'Feedback', 327), ('Tab_Exit', 'Exit', 440))
+    # Inventory slot layout relative to the top left of the panel
+    SLOT_COLUMNS = 12
+    SLOT_ROWS = 5
+    SLOT_SIZE = 32
+    SLOT_SPACING = 39.5  # Slot size plus the gap between slots
+    SLOT_X = 15.5
+    SLOT_Y = 105.5
+    ITEM_X = 17  # Items sit a little to the right of their slot's outline
+
+    def __init__(self, engine_game: object):
+        """
+        Constructor. Used to initialize an empty icon cache and panel.
+
+        @param engine_game: the engine which controls the network/functions of the game when it starts after the menu
+        @type engine_game: object
+        """
+        self.engine_game = engine_game
+        self.icons = {}  # Item name -> image of the item
+        self.panel = None  # The background, tabs, slots, and items put together onto one surface
+        self.panel_key = None  # The selected tab and items the panel was put together with
+        self.rects_tab = []  # (Tab name, rect relative to the top left of the panel)
+        self.slot_selected = None  # The (column, row) of the last slot clicked on
+
+    def get_icon(self, item: str):
+        """
+        Accessor. Grab the image of an item, loading it the first time it's asked for.
+
+        @param item: the name of the item
+        @type item: str
+        @return: the image of the item
+        @rtype: surface
+        """
+        icon = self.icons.get(item)
+        if icon is None:
+            icon = pygame.image.load(settings.DIR_SPRITES_GAME_INV + '/' + str(item) + '.png').convert_alpha()
+            self.icons[item] = icon
+        return icon
+
+    def get_origin(self):
+        """
+        Accessor. Grab the top left of the panel, it's centered over the character.
+
+        @return: the x and y location of the top left of the panel
+        @rtype: tuple
+        """
+        character_main = self.engine_game.character
+        return character_main.rect.x + character_main.rect.width / 2 - 245, 45
+
+    def get_panel(self):
+        """
+        Accessor. Grab the panel, putting it back together only if the selected tab or the items have changed.
+
+        @return: the panel of the inventory
+        @rtype: surface
+        """
+        key = (self.engine_game.engine_handler.state_inventory, tuple(settings.CHAR_INVENTORY))
+        if self.panel is None or key != self.panel_key:
+            self.panel = self.build_panel(key[0], key[1])
+            self.panel_key = key
+        return self.panel
+
+    def build_panel(self, state_inventory: str, items: tuple):
+        """
+        A function to put the background of the selected tab, the tabs' text, the slots, and the items onto one surface.
+
+        @param state_inventory: the tab that is selected
+        @type state_inventory: str
+        @param items: the names of the items in the inventory
+        @type items: tuple
+        @return: the panel of the inventory
+        @rtype: surface
+        """
+        engine_game = self.engine_game
+        # Display inventory background based on the state; interaction with inventory
+        backgrounds = {'Base': engine_game.img_inv_inv_base, 'Inventory': engine_game.img_inv_inv_selected,
+                       'Saves': engine_game.img_inv_saves_selected, 'Options': engine_game.img_inv_opt_selected,
+                       'Feedback': engine_game.img_inv_feed_selected, 'Exit': engine_game.img_inv_exit_selected}
+        panel = pygame.Surface(engine_game.img_inv_inv_base.get_size(), pygame.SRCALPHA, 32)
+        if state_inventory in backgrounds:
+            panel.blit(backgrounds[state_inventory], (0, 0))
+        # Title and tabs
+        panel.blit(fonts.render_text('Inventory', 26, settings.BLACK), (186, 3))
+        self.rects_tab = []
+        for name, text, x in self.TABS:
+            text_image = fonts.render_text(text, 18, settings.BLACK)
+            self.rects_tab.append((name, panel.blit(text_image, (x, 48))))
+        # Draw inventory slots
+        for i in range(self.SLOT_COLUMNS):
+            for j in range(self.SLOT_ROWS):
+                x = self.SLOT_X + i * self.SLOT_SPACING
+                y = self.SLOT_Y + j * self.SLOT_SPACING
+                pygame.draw.lines(panel, settings.DARK_GRAY, True,
+                                  ((x, y), (x, y + self.SLOT_SIZE), (x + self.SLOT_SIZE, y + self.SLOT_SIZE),
+                                   (x + self.SLOT_SIZE, y)))
+        # Display inventory items
+        # TODO: Change the loop to account for x amt of items that would push the next item to the second level in
+        # CONT: the inventory system.
+        for item_count, item in enumerate(items):
+            panel.blit(self.get_icon(item), (self.ITEM_X + item_count * self.SLOT_SPACING, self.SLOT_Y))
+        logging.debug('Built the inventory panel for the %s tab.', state_inventory)
+        return panel
+
+    def get_tab(self, mouse_pos: tuple):
+        """
+        Accessor. Grab the name of the tab under the mouse.
+
+        @param mouse_pos: the position of the mouse on the screen
+        @type mouse_pos: tuple
+        @return: the name of the tab or None if the mouse isn't over a tab
+        @rtype: str
+        """
+        self.get_panel()
+        x, y = self.get_origin()
+        for name, rect in self.rects_tab:
+            if rect.move(x, y).collidepoint(mouse_pos[0], mouse_pos[1]):
+                return name
+        return None
+
+    def get_slot(self, mouse_pos: tuple):
+        """
+        Accessor. Grab the slot under the mouse, worked out from the slot layout rather than checking every slot.
+
+        @param mouse_pos: the position of the mouse on the screen
+        @type mouse_pos: tuple
+        @return: the (column, row) of the slot or None if the mouse isn't over a slot
+        @rtype: tuple
+        """
+        x, y = self.get_origin()
+        x = mouse_pos[0] - x - self.SLOT_X
+        y = mouse_pos[1] - y - self.SLOT_Y
+        if x < 0 or y < 0:
+            return None
+        column = int(x // self.SLOT_SPACING)
+        row = int(y // self.SLOT_SPACING)
+        # Skip the gaps between slots
+        if column >= self.SLOT_COLUMNS or row >= self.SLOT_ROWS or x % self.SLOT_SPACING > self.SLOT_SIZE \
+                or y % self.SLOT_SPACING > self.SLOT_SIZE:
+            return None
+        return column, row
+
+    def draw(self, screen: object):
+        """
+        A function to draw the inventory over the character with one blit.
+
+        @param screen: the surface that holds all of the menu and game images/pixels
+        @type screen: object
+        @return: none
+        @rtype: none
+        """
+        screen.blit(self.get_panel(), self.get_origin())
+
+
 class GamePopUp(object):
     """Class. Used to initialize pop-up messages while the menu screen is being used by the user."""
 
@@ -1018,8 +1001,8 @@ class GamePopUp(object):
         self.text = text
         self.text_color = text_color
         self.text_size = text_size
-        self.font = pygame.font.SysFont('Consolas', self.text_size)
-        self.text_image = self.font.render(self.text, True, self.text_color)
+        self.font = fonts.get_font(fonts.FONT_CONSOLAS, self.text_size)
+        self.text_image = fonts.render_text(self.text, self.text_size, self.text_color, face=fonts.FONT_CONSOLAS)
         self.text_rect = self.text_image.get_rect()
 
         # Left text/button attributes
@@ -1027,8 +1010,9 @@ class GamePopUp(object):
         self.text_left_background = settings.DARK_GRAY
         self.text_left_color = text_left_color
         self.text_left_size = text_left_size
-        self.text_left_font = pygame.font.SysFont('Consolas', self.text_left_size)
-        self.text_left_image = self.text_left_font.render(self.text_left, True, self.text_left_color)
+        self.text_left_font = fonts.get_font(fonts.FONT_CONSOLAS, self.text_left_size)
+        self.text_left_image = fonts.render_text(self.text_left, self.text_left_size, self.text_left_color,
+                                                 face=fonts.FONT_CONSOLAS)
         self.text_left_rect = self.text_left_image.get_rect()
 
         # Right text/button attributes
@@ -1036,8 +1020,9 @@ class GamePopUp(object):
         self.text_right_background = settings.DARK_GRAY
         self.text_right_color = text_right_color
         self.text_right_size = text_right_size
-        self.text_right_font = pygame.font.SysFont('Consolas', self.text_right_size)
-        self.text_right_image = self.text_right_font.render(self.text_right, True, self.text_right_color)
+        self.text_right_font = fonts.get_font(fonts.FONT_CONSOLAS, self.text_right_size)
+        self.text_right_image = fonts.render_text(self.text_right, self.text_right_size, self.text_right_color,
+                                                  face=fonts.FONT_CONSOLAS)
         self.text_right_rect = self.text_right_image.get_rect()
 
         # Middle text/button attributes
@@ -1045,8 +1030,9 @@ class GamePopUp(object):
         self.text_middle_background = settings.DARK_GRAY
         self.text_middle_color = text_middle_color
         self.text_middle_size = text_middle_size
-        self.text_middle_font = pygame.font.SysFont('Consolas', self.text_right_size)
-        self.text_middle_image = self.text_middle_font.render(self.text_middle, True, self.text_middle_color)
+        self.text_middle_font = fonts.get_font(fonts.FONT_CONSOLAS, self.text_right_size)
+        self.text_middle_image = fonts.render_text(self.text_middle, self.text_right_size, self.text_middle_color,
+                                                   face=fonts.FONT_CONSOLAS)
         self.text_middle_rect = self.text_middle_image.get_rect()
 
         # Button attributes
@@ -1118,9 +1104,12 @@ class GamePopUp(object):
             else:
                 self.hover_middle = False
                 self.text_middle_background = settings.GRAY
-            self.text_left_image = self.text_left_font.render(self.text_left, True, self.text_left_color)
-            self.text_right_image = self.text_right_font.render(self.text_right, True, self.text_right_color)
-            self.text_middle_image = self.text_middle_font.render(self.text_middle, True, self.text_middle_color)
+            self.text_left_image = fonts.render_text(self.text_left, self.text_left_size, self.text_left_color,
+                                                     face=fonts.FONT_CONSOLAS)
+            self.text_right_image = fonts.render_text(self.text_right, self.text_right_size, self.text_right_color,
+                                                      face=fonts.FONT_CONSOLAS)
+            self.text_middle_image = fonts.render_text(self.text_middle, self.text_right_size, self.text_middle_color,
+                                                       face=fonts.FONT_CONSOLAS)
 
             # Check mouse interaction with buttons
             if event.type == pygame.MOUSEBUTTONDOWN:
@@ -1142,7 +1131,7 @@ class GamePopUp(object):
                     elif self.text_right == 'Exit To Desktop':
                         self.active = False
                         engine_game.sprites_all.empty()
-                        engine_game.sprites_walls.empty()
+                        engine_game.sprites_active_walls.empty()
                         engine_game.running = False
                         engine_game.state = 'Exit_To_Desktop'
                 if self.text_middle_rect.collidepoint(mouse_pos[0], mouse_pos[1]):
@@ -1393,8 +1382,8 @@ class MenuHandler(object):
         """
         # Set up top box for sub menus
         if self.engine_menu.state == 'Options' or self.engine_menu.state == 'Options_Video':
-            pygame.draw.lines(screen, settings.DARK_GRAY, True, ((10, 25), (10, 65), (settings.SCREEN_WIDTH - 10, 65),
-                                                                 (settings.SCREEN_WIDTH - 10, 25)), 1)
+            screen.mark(pygame.draw.lines(screen, settings.DARK_GRAY, True, ((10, 25), (10, 65), (settings.SCREEN_WIDTH - 10, 65),
+                                                                             (settings.SCREEN_WIDTH - 10, 25)), 1))
 
         self.draw_sub_menu_visuals_special(screen)
 
@@ -1414,10 +1403,10 @@ class MenuHandler(object):
                 if (btn.name == 'Input_Create_Char_Name' or btn.name == 'Input_File_Save_Name') \
                         and btn.user_input != '' and btn.disabled is True:
                     # Display a check next to entered text
-                    pygame.draw.lines(screen, settings.GREEN, False,
-                                      ((btn.rect.x + btn.rect.width + 5, btn.rect.y + btn.rect.height - 7),
-                                       (btn.rect.x + btn.rect.width + 8, btn.rect.y + btn.rect.height),
-                                       (btn.rect.x + btn.rect.width + 10, btn.rect.y)), 2)
+                    screen.mark(pygame.draw.lines(screen, settings.GREEN, False,
+                                                  ((btn.rect.x + btn.rect.width + 5, btn.rect.y + btn.rect.height - 7),
+                                                   (btn.rect.x + btn.rect.width + 8, btn.rect.y + btn.rect.height),
+                                                   (btn.rect.x + btn.rect.width + 10, btn.rect.y)), 2))
         # Load
         # Options controls
         # Options game
@@ -1426,30 +1415,30 @@ class MenuHandler(object):
         if self.engine_menu.state == 'Options_Video':
             for button in self.engine_menu.buttons:
                 if button.name == 'Options_Video_Resolution' and button.hover:
-                    pygame.draw.line(screen, settings.DARK_GRAY, (410, 60),
-                                     (410, button.rect.y + button.rect.height / 2))
-                    pygame.draw.line(screen, settings.DARK_GRAY, (410, button.rect.y + button.rect.height / 2),
-                                     (350, button.rect.y + button.rect.height / 2))
+                    screen.mark(pygame.draw.line(screen, settings.DARK_GRAY, (410, 60),
+                                                 (410, button.rect.y + button.rect.height / 2)))
+                    screen.mark(pygame.draw.line(screen, settings.DARK_GRAY, (410, button.rect.y + button.rect.height / 2),
+                                                 (350, button.rect.y + button.rect.height / 2)))
                 elif button.name == 'Options_Video_Graphics' and button.hover:
-                    pygame.draw.line(screen, settings.DARK_GRAY, (410, 60),
-                                     (410, button.rect.y + button.rect.height / 2))
-                    pygame.draw.line(screen, settings.DARK_GRAY, (410, button.rect.y + button.rect.height / 2),
-                                     (350, button.rect.y + button.rect.height / 2))
+                    screen.mark(pygame.draw.line(screen, settings.DARK_GRAY, (410, 60),
+                                                 (410, button.rect.y + button.rect.height / 2)))
+                    screen.mark(pygame.draw.line(screen, settings.DARK_GRAY, (410, button.rect.y + button.rect.height / 2),
+                                                 (350, button.rect.y + button.rect.height / 2)))
                 else:
                     # TODO: Can this be fixed by just taking the for loop out and changing the below conditional statements to
                     # CONT: more elif statements?
                     for button in self.engine_menu.buttons:
                         # Show selection visuals if the dropdown buttons are active
                         if button.name[:7] == 'New_Res' and button.hover and button.active:
-                            pygame.draw.line(screen, settings.DARK_GRAY, (410, 60),
-                                             (410, button.rect.y + button.rect.height / 2))
-                            pygame.draw.line(screen, settings.DARK_GRAY, (410, button.rect.y + button.rect.height / 2),
-                                             (350, button.rect.y + button.rect.height / 2))
+                            screen.mark(pygame.draw.line(screen, settings.DARK_GRAY, (410, 60),
+                                                         (410, button.rect.y + button.rect.height / 2)))
+                            screen.mark(pygame.draw.line(screen, settings.DARK_GRAY, (410, button.rect.y + button.rect.height / 2),
+                                                         (350, button.rect.y + button.rect.height / 2)))
                         elif button.name[:15] == 'Choice_Graphics' and button.hover and button.active:
-                            pygame.draw.line(screen, settings.DARK_GRAY, (410, 60),
-                                             (410, button.rect.y + button.rect.height / 2))
-                            pygame.draw.line(screen, settings.DARK_GRAY, (410, button.rect.y + button.rect.height / 2),
-                                             (350, button.rect.y + button.rect.height / 2))
+                            screen.mark(pygame.draw.line(screen, settings.DARK_GRAY, (410, 60),
+                                                         (410, button.rect.y + button.rect.height / 2)))
+                            screen.mark(pygame.draw.line(screen, settings.DARK_GRAY, (410, button.rect.y + button.rect.height / 2),
+                                                         (350, button.rect.y + button.rect.height / 2)))
         # Help
         # Feedback
 
@@ -1507,8 +1496,8 @@ class MenuButton(object):
         self.text = text
         self.text_color = text_color
         self.text_size = text_size
-        self.font = pygame.font.Font('Bin/Fonts/Adventure_Merienda/Merienda-Regular.ttf', self.text_size)
-        self.text_image = self.font.render(self.text, True, self.text_color)
+        self.font = fonts.get_font(fonts.FONT_MERIENDA, self.text_size)
+        self.text_image = fonts.render_text(self.text, self.text_size, self.text_color)
         self.text_rect = self.text_image.get_rect()
         self.text_rect.x = x
         self.text_rect.y = y
@@ -1548,13 +1537,11 @@ class MenuButton(object):
         # Check mouse pos for hover events
         if self.rect.collidepoint(mouse_pos[0], mouse_pos[1]):
             self.hover = True
-            # Handle special buttons via their name
-            if self.special:
-                self.font.set_underline(True)
         else:
             self.hover = False
-            self.font.set_underline(False)
-        self.text_image = self.font.render(self.text, True, self.text_color)
+        # Special buttons are underlined while hovered over
+        self.text_image = fonts.render_text(self.text, self.text_size, self.text_color,
+                                            underline=self.hover and self.special)
 
         # Check mouse interaction with buttons
         if event.type == pygame.MOUSEBUTTONDOWN:
@@ -1605,11 +1592,10 @@ class MenuButton(object):
                             padding = 5
                             saves_total = 0
                             # Grab all save files from folder
-                            save_files = os.listdir('Bin/Saves/')
-                            for save_file in save_files:
+                            for save_name in saves.get_save_names():
                                 # Basic setup for proper values
-                                new_text = save_file.strip('.py')
-                                new_text_image = self.font.render(new_text, True, self.text_color)
+                                new_text = save_name
+                                new_text_image = fonts.render_text(new_text, self.text_size, self.text_color)
                                 new_text_rect = new_text_image.get_rect()
                                 # Send it
                                 new_x = 20
@@ -1671,7 +1657,7 @@ class MenuButton(object):
                             for res in resolution_modes:
                                 # Basic setup for proper values of new resolutions for dropdown
                                 new_text = '(' + str(res[0]) + ', ' + str(res[1]) + ')'
-                                new_text_image = self.font.render(new_text, True, self.text_color)
+                                new_text_image = fonts.render_text(new_text, self.text_size, self.text_color)
                                 new_text_rect = new_text_image.get_rect()
                                 # Send it
                                 new_x = self.text_rect.x + self.text_rect.width - new_text_rect.width
@@ -1697,11 +1683,11 @@ class MenuButton(object):
                         split_res = strip_res_text.split(', ')
                         # TODO: Fix the resolution use in the below code in order to better reflect option changes
                         # CONT: according involving the self.engine_menu.engine_handler.update_settings()
-                        self.engine_menu.engine_handler.update_settings('WINDOW_WIDTH', split_res[0], 'int')
-                        self.engine_menu.engine_handler.update_settings('WINDOW_HEIGHT', split_res[1], 'int')
-                        self.engine_menu.engine_handler.update_settings('RES_WIDTH_RATIO', str((int(split_res[0]) / settings.SCREEN_WIDTH)), 'int')
-                        self.engine_menu.engine_handler.update_settings('RES_HEIGHT_RATIO', str((int(split_res[1]) / settings.SCREEN_HEIGHT)), 'int')
-                        self.engine_menu.engine_handler.update_settings('RES_CHANGED', True, 'bool')
+                        self.engine_menu.engine_handler.update_settings('WINDOW_WIDTH', split_res[0])
+                        self.engine_menu.engine_handler.update_settings('WINDOW_HEIGHT', split_res[1])
+                        self.engine_menu.engine_handler.update_settings('RES_WIDTH_RATIO', str((int(split_res[0]) / settings.SCREEN_WIDTH)))
+                        self.engine_menu.engine_handler.update_settings('RES_HEIGHT_RATIO', str((int(split_res[1]) / settings.SCREEN_HEIGHT)))
+                        self.engine_menu.engine_handler.update_settings('RES_CHANGED', True)
 
                         # TODO: Reset screen and window to the appropriate resolution below. The line might not be correct
                         self.engine_menu.window = pygame.display.set_mode((self.engine_menu.engine_handler.gather_engine_info(self.engine_menu.engine_game, 'calculate_window')))
@@ -1739,7 +1725,7 @@ class MenuButton(object):
                             for setting in graphics_setting:
                                 # Basic setup for proper values of each graphics setting in the dropdown
                                 button_text = '(' + setting + ')'
-                                button_image = self.font.render(button_text, True, settings.DARK_GRAY)
+                                button_image = fonts.render_text(button_text, self.text_size, settings.DARK_GRAY)
                                 button_rect = button_image.get_rect()
                                 button_x = self.rect.x + self.rect.width - button_rect.width
                                 button_y = self.rect.y + self.rect.height + drop_down_offset + padding
@@ -1752,7 +1738,7 @@ class MenuButton(object):
                         self.disabled = True
                         # Change values in settings based on clicked button
                         strip_graphics_text = self.text.strip('()')
-                        self.engine_menu.engine_handler.update_settings('GRAPHICS', strip_graphics_text, 'string')
+                        self.engine_menu.engine_handler.update_settings('GRAPHICS', strip_graphics_text)
                         new_buttons = []
                         for btn in buttons:
                             if btn.name[:15] == 'Choice_Graphics':
@@ -1826,8 +1812,8 @@ class MenuInteractiveText(object):
         self._max_width = max_width
         self.engine_menu = engine_menu
         # Button attributes
-        self.FONT = pygame.font.SysFont('Consolas', 15)  # depreciated
-        self.font_ui = pygame.font.Font('Bin/Fonts/Adventure_Merienda/Merienda-Regular.ttf', 15)
+        self.FONT = fonts.get_font(fonts.FONT_CONSOLAS, 15)  # depreciated
+        self.font_ui = fonts.get_font(fonts.FONT_MERIENDA, 15)
         self.active = True
         self.disabled = True
         self.image = pygame.Surface((width, height))
@@ -1836,7 +1822,7 @@ class MenuInteractiveText(object):
         self.name = name
         self.user_input = ''
         self.text_ask = text_ask
-        self.text_image = self.font_ui.render(self.text_ask, True, settings.UI_FEEDBACK_TEXT)
+        self.text_image = fonts.render_text(self.text_ask, 15, settings.UI_FEEDBACK_TEXT)
         self.text_rect = pygame.Rect(x + 5, y + 5, width / 2, height / 2)
 
     def handle_events(self, event: object, mouse_pos: tuple):
@@ -1887,7 +1873,7 @@ class MenuInteractiveText(object):
                 # To get characters we use event.unicode
                 self.user_input += event.unicode
             # Change the new text of the box to the user's input
-            self.text_image = self.font_ui.render(self.text_ask + self.user_input, True, settings.UI_FEEDBACK_TEXT)
+            self.text_image = fonts.render_text(self.text_ask + self.user_input, 15, settings.UI_FEEDBACK_TEXT)
 
         # Handle events for buttons regarding character creation
         # NOTE: I separated these to further show the dire need to better modularize
@@ -1940,7 +1926,7 @@ class MenuInteractiveText(object):
                 # To get characters we use event.unicode
                 self.user_input += event.unicode
             # Change the new text of the box to the user's input
-            self.text_image = self.font_ui.render(self.text_ask + self.user_input, True, settings.UI_FEEDBACK_TEXT)
+            self.text_image = fonts.render_text(self.text_ask + self.user_input, 15, settings.UI_FEEDBACK_TEXT)
         # Gather input if the file save button is not disabled
         elif self.active and event.type == pygame.KEYDOWN and self.name == 'Input_File_Save_Name'\
                 and self.disabled is False:
@@ -1966,7 +1952,7 @@ class MenuInteractiveText(object):
                     # To get characters we use event.unicode
                     self.user_input += event.unicode
             # Change the new text of the box to the user's input
-            self.text_image = self.font_ui.render(self.text_ask + self.user_input, True, settings.UI_FEEDBACK_TEXT)
+            self.text_image = fonts.render_text(self.text_ask + self.user_input, 15, settings.UI_FEEDBACK_TEXT)
 
     def update(self):
         """
@@ -1986,7 +1972,7 @@ class MenuInteractiveText(object):
         # Limiting text size beyond max width
         if self.text_image.get_width() > self._max_width - 5:
             self.user_input = self.user_input[:-1]
-            self.text_image = self.font_ui.render(self.text_ask + self.user_input, True, settings.UI_FEEDBACK_TEXT)
+            self.text_image = fonts.render_text(self.text_ask + self.user_input, 15, settings.UI_FEEDBACK_TEXT)
 
     def draw(self, screen: object):
         """
@@ -2063,8 +2049,8 @@ class MenuPopUp(object):
         self.text = text
         self.text_color = text_color
         self.text_size = text_size
-        self.font = pygame.font.SysFont('Consolas', self.text_size)
-        self.text_image = self.font.render(self.text, True, self.text_color)
+        self.font = fonts.get_font(fonts.FONT_CONSOLAS, self.text_size)
+        self.text_image = fonts.render_text(self.text, self.text_size, self.text_color, face=fonts.FONT_CONSOLAS)
         self.text_rect = self.text_image.get_rect()
 
         # Left text/button attributes
@@ -2072,8 +2058,9 @@ class MenuPopUp(object):
         self.text_left_background = settings.DARK_GRAY
         self.text_left_color = text_left_color
         self.text_left_size = text_left_size
-        self.text_left_font = pygame.font.SysFont('Consolas', self.text_left_size)
-        self.text_left_image = self.text_left_font.render(self.text_left, True, self.text_left_color)
+        self.text_left_font = fonts.get_font(fonts.FONT_CONSOLAS, self.text_left_size)
+        self.text_left_image = fonts.render_text(self.text_left, self.text_left_size, self.text_left_color,
+                                                 face=fonts.FONT_CONSOLAS)
         self.text_left_rect = self.text_left_image.get_rect()
 
         # Right text/button attributes
@@ -2081,8 +2068,9 @@ class MenuPopUp(object):
         self.text_right_background = settings.DARK_GRAY
         self.text_right_color = text_right_color
         self.text_right_size = text_right_size
-        self.text_right_font = pygame.font.SysFont('Consolas', self.text_right_size)
-        self.text_right_image = self.text_right_font.render(self.text_right, True, self.text_right_color)
+        self.text_right_font = fonts.get_font(fonts.FONT_CONSOLAS, self.text_right_size)
+        self.text_right_image = fonts.render_text(self.text_right, self.text_right_size, self.text_right_color,
+                                                  face=fonts.FONT_CONSOLAS)
         self.text_right_rect = self.text_right_image.get_rect()
 
         # Button attributes
@@ -2138,8 +2126,10 @@ class MenuPopUp(object):
                 self.hover_right = True
             else:
                 self.hover_right = False
-            self.text_left_image = self.text_left_font.render(self.text_left, True, self.text_left_color)
-            self.text_right_image = self.text_right_font.render(self.text_right, True, self.text_right_color)
+            self.text_left_image = fonts.render_text(self.text_left, self.text_left_size, self.text_left_color,
+                                                     face=fonts.FONT_CONSOLAS)
+            self.text_right_image = fonts.render_text(self.text_right, self.text_right_size, self.text_right_color,
+                                                      face=fonts.FONT_CONSOLAS)
 
             # Check mouse interaction with buttons
             if event.type == pygame.MOUSEBUTTONDOWN:
@@ -2207,39 +2197,6 @@ class MenuPopUp(object):
         screen.blit(self.text_middle_image, self.text_middle_rect)
 
 
-class TileSpriteInit(pygame.sprite.Sprite):
-    """Class. Used to create sprites from game file images for later use and manipulation."""
-
-    def __init__(self, engine_game: object, type: str, x: int, y: int, level_sub: int):
-        """
-        Constructor. Used to create a sprite and add it to the groups for drawing the level.
-
-        @param engine_game: the engine which controls the network/functions of the game when it starts after the menu
-        @type engine_game: object
-        @param x: the desired horizontal location for the sprite to be initiated at
-        @type x: int
-        @param y: the desired vertical location for the sprite to be initiated at
-        @type y: int
-        @param level_sub: the sub level that the sprite is created for
-        @type level_sub: int
-        """
-        # Width: 32 Height: 32
-        # TODO: Create a hiearchy of elifs for 'g' or 'h' so that it takes less time to get through the loop
-        # CONT: Is this coded effeciently?
-        for i in range(10000):
-            if type in engine_game.type_tiles:
-                image = engine_game.type_tiles[type]
-            else:
-                return
-        self.level_sub = level_sub
-        self.groups = engine_game.sprites_walls
-        pygame.sprite.Sprite.__init__(self, self.groups)
-        self.image = image.convert_alpha()
-        self.rect = self.image.get_rect()
-        self.rect.x = x
-        self.rect.y = y
-
-
 class SnowHandler(object):
     """
     Class. Creates the ability to handle a bunch of particles for a snow
@@ -2296,15 +2253,19 @@ class SnowHandler(object):
 
 class SpriteSheet(object):
     """Class. Used to grab images out of a sprite sheet."""
-    def __init__(self, file_name: str):
+    def __init__(self, file_name: str, colorkey=settings.BLACK):
         """
         Constructor. Used to initialize the SpriteSheet for later use.
 
         @param file_name: the full file location of the sprite sheet relative the engineLib.py file
         @type file_name: str
+        @param colorkey: the color drawn as transparent, such as the tileset manifest's colorkey
+        @type colorkey: tuple
         """
         # Load the sprite sheet.
         self.sprite_sheet = pygame.image.load(file_name).convert()
+        # It's set on the sheet so every image grabbed out of it shares it
+        self.sprite_sheet.set_colorkey(colorkey)
 
     def get_image(self, x: int, y: int, width: int, height: int):
         """
@@ -2324,14 +2285,37 @@ class SpriteSheet(object):
                  and functionality as a whole.
         @rtype: surface
         """
-        # Create a new blank image
-        image = pygame.Surface([width, height]).convert()
+        # A view into the sheet instead of a copy of it, it shares the sheet's pixels and transparent color
+        return self.sprite_sheet.subsurface((x, y, width, height))
+
+    def get_tiles(self, tileset: dict):
+        """
+        Accessor. Grab every tile listed in a tileset manifest out of the sprite sheet.
 
-        # Copy the sprite from the large sheet onto the smaller image
-        image.blit(self.sprite_sheet, (0, 0), (x, y, width, height))
+        @param tileset: the tileset manifest, see load_tileset()
+        @type tileset: dict
+        @return: the tile codes, such as 'GL0', and their images
+        @rtype: dict
+        """
+        tile_size = tileset['tile_size']
+        tiles = {}
+        for tile in tileset['tiles']:
+            tiles[tile['code']] = self.get_image(tile['x'], tile['y'], tile_size, tile_size)
+        return tiles
 
-        # Assuming black works as the transparent color
-        image.set_colorkey(settings.BLACK)
 
-        # Return the image
-        return image
+def load_tileset(file_location: str):
+    """
+    A function to load the tileset manifest shared by the engine and the tile editor. The manifest names the sprite
+    sheet, the color on it that's drawn as transparent, and lists, in order, every tile's id, code, and location on
+    the sheet. Ids are what compiled levels store so new tiles are only ever added to the end of the list.
+
+    @param file_location: the file location of the tileset manifest
+    @type file_location: str
+    @return: the tileset manifest, with its colorkey as a tuple, black if it doesn't have one
+    @rtype: dict
+    """
+    with open(file_location, 'r') as file:
+        tileset = json.load(file)
+    tileset['colorkey'] = tuple(tileset.get('colorkey', settings.BLACK))
+    return tileset
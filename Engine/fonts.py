@@ -0,0 +1,170 @@
+# The fonts module that handles loading every font once and caching text that has already been rendered.
+# Tanner Fry
+# tefnq2@mst.edu
+import settings
+
+import collections
+import pygame
+
+# Font faces used by the engine. Faces ending in .ttf are loaded from file, anything else is a system font name
+FONT_CONSOLAS = 'Consolas'
+FONT_MERIENDA = 'Bin/Fonts/Adventure_Merienda/Merienda-Regular.ttf'
+
+
+class FontPool(object):
+    """Class. Used to load each font face at each size only once and hand the same font to everything that asks."""
+    def __init__(self):
+        """
+        Constructor. Used to initialize an empty pool of fonts.
+        """
+        self.fonts = {}  # (face, size) -> pygame.font.Font
+
+    def get_font(self, face: str, size: int):
+        """
+        Accessor. Grab the font of a face at a size, loading it the first time it's asked for.
+
+        NOTE: The font is shared so don't change it, such as with set_underline(), use TextCache.render() instead.
+
+        @param face: the file location of the font or the name of a system font
+        @type face: str
+        @param size: the text size of the font
+        @type size: int
+        @return: the font of the face at the size
+        @rtype: pygame.font.Font
+        """
+        key = (face, size)
+        font = self.fonts.get(key)
+        if font is None:
+            if face.endswith('.ttf'):
+                font = pygame.font.Font(face, size)
+            else:
+                font = pygame.font.SysFont(face, size)
+            self.fonts[key] = font
+        return font
+
+    def clear(self):
+        """
+        A function to throw away every loaded font.
+
+        @return: none
+        @rtype: none
+        """
+        self.fonts.clear()
+
+
+class TextCache(object):
+    """
+    Class. Used to keep the most recently rendered text surfaces so labels that don't change between frames aren't
+    rendered again every frame. The least recently used surface is thrown away once the cache is full.
+    """
+    def __init__(self, font_pool: FontPool, size_max=settings.TEXT_CACHE_SIZE):
+        """
+        Constructor. Used to initialize an empty cache on top of a font pool.
+
+        @param font_pool: the pool the fonts are grabbed from
+        @type font_pool: FontPool
+        @param size_max: the most text surfaces kept at once
+        @type size_max: int
+        """
+        self.font_pool = font_pool
+        self.hits = 0
+        self.misses = 0
+        self.size_max = size_max
+        self.surfaces = collections.OrderedDict()  # Key of the rendered text -> surface, least recently used first
+
+    def render(self, text: str, size: int, color: tuple, antialias=True, underline=False, background=None,
+               face=FONT_MERIENDA):
+        """
+        A function to grab the surface of some rendered text, only rendering it if it isn't cached.
+
+        NOTE: The surface is shared with everything else that rendered the same text so it must not be drawn onto.
+
+        @param text: the text to render
+        @type text: str
+        @param size: the text size
+        @type size: int
+        @param color: the color of the text
+        @type color: tuple
+        @param antialias: whether the text has smooth edges or not
+        @type antialias: bool
+        @param underline: whether the text is underlined or not
+        @type underline: bool
+        @param background: the color behind the text or None for a transparent background
+        @type background: tuple
+        @param face: the file location of the font or the name of a system font
+        @type face: str
+        @return: the surface of the rendered text
+        @rtype: surface
+        """
+        key = (text, size, color, antialias, underline, background, face)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+        self.misses += 1
+        font = self.font_pool.get_font(face, size)
+        if underline:
+            font.set_underline(True)
+        try:
+            surface = font.render(text, antialias, color, background)
+        finally:
+            if underline:
+                font.set_underline(False)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.size_max:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        """
+        A function to throw away every cached surface and reset the stats.
+
+        @return: none
+        @rtype: none
+        """
+        self.hits = 0
+        self.misses = 0
+        self.surfaces.clear()
+
+    def get_report(self):
+        """
+        Accessor. Grab a one line summary of how well the cache is doing.
+
+        @return: the summary of the cache
+        @rtype: str
+        """
+        total = self.hits + self.misses
+        rate = 0.0 if total == 0 else self.hits / total * 100
+        return 'Text cache: %d hits, %d misses (%.1f%%), %d of %d cached' \
+               % (self.hits, self.misses, rate, len(self.surfaces), self.size_max)
+
+
+# The pool and cache shared by the whole engine
+font_pool = FontPool()
+text_cache = TextCache(font_pool)
+
+
+def get_font(face: str, size: int):
+    """
+    A function to grab a font from the shared font pool.
+
+    @param face: the file location of the font or the name of a system font
+    @type face: str
+    @param size: the text size of the font
+    @type size: int
+    @return: the font of the face at the size
+    @rtype: pygame.font.Font
+    """
+    return font_pool.get_font(face, size)
+
+
+def render_text(text: str, size: int, color: tuple, antialias=True, underline=False, background=None,
+                face=FONT_MERIENDA):
+    """
+    A function to grab rendered text from the shared text cache. See TextCache.render().
+
+    @return: the surface of the rendered text
+    @rtype: surface
+    """
+    return text_cache.render(text, size, color, antialias, underline, background, face)
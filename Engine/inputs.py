@@ -0,0 +1,265 @@
+# The inputs module that handles reading the keys and events of every tick, and recording and replaying them.
+# Tanner Fry
+# tefnq2@mst.edu
+import pygame
+import struct
+import zlib
+
+# Recording file format, little endian:
+#   header: magic, version, seed, level number, sub-level number, length of the save name, then the save name
+#   body, compressed: number of ticks, then for every tick the held keys, the mouse position, the number of events,
+#   and each event
+RECORDING_HEADER = struct.Struct('<4sHIHHH')
+RECORDING_MAGIC = b'SINP'
+RECORDING_VERSION = 1
+RECORDING_TICKS = struct.Struct('<I')
+RECORDING_TICK = struct.Struct('<HhhB')  # Held keys, mouse x, mouse y, number of events
+RECORDING_EVENT = struct.Struct('<BIhhB')  # Event type, key or button, mouse x, mouse y, length of the text typed
+# The keys the game checks are held down, each is one bit of a tick's held keys
+KEYS_HELD = (pygame.K_SPACE, pygame.K_LCTRL, pygame.K_LSHIFT, pygame.K_w, pygame.K_a, pygame.K_s, pygame.K_d,
+             pygame.K_g, pygame.K_LEFT, pygame.K_RIGHT)
+# The events the game reacts to, anything else isn't recorded
+EVENT_TYPES = (pygame.KEYDOWN, pygame.KEYUP, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.QUIT)
+
+
+class KeysHeld(object):
+    """Class. Used to look up held keys the same way as pygame.key.get_pressed(), from a tick's recorded keys."""
+    def __init__(self, mask=0):
+        """
+        Constructor. Used to store which of the keys the game checks are held.
+
+        @param mask: a bit for each key in KEYS_HELD, set if the key is held
+        @type mask: int
+        """
+        self.mask = mask
+
+    def __getitem__(self, key: int):
+        if key not in KEYS_HELD:
+            return False
+        return bool(self.mask >> KEYS_HELD.index(key) & 1)
+
+
+def get_keys_mask(keys_pressed):
+    """
+    A function to pack the keys the game checks into the bits of one number.
+
+    @param keys_pressed: the held keys, from pygame.key.get_pressed()
+    @type keys_pressed: object
+    @return: a bit for each key in KEYS_HELD, set if the key is held
+    @rtype: int
+    """
+    mask = 0
+    for bit, key in enumerate(KEYS_HELD):
+        if keys_pressed[key]:
+            mask |= 1 << bit
+    return mask
+
+
+class InputRecording(object):
+    """
+    Class. Used to hold the inputs of every tick of a play session along with what's needed to start the session the
+    same way again: the save, the level, and the seed of everything random.
+    """
+    def __init__(self, file_save_name: str, level_number: int, level_sub: int, seed: int):
+        """
+        Constructor. Used to create a recording with no ticks yet.
+
+        @param file_save_name: the name of the save the session was started from
+        @type file_save_name: str
+        @param level_number: the level the session was started in
+        @type level_number: int
+        @param level_sub: the sub-level the session was started in
+        @type level_sub: int
+        @param seed: the seed of everything random in the session
+        @type seed: int
+        """
+        self.file_save_name = file_save_name
+        self.level_number = level_number
+        self.level_sub = level_sub
+        self.seed = seed
+        self.ticks = []  # (held keys, mouse position, events) of every tick
+
+    def __len__(self):
+        return len(self.ticks)
+
+    def save(self, path: str):
+        """
+        A function to write the recording to a file.
+
+        @param path: the location of the file
+        @type path: str
+        @return: none
+        @rtype: none
+        """
+        body = [RECORDING_TICKS.pack(len(self.ticks))]
+        for mask, mouse_pos, events in self.ticks:
+            body.append(RECORDING_TICK.pack(mask, mouse_pos[0], mouse_pos[1], len(events)))
+            for event in events:
+                text = event.dict.get('unicode', '').encode('utf-8')
+                pos = event.dict.get('pos', (0, 0))
+                body.append(RECORDING_EVENT.pack(EVENT_TYPES.index(event.type),
+                                                 event.dict.get('key', event.dict.get('button', 0)), pos[0], pos[1],
+                                                 len(text)))
+                body.append(text)
+        name = self.file_save_name.encode('utf-8')
+        with open(path, 'wb') as file:
+            file.write(RECORDING_HEADER.pack(RECORDING_MAGIC, RECORDING_VERSION, self.seed, self.level_number,
+                                             self.level_sub, len(name)))
+            file.write(name)
+            file.write(zlib.compress(b''.join(body)))
+
+    @classmethod
+    def load(cls, path: str):
+        """
+        A function to read a recording from a file.
+
+        @param path: the location of the file
+        @type path: str
+        @return: the recording
+        @rtype: InputRecording
+        @raise ValueError: if the file isn't a recording or is from another version
+        """
+        with open(path, 'rb') as file:
+            data = file.read()
+        magic, version, seed, level_number, level_sub, name_length = RECORDING_HEADER.unpack_from(data)
+        if magic != RECORDING_MAGIC or version != RECORDING_VERSION:
+            raise ValueError('Not a recording of this version: ' + path)
+        offset = RECORDING_HEADER.size
+        recording = cls(data[offset:offset + name_length].decode('utf-8'), level_number, level_sub, seed)
+        body = zlib.decompress(data[offset + name_length:])
+        offset = RECORDING_TICKS.size
+        for _ in range(RECORDING_TICKS.unpack_from(body)[0]):
+            mask, mouse_x, mouse_y, events_count = RECORDING_TICK.unpack_from(body, offset)
+            offset += RECORDING_TICK.size
+            events = []
+            for _ in range(events_count):
+                event_type, code, x, y, text_length = RECORDING_EVENT.unpack_from(body, offset)
+                offset += RECORDING_EVENT.size
+                text = body[offset:offset + text_length].decode('utf-8')
+                offset += text_length
+                events.append(make_event(EVENT_TYPES[event_type], code, (x, y), text))
+            recording.ticks.append((mask, (mouse_x, mouse_y), events))
+        return recording
+
+
+def make_event(event_type: int, code: int, pos: tuple, text: str):
+    """
+    A function to make a pygame event with the attributes the game reads from events of its type.
+
+    @param event_type: the type of the event, one of EVENT_TYPES
+    @type event_type: int
+    @param code: the key for key events or the button for mouse events
+    @type code: int
+    @param pos: the mouse position for mouse events
+    @type pos: tuple
+    @param text: the text typed for key presses
+    @type text: str
+    @return: the event
+    @rtype: pygame.event.Event
+    """
+    if event_type in (pygame.KEYDOWN, pygame.KEYUP):
+        return pygame.event.Event(event_type, key=code, mod=0, unicode=text)
+    if event_type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+        return pygame.event.Event(event_type, button=code, pos=pos)
+    return pygame.event.Event(event_type)
+
+
+class GameInput(object):
+    """
+    Class. Used to gather the held keys, mouse position, and events of every game tick from one place, so a play session
+    can be recorded and replayed tick for tick instead of the game reading pygame directly.
+    """
+    def __init__(self):
+        """
+        Constructor. Used to start out reading the keyboard and mouse live.
+        """
+        self.events = []  # The events of the current tick
+        self.keys_held = KeysHeld()  # The held keys of the current tick while recording or replaying
+        self.mode = 'Live'  # 'Live', 'Record', or 'Replay'
+        self.mouse_pos = (0, 0)  # The mouse position of the current tick, before it's scaled to the screen
+        self.recording = None  # The recording being made or replayed
+        self.tick = 0  # Ticks since the recording or replay started
+
+    def record(self, recording: InputRecording):
+        """
+        A function to start recording the inputs of every tick.
+
+        @param recording: the empty recording to add ticks to
+        @type recording: InputRecording
+        @return: none
+        @rtype: none
+        """
+        self.mode = 'Record'
+        self.recording = recording
+        self.tick = 0
+
+    def replay(self, recording: InputRecording):
+        """
+        A function to start feeding the game the inputs of a recording instead of the keyboard and mouse.
+
+        @param recording: the recording to replay
+        @type recording: InputRecording
+        @return: none
+        @rtype: none
+        """
+        self.mode = 'Replay'
+        self.recording = recording
+        self.tick = 0
+
+    def stop(self):
+        """
+        A function to go back to reading the keyboard and mouse live.
+
+        @return: the recording that was being made or replayed
+        @rtype: InputRecording
+        """
+        recording = self.recording
+        self.mode = 'Live'
+        self.recording = None
+        return recording
+
+    def is_replay_finished(self):
+        """
+        Accessor. Grab whether every tick of the recording being replayed has been used.
+
+        @return: whether the replay is finished
+        @rtype: bool
+        """
+        return self.mode == 'Replay' and self.tick >= len(self.recording)
+
+    def poll(self):
+        """
+        A function to gather the inputs of the next tick, from the keyboard and mouse or from the recording.
+
+        @return: none
+        @rtype: none
+        """
+        # The window's events are always taken so the operating system doesn't think the game stopped responding
+        events = pygame.event.get()
+        if self.mode == 'Replay':
+            if self.tick < len(self.recording):
+                mask, self.mouse_pos, self.events = self.recording.ticks[self.tick]
+                self.keys_held = KeysHeld(mask)
+            else:
+                self.events = []
+                self.keys_held = KeysHeld()
+        else:
+            self.events = events
+            self.mouse_pos = pygame.mouse.get_pos()
+            if self.mode == 'Record':
+                # The game only sees what a replay will see
+                self.events = [event for event in events if event.type in EVENT_TYPES]
+                self.keys_held = KeysHeld(get_keys_mask(pygame.key.get_pressed()))
+                self.recording.ticks.append((self.keys_held.mask, self.mouse_pos, self.events))
+        self.tick += 1
+
+    def get_pressed(self):
+        """
+        Accessor. Grab the held keys of the current tick, looked up like pygame.key.get_pressed().
+
+        @return: the held keys
+        @rtype: object
+        """
+        if self.mode == 'Live':
+            return pygame.key.get_pressed()
+        return self.keys_held
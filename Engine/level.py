@@ -0,0 +1,798 @@
+# The level module that handles holding the tiles of each sub-level as compact grids of tile ids.
+# Tanner Fry
+# tefnq2@mst.edu
+import settings
+
+import collections
+import concurrent.futures
+import logging
+import mmap
+import os
+import pygame
+import struct
+import zlib
+
+# Screen size: 40 tiles wide by 30 tiles tall
+TILES_HIGH = 30
+TILES_WIDE = 40
+TILE_EMPTY = 0  # The tile id of a cell without a tile, written as 'N/A' in the level files
+
+# Compiled levels: a header, the level matrix, then each sub-level's number followed by its tile grid and its merged
+# wall rectangles. Every number is little endian. The text files stay the editing format, the compiled file is made
+# from them whenever they change
+COMPILED_FILE = 'level.bin'
+COMPILED_HEADER = struct.Struct('<4sHII')  # Magic, version, tileset hash, checksum of everything after the header
+COMPILED_MAGIC = b'SLVL'
+COMPILED_VERSION = 2
+COMPILED_RECT = struct.Struct('<BBBB')  # Column, row, width, and height of a wall rectangle, in tiles
+MATRIX_EMPTY = '######'  # A spot in the level matrix without a sub-level, written as 0 in compiled levels
+
+
+class Tileset(object):
+    """
+    Class. Used to share one image per tile type between every cell of every sub-level, so a cell only has to store
+    the id of its tile instead of its own sprite and image.
+    """
+    def __init__(self, manifest: dict, images=None):
+        """
+        Constructor. Used to line the tile codes and images up with the tile ids of the tileset manifest.
+
+        @param manifest: the tileset manifest, see engineLib.load_tileset()
+        @type manifest: dict
+        @param images: the tile codes, such as 'GL0', and their images, or None when only the ids are needed
+        @type images: dict
+        """
+        id_max = max(tile['id'] for tile in manifest['tiles'])
+        self.codes = [None] * (id_max + 1)  # Tile id -> tile code
+        self.ids = {}  # Tile code -> tile id
+        self.images = [None] * (id_max + 1)  # Tile id -> image shared by every cell with that tile
+        self.tile_size = manifest['tile_size']
+        for tile in manifest['tiles']:
+            self.codes[tile['id']] = tile['code']
+            self.ids[tile['code']] = tile['id']
+            if images is not None:
+                self.images[tile['id']] = images[tile['code']]
+        # Compiled levels store tile ids so they are only valid for the exact same ids and codes
+        self.hash = zlib.crc32(' '.join(str(tile_id) + ':' + str(code) for tile_id, code in enumerate(self.codes))
+                               .encode('utf-8'))
+
+    def get_id(self, code: str):
+        """
+        Accessor. Grab the tile id of a tile code.
+
+        @param code: the tile code, such as 'GL0', from a level file
+        @type code: str
+        @return: the tile id or TILE_EMPTY if the code isn't a known tile
+        @rtype: int
+        """
+        return self.ids.get(code, TILE_EMPTY)
+
+    def get_image(self, tile_id: int):
+        """
+        Accessor. Grab the shared image of a tile id.
+
+        @param tile_id: the tile id
+        @type tile_id: int
+        @return: the image of the tile or None for an empty cell
+        @rtype: surface
+        """
+        return self.images[tile_id]
+
+
+class TileSprite(pygame.sprite.Sprite):
+    """Class. Used for a tile that something needs as a sprite, such as for sprite collisions."""
+    def __init__(self, image: pygame.Surface, x: int, y: int, level_sub: int):
+        """
+        Constructor. Used to create a sprite that shares the tile's image with every other cell of the same tile.
+
+        @param image: the shared image of the tile
+        @type image: surface
+        @param x: the horizontal location of the tile
+        @type x: int
+        @param y: the vertical location of the tile
+        @type y: int
+        @param level_sub: the sub-level that the tile is in
+        @type level_sub: int
+        """
+        pygame.sprite.Sprite.__init__(self)
+        self.image = image
+        self.level_sub = level_sub
+        self.rect = pygame.Rect((x, y), image.get_size())
+
+
+class SubLevel(object):
+    """
+    Class. Used to hold the tiles of a sub-level as one byte per cell, row by row. The revision goes up every time a
+    tile changes so anything made from the tiles, such as baked surfaces or sprites, knows when it's out of date.
+    """
+    def __init__(self, number: int, tiles=None, rects=None):
+        """
+        Constructor. Used to create a sub-level, empty unless its tiles are given.
+
+        @param number: the sub-level number within its level
+        @type number: int
+        @param tiles: the tile id of every cell, row by row
+        @type tiles: bytearray
+        @param rects: the tiles already merged into wall rectangles, see merge_tiles(), or None to merge them when
+                      they're needed
+        @type rects: list
+        """
+        if tiles is None:
+            tiles = bytearray(TILES_WIDE * TILES_HIGH)
+        self.number = number
+        self.rects = rects  # Wall rectangles, in tiles, made from the tiles at rects_revision
+        self.rects_revision = -1 if rects is None else 0
+        self.revision = 0
+        self.sprites = pygame.sprite.Group()  # Tiles as sprites, made from the tiles at sprites_revision
+        self.sprites_revision = -1
+        self.tiles = tiles
+
+    def get_tile(self, col: int, row: int):
+        """
+        Accessor. Grab the tile id of a cell.
+
+        @param col: the column of the cell
+        @type col: int
+        @param row: the row of the cell
+        @type row: int
+        @return: the tile id of the cell
+        @rtype: int
+        """
+        return self.tiles[row * TILES_WIDE + col]
+
+    def set_tile(self, col: int, row: int, tile_id: int):
+        """
+        A function to change the tile of a cell.
+
+        @param col: the column of the cell
+        @type col: int
+        @param row: the row of the cell
+        @type row: int
+        @param tile_id: the new tile id of the cell
+        @type tile_id: int
+        @return: none
+        @rtype: none
+        """
+        index = row * TILES_WIDE + col
+        if self.tiles[index] != tile_id:
+            self.tiles[index] = tile_id
+            self.revision += 1
+
+    def iter_tiles(self):
+        """
+        A function to go through every cell that has a tile.
+
+        @return: the column, row, and tile id of each cell with a tile
+        @rtype: generator
+        """
+        for index, tile_id in enumerate(self.tiles):
+            if tile_id != TILE_EMPTY:
+                row, col = divmod(index, TILES_WIDE)
+                yield col, row, tile_id
+
+    def get_rects(self):
+        """
+        Accessor. Grab the tiles merged into as few wall rectangles as possible, only merging them the first time
+        they're asked for or after the tiles have changed.
+
+        @return: the column, row, width, and height, in tiles, of each wall rectangle
+        @rtype: list
+        """
+        if self.rects_revision != self.revision:
+            self.rects = merge_tiles(self.tiles)
+            self.rects_revision = self.revision
+        return self.rects
+
+    def get_sprites(self, tileset: Tileset):
+        """
+        Accessor. Grab the tiles of the sub-level as a group of sprites, only making them the first time they're asked
+        for or after the tiles have changed. The group belongs to the sub-level, so making it the active group is all
+        it takes to switch to the sub-level.
+
+        @param tileset: the tileset the tile ids belong to
+        @type tileset: Tileset
+        @return: a sprite for every cell with a tile
+        @rtype: pygame.sprite.Group
+        """
+        if self.sprites_revision != self.revision:
+            tile_size = tileset.tile_size
+            self.sprites.empty()
+            self.sprites.add([TileSprite(tileset.get_image(tile_id), col * tile_size, row * tile_size, self.number)
+                              for col, row, tile_id in self.iter_tiles()])
+            self.sprites_revision = self.revision
+        return self.sprites
+
+    @classmethod
+    def load(cls, number: int, file_location: str, tileset: Tileset):
+        """
+        A function to read a sub-level from a level file of space separated tile codes, one line per row.
+
+        @param number: the sub-level number within its level
+        @type number: int
+        @param file_location: the file location of the sub-level
+        @type file_location: str
+        @param tileset: the tileset the tile codes belong to
+        @type tileset: Tileset
+        @return: the sub-level
+        @rtype: SubLevel
+        """
+        sub_level = cls(number)
+        with open(file_location, 'r') as file:
+            for row, line in enumerate(file):
+                if row >= TILES_HIGH:
+                    break
+                for col, data in enumerate(line.split(' ')[:TILES_WIDE]):
+                    sub_level.tiles[row * TILES_WIDE + col] = tileset.get_id(data.rstrip())
+        return sub_level
+
+
+class LevelGraph(object):
+    """
+    Class. Used to turn the level matrix, once, into where each sub-level is and which sub-levels are next to it, so
+    switching sub-levels doesn't have to search the matrix.
+    """
+    # Direction -> (row, col) step, in the order the directions are checked
+    DIRECTIONS = (('Left', 0, -1), ('Up', -1, 0), ('Right', 0, 1), ('Down', 1, 0))
+
+    def __init__(self, matrix: list):
+        """
+        Constructor. Used to find where every sub-level is and its neighbours in each direction.
+
+        @param matrix: the level matrix, each spot is a sub-level number or '######'
+        @type matrix: list
+        """
+        self.neighbours = {}  # Sub-level number -> {direction: sub-level number}
+        self.positions = {}  # Sub-level number -> (row, col) in the level matrix
+        for row, line in enumerate(matrix):
+            for col, level_sub in enumerate(line):
+                if level_sub != MATRIX_EMPTY:
+                    self.positions[level_sub] = (row, col)
+        for level_sub, (row, col) in self.positions.items():
+            neighbours = {}
+            for direction, step_row, step_col in self.DIRECTIONS:
+                row_next = row + step_row
+                col_next = col + step_col
+                # Off the edge of the matrix is a wall, not the other side of the matrix
+                if 0 <= row_next < len(matrix) and 0 <= col_next < len(matrix[row_next]) \
+                        and matrix[row_next][col_next] != MATRIX_EMPTY:
+                    neighbours[direction] = matrix[row_next][col_next]
+            self.neighbours[level_sub] = neighbours
+
+    def get_position(self, level_sub: int):
+        """
+        Accessor. Grab where a sub-level is in the level matrix.
+
+        @param level_sub: the sub-level number
+        @type level_sub: int
+        @return: the row and column of the sub-level or None if it isn't in the matrix
+        @rtype: tuple
+        """
+        return self.positions.get(level_sub)
+
+    def get_neighbours(self, level_sub: int):
+        """
+        Accessor. Grab the sub-levels next to a sub-level.
+
+        @param level_sub: the sub-level number
+        @type level_sub: int
+        @return: the direction, 'Left', 'Up', 'Right', or 'Down', and the sub-level number of each neighbour
+        @rtype: dict
+        """
+        return self.neighbours.get(level_sub, {})
+
+    def get_distances(self, level_sub: int, distance_max=None):
+        """
+        A function to find how many sub-level switches it takes to reach every other sub-level, with a breadth first
+        search.
+
+        @param level_sub: the sub-level to start from
+        @type level_sub: int
+        @param distance_max: the furthest distance to search or None to search the whole level
+        @type distance_max: int
+        @return: each reachable sub-level number and its distance, nearest first
+        @rtype: dict
+        """
+        if level_sub not in self.positions:
+            return {}
+        distances = {level_sub: 0}
+        queue = collections.deque([level_sub])
+        while queue:
+            level_sub_current = queue.popleft()
+            distance = distances[level_sub_current] + 1
+            if distance_max is not None and distance > distance_max:
+                continue
+            for level_sub_next in self.neighbours[level_sub_current].values():
+                if level_sub_next not in distances:
+                    distances[level_sub_next] = distance
+                    queue.append(level_sub_next)
+        return distances
+
+
+class Level(object):
+    """
+    Class. Used to hold the tile grids of the sub-levels of a level. Sub-levels are loaded the first time they're asked
+    for, the ones the character can reach next can be loaded ahead of time on a background worker, and only the most
+    recently used ones are kept.
+    """
+    def __init__(self, number: int, tileset: Tileset, cache_size=settings.LEVEL_CACHE_SIZE):
+        """
+        Constructor. Used to create a level without any sub-levels loaded.
+
+        @param number: the level number
+        @type number: int
+        @param tileset: the tileset shared by every sub-level
+        @type tileset: Tileset
+        @param cache_size: the most sub-levels kept loaded at once
+        @type cache_size: int
+        """
+        self.buffer = None  # The memory mapped compiled level, if the level was loaded from one
+        self.cache_size = cache_size
+        self.changes = {}  # Sub-level number -> {cell index: tile id} of tiles changed in game, kept for saves
+        self.executor = None  # Background worker that prefetches sub-levels, started the first time it's needed
+        self.graph = None  # Which sub-levels are next to each other, made from the matrix the first time it's needed
+        self.matrix = None  # The level matrix, read the first time it's asked for if it wasn't compiled
+        self.missing = set()  # Sub-level numbers without a file, so they aren't looked for every frame
+        self.number = number
+        self.offsets = {}  # Sub-level number -> where its tile grid starts in the compiled level
+        self.pending = {}  # Sub-level number -> future of a prefetch that hasn't been collected yet
+        self.sub_levels = collections.OrderedDict()  # Sub-level number -> SubLevel, least recently used first
+        self.tileset = tileset
+
+    def get_path(self, level_sub: int):
+        """
+        Accessor. Grab the file location of a sub-level of the level.
+
+        @param level_sub: the sub-level number
+        @type level_sub: int
+        @return: the file location of the sub-level
+        @rtype: str
+        """
+        return settings.DIR_LEVELS + '/Level_' + str(self.number) + '/Sub_Level_' + str(level_sub) + '.txt'
+
+    def read_sub_level(self, level_sub: int):
+        """
+        A function to read a sub-level from the compiled level or its level file without keeping it. Safe to run on
+        the background worker.
+
+        @param level_sub: the sub-level number
+        @type level_sub: int
+        @return: the sub-level or None if its file doesn't exist
+        @rtype: SubLevel
+        """
+        offset = self.offsets.get(level_sub)
+        if offset is not None:
+            # Copied out of the compiled level so it can still be changed
+            offset_rects = offset + TILES_WIDE * TILES_HIGH
+            count, = struct.unpack_from('<H', self.buffer, offset_rects)
+            rects = [COMPILED_RECT.unpack_from(self.buffer, offset_rects + 2 + i * COMPILED_RECT.size)
+                     for i in range(count)]
+            return SubLevel(level_sub, bytearray(self.buffer[offset:offset_rects]), rects)
+        try:
+            return SubLevel.load(level_sub, self.get_path(level_sub), self.tileset)
+        except FileNotFoundError:
+            logging.error('* Error - File not found within the current level: %s %s.', self.number, level_sub)
+            return None
+
+    def store(self, sub_level: SubLevel):
+        """
+        A function to keep a sub-level as the most recently used one, letting go of the least recently used sub-level
+        once there are too many. Tiles changed in game are put back on a sub-level that was just read.
+
+        @param sub_level: the sub-level to keep
+        @type sub_level: SubLevel
+        @return: none
+        @rtype: none
+        """
+        for index, tile_id in self.changes.get(sub_level.number, {}).items():
+            sub_level.set_tile(index % TILES_WIDE, index // TILES_WIDE, tile_id)
+        self.sub_levels[sub_level.number] = sub_level
+        self.sub_levels.move_to_end(sub_level.number)
+        self.missing.discard(sub_level.number)
+        while len(self.sub_levels) > self.cache_size:
+            self.sub_levels.popitem(last=False)
+
+    def load_sub_level(self, level_sub: int):
+        """
+        A function to read a sub-level now, replacing it if it was already loaded.
+
+        @param level_sub: the sub-level number
+        @type level_sub: int
+        @return: the sub-level or None if its file doesn't exist
+        @rtype: SubLevel
+        """
+        future = self.pending.pop(level_sub, None)
+        if future is not None:
+            future.cancel()
+        sub_level = self.read_sub_level(level_sub)
+        if sub_level is None:
+            self.missing.add(level_sub)
+            return None
+        self.store(sub_level)
+        return sub_level
+
+    def get_sub_level(self, level_sub: int):
+        """
+        Accessor. Grab a sub-level, loading it if it isn't loaded yet or waiting on it if it's being prefetched.
+
+        @param level_sub: the sub-level number
+        @type level_sub: int
+        @return: the sub-level or None if its file doesn't exist
+        @rtype: SubLevel
+        """
+        sub_level = self.sub_levels.get(level_sub)
+        if sub_level is not None:
+            self.sub_levels.move_to_end(level_sub)
+            return sub_level
+        future = self.pending.pop(level_sub, None)
+        if future is not None and not future.cancelled():
+            sub_level = future.result()
+            if sub_level is None:
+                self.missing.add(level_sub)
+                return None
+            self.store(sub_level)
+            return sub_level
+        if level_sub in self.missing:
+            return None
+        return self.load_sub_level(level_sub)
+
+    def get_loaded_sub_level(self, level_sub: int):
+        """
+        Accessor. Grab a sub-level only if it's already loaded or its prefetch has finished, never reading it or
+        waiting on it, for work that can skip a sub-level until it's ready.
+
+        @param level_sub: the sub-level number
+        @type level_sub: int
+        @return: the sub-level or None if it isn't loaded yet or its file doesn't exist
+        @rtype: SubLevel
+        """
+        sub_level = self.sub_levels.get(level_sub)
+        if sub_level is not None:
+            return sub_level
+        future = self.pending.get(level_sub)
+        if future is None or not future.done():
+            return None
+        del self.pending[level_sub]
+        if future.cancelled() or future.exception() is not None:
+            return None
+        sub_level = future.result()
+        if sub_level is None:
+            self.missing.add(level_sub)
+            return None
+        self.store(sub_level)
+        return sub_level
+
+    def set_tile(self, level_sub: int, col: int, row: int, tile_id: int):
+        """
+        A function to change the tile of a cell in game. The change is kept even after the sub-level is let go of, so
+        it's still there when the sub-level is loaded again and it can be saved.
+
+        @param level_sub: the sub-level number
+        @type level_sub: int
+        @param col: the column of the cell
+        @type col: int
+        @param row: the row of the cell
+        @type row: int
+        @param tile_id: the new tile id of the cell
+        @type tile_id: int
+        @return: none
+        @rtype: none
+        """
+        # Replaced instead of changed, so a snapshot of the changes being saved in the background never changes
+        changes = dict(self.changes.get(level_sub, {}))
+        changes[row * TILES_WIDE + col] = tile_id
+        self.changes[level_sub] = changes
+        sub_level = self.sub_levels.get(level_sub)
+        if sub_level is not None:
+            sub_level.set_tile(col, row, tile_id)
+
+    def prefetch(self, level_subs: list):
+        """
+        A function to load sub-levels on the background worker so they're ready by the time they're asked for.
+
+        @param level_subs: the sub-level numbers to load, such as the ones next to the current sub-level
+        @type level_subs: list
+        @return: none
+        @rtype: none
+        """
+        # Keep the prefetches that finished so the worker isn't asked for them again
+        for level_sub, future in list(self.pending.items()):
+            if future.done():
+                del self.pending[level_sub]
+                if future.cancelled() or future.exception() is not None:
+                    continue
+                if future.result() is None:
+                    self.missing.add(level_sub)
+                else:
+                    self.store(future.result())
+        for level_sub in level_subs:
+            if level_sub in self.sub_levels or level_sub in self.pending or level_sub in self.missing:
+                continue
+            if self.executor is None:
+                self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+            self.pending[level_sub] = self.executor.submit(self.read_sub_level, level_sub)
+
+    def get_sprites(self, level_sub: int):
+        """
+        Accessor. Grab the tiles of a sub-level as sprites. See SubLevel.get_sprites().
+
+        @param level_sub: the sub-level number
+        @type level_sub: int
+        @return: a sprite for every cell with a tile, none if the sub-level doesn't exist
+        @rtype: pygame.sprite.Group
+        """
+        sub_level = self.get_sub_level(level_sub)
+        if sub_level is None:
+            return pygame.sprite.Group()
+        return sub_level.get_sprites(self.tileset)
+
+    def get_matrix(self):
+        """
+        Accessor. Grab the level matrix, a 2-d 'map' of the level where each spot is a sub-level number or '######'.
+
+        @return: the level matrix
+        @rtype: list
+        """
+        if self.matrix is None:
+            self.matrix = read_matrix(settings.DIR_LEVELS + '/Level_' + str(self.number) + '/level_matrix.lvl')
+        return self.matrix
+
+    def get_graph(self):
+        """
+        Accessor. Grab which sub-levels are next to each other, made from the level matrix the first time it's asked
+        for.
+
+        @return: the graph of the level's sub-levels
+        @rtype: LevelGraph
+        """
+        if self.graph is None:
+            self.graph = LevelGraph(self.get_matrix())
+        return self.graph
+
+    def get_sub_level_numbers(self):
+        """
+        Accessor. Grab the number of every sub-level in the compiled level.
+
+        @return: the sub-level numbers, none if the level wasn't compiled
+        @rtype: list
+        """
+        return sorted(self.offsets)
+
+    def close(self):
+        """
+        A function to stop the background worker and let go of the compiled level. Sub-levels that were already
+        loaded are kept.
+
+        @return: none
+        @rtype: none
+        """
+        if self.executor is not None:
+            self.executor.shutdown(wait=True, cancel_futures=True)
+            self.executor = None
+        self.pending = {}
+        if self.buffer is not None:
+            self.buffer.close()
+            self.buffer = None
+        self.offsets = {}
+
+    @classmethod
+    def load_compiled(cls, number: int, tileset: Tileset, file_location=None):
+        """
+        A function to open a compiled level. The file is memory mapped and only its header, matrix, and sub-level
+        table are read, the tile grids are copied out when each sub-level is loaded.
+
+        @param number: the level number
+        @type number: int
+        @param tileset: the tileset shared by every sub-level
+        @type tileset: Tileset
+        @param file_location: the file location of the compiled level, defaults to the level's folder
+        @type file_location: str
+        @return: the level
+        @rtype: Level
+        """
+        if file_location is None:
+            file_location = get_compiled_path(number)
+        with open(file_location, 'rb') as file:
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            if len(buffer) < COMPILED_HEADER.size:
+                raise ValueError('Compiled level is too short: ' + file_location)
+            magic, version, tileset_hash, checksum = COMPILED_HEADER.unpack_from(buffer, 0)
+            if magic != COMPILED_MAGIC or version != COMPILED_VERSION:
+                raise ValueError('Compiled level has an unknown format: ' + file_location)
+            if tileset_hash != tileset.hash:
+                raise ValueError('Compiled level was made with a different tileset: ' + file_location)
+            if zlib.crc32(memoryview(buffer)[COMPILED_HEADER.size:]) != checksum:
+                raise ValueError('Compiled level is corrupted: ' + file_location)
+            level = cls(number, tileset)
+            offset = COMPILED_HEADER.size
+            rows, cols = struct.unpack_from('<HH', buffer, offset)
+            offset += 4
+            cells = struct.unpack_from('<' + str(rows * cols) + 'H', buffer, offset)
+            offset += rows * cols * 2
+            level.matrix = [[MATRIX_EMPTY if cell == 0 else cell for cell in cells[row * cols:(row + 1) * cols]]
+                            for row in range(rows)]
+            count, = struct.unpack_from('<H', buffer, offset)
+            offset += 2
+            for _ in range(count):
+                level_sub, = struct.unpack_from('<H', buffer, offset)
+                level.offsets[level_sub] = offset + 2
+                offset += 2 + TILES_WIDE * TILES_HIGH
+                count_rects, = struct.unpack_from('<H', buffer, offset)
+                offset += 2 + count_rects * COMPILED_RECT.size
+            if offset > len(buffer):
+                raise ValueError('Compiled level is too short: ' + file_location)
+        except (ValueError, struct.error):
+            buffer.close()
+            raise
+        level.buffer = buffer
+        return level
+
+
+def merge_tiles(tiles: bytearray):
+    """
+    A function to merge the tiles of a sub-level into as few rectangles as it can, greedily. Each rectangle is grown as
+    wide as it can along its row and then down for as long as every tile under it is a wall, so a floor of 40 tiles
+    becomes one rectangle instead of 40.
+
+    @param tiles: the tile id of every cell, row by row
+    @type tiles: bytearray
+    @return: the column, row, width, and height, in tiles, of each rectangle
+    @rtype: list
+    """
+    merged = bytearray(len(tiles))  # Cells that are already part of a rectangle
+    rects = []
+    for row in range(TILES_HIGH):
+        for col in range(TILES_WIDE):
+            index = row * TILES_WIDE + col
+            if tiles[index] == TILE_EMPTY or merged[index]:
+                continue
+            width = 1
+            while col + width < TILES_WIDE and tiles[index + width] != TILE_EMPTY and not merged[index + width]:
+                width += 1
+            height = 1
+            while row + height < TILES_HIGH:
+                index_below = (row + height) * TILES_WIDE + col
+                if any(tiles[i] == TILE_EMPTY or merged[i] for i in range(index_below, index_below + width)):
+                    break
+                height += 1
+            for row_merged in range(row, row + height):
+                index_merged = row_merged * TILES_WIDE + col
+                merged[index_merged:index_merged + width] = b'\x01' * width
+            rects.append((col, row, width, height))
+    return rects
+
+
+def read_matrix(file_location: str):
+    """
+    A function to read a level matrix from its text file, rows of space separated sub-levels such as LVL1 or '######'.
+
+    @param file_location: the file location of the level matrix
+    @type file_location: str
+    @return: the level matrix, each spot is a sub-level number or '######'
+    @rtype: list
+    """
+    matrix = []
+    with open(file_location, 'r') as file:
+        for line in file:
+            row = []
+            for data in line.split(' '):
+                data = data.rstrip('\n')
+                if '#' not in data:
+                    data = int(data.strip('LVL'))
+                row.append(data)
+            matrix.append(row)
+    return matrix
+
+
+def get_compiled_path(level_number: int):
+    """
+    Accessor. Grab the file location of a compiled level.
+
+    @param level_number: the level number
+    @type level_number: int
+    @return: the file location of the compiled level
+    @rtype: str
+    """
+    return settings.DIR_LEVELS + '/Level_' + str(level_number) + '/' + COMPILED_FILE
+
+
+def compile_level(level_number: int, tileset: Tileset, file_location=None):
+    """
+    A function to compile the text files of a level, its level matrix and every Sub_Level_N.txt, into one file.
+
+    @param level_number: the level number
+    @type level_number: int
+    @param tileset: the tileset the tile codes belong to
+    @type tileset: Tileset
+    @param file_location: where to write the compiled level, defaults to the level's folder
+    @type file_location: str
+    @return: the file location of the compiled level
+    @rtype: str
+    """
+    if file_location is None:
+        file_location = get_compiled_path(level_number)
+    path_level = settings.DIR_LEVELS + '/Level_' + str(level_number)
+    matrix = read_matrix(path_level + '/level_matrix.lvl')
+    cols = max(len(row) for row in matrix) if matrix else 0
+    payload = bytearray(struct.pack('<HH', len(matrix), cols))
+    for row in matrix:
+        cells = [0 if cell == MATRIX_EMPTY else cell for cell in row] + [0] * (cols - len(row))
+        payload += struct.pack('<' + str(cols) + 'H', *cells)
+    numbers = sorted(int(file[len('Sub_Level_'):-len('.txt')]) for file in os.listdir(path_level)
+                     if file.startswith('Sub_Level_') and file.endswith('.txt')
+                     and file[len('Sub_Level_'):-len('.txt')].isdigit())
+    payload += struct.pack('<H', len(numbers))
+    for number in numbers:
+        sub_level = SubLevel.load(number, path_level + '/Sub_Level_' + str(number) + '.txt', tileset)
+        rects = sub_level.get_rects()
+        payload += struct.pack('<H', number) + sub_level.tiles + struct.pack('<H', len(rects))
+        for rect in rects:
+            payload += COMPILED_RECT.pack(*rect)
+    # Written to the side first so a game that is loading never sees half of a file
+    with open(file_location + '.tmp', 'wb') as file:
+        file.write(COMPILED_HEADER.pack(COMPILED_MAGIC, COMPILED_VERSION, tileset.hash, zlib.crc32(payload)))
+        file.write(payload)
+    os.replace(file_location + '.tmp', file_location)
+    logging.info('Compiled level %s with %s sub-levels.', level_number, len(numbers))
+    return file_location
+
+
+def is_compiled_current(level_number: int):
+    """
+    A function to check if a level's compiled file exists and is newer than every text file it's made from.
+
+    @param level_number: the level number
+    @type level_number: int
+    @return: whether the compiled level is up to date or not
+    @rtype: bool
+    """
+    path_compiled = get_compiled_path(level_number)
+    if not os.path.isfile(path_compiled):
+        return False
+    time_compiled = os.path.getmtime(path_compiled)
+    path_level = settings.DIR_LEVELS + '/Level_' + str(level_number)
+    for file in os.listdir(path_level):
+        if (file.startswith('Sub_Level_') or file == 'level_matrix.lvl') \
+                and os.path.getmtime(path_level + '/' + file) > time_compiled:
+            return False
+    return True
+
+
+def load_level(level_number: int, tileset: Tileset):
+    """
+    A function to open a level from its compiled file, compiling it first if the text files changed since. Falls back
+    to the text files if the level can't be compiled.
+
+    @param level_number: the level number
+    @type level_number: int
+    @param tileset: the tileset shared by every sub-level
+    @type tileset: Tileset
+    @return: the level
+    @rtype: Level
+    """
+    try:
+        if not is_compiled_current(level_number):
+            compile_level(level_number, tileset)
+        return Level.load_compiled(level_number, tileset)
+    except ValueError:
+        # Made with an older tileset or format, compile it again
+        try:
+            compile_level(level_number, tileset)
+            return Level.load_compiled(level_number, tileset)
+        except (OSError, ValueError, struct.error):
+            logging.error('* Error - Unable to compile level: %s.', level_number)
+    except (OSError, struct.error):
+        logging.error('* Error - Unable to compile level: %s.', level_number)
+    return Level(level_number, tileset)
+
+
+if __name__ == '__main__':
+    # Compile every level from its text files, run from the Engine folder
+    import json
+    logging.basicConfig(format='[Debug - Info]: %(message)s', level=logging.INFO)
+    with open(settings.FILE_TILESET, 'r') as file:
+        tileset_text = Tileset(json.load(file))
+    for item in sorted(os.listdir(settings.DIR_LEVELS)):
+        item_split = item.split('_', maxsplit=1)
+        if item_split[0] == 'Level' and item_split[1].isdigit():
+            compile_level(int(item_split[1]), tileset_text)
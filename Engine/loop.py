@@ -0,0 +1,226 @@
+# The loop module that handles the timing of the game and menu loops so the simulation runs at a fixed rate.
+# Tanner Fry
+# tefnq2@mst.edu
+import settings
+
+import collections
+import pygame
+import time
+
+
+class FrameStats(object):
+    """Class. Used to keep timing information about the most recent frames for debugging and profiling."""
+    def __init__(self, frames_kept=120):
+        """
+        Constructor. Used to initialize empty timing windows.
+
+        @param frames_kept: the number of most recent frames to average the timings over
+        @type frames_kept: int
+        """
+        self.frames = 0  # Total frames since the stats were created
+        self.ticks = 0  # Total simulation ticks since the stats were created
+        self.ticks_dropped = 0  # Total simulation ticks skipped because the engine fell too far behind
+        self.times_draw = collections.deque(maxlen=frames_kept)  # Milliseconds spent drawing each frame
+        self.times_frame = collections.deque(maxlen=frames_kept)  # Milliseconds between each frame
+        self.times_update = collections.deque(maxlen=frames_kept)  # Milliseconds spent simulating each frame
+        self.ticks_frame = collections.deque(maxlen=frames_kept)  # Simulation ticks that were run each frame
+
+    def record(self, time_frame: float, time_update: float, time_draw: float, ticks: int):
+        """
+        A function to record the timings of one frame.
+
+        @param time_frame: the milliseconds since the last frame
+        @type time_frame: float
+        @param time_update: the milliseconds spent running simulation ticks
+        @type time_update: float
+        @param time_draw: the milliseconds spent drawing
+        @type time_draw: float
+        @param ticks: the number of simulation ticks that were run
+        @type ticks: int
+        @return: none
+        @rtype: none
+        """
+        self.frames += 1
+        self.ticks += ticks
+        self.times_draw.append(time_draw)
+        self.times_frame.append(time_frame)
+        self.times_update.append(time_update)
+        self.ticks_frame.append(ticks)
+
+    @staticmethod
+    def average(values: collections.deque):
+        """
+        A function to average a window of timings.
+
+        @param values: the timings to average
+        @type values: collections.deque
+        @return: the average of the timings or 0 if there aren't any yet
+        @rtype: float
+        """
+        if len(values) == 0:
+            return 0.0
+        return sum(values) / len(values)
+
+    def get_fps(self):
+        """
+        Accessor. Grab the average frames per second over the recent frames.
+
+        @return: the frames per second
+        @rtype: float
+        """
+        time_frame = self.average(self.times_frame)
+        if time_frame == 0:
+            return 0.0
+        return 1000 / time_frame
+
+    def get_report(self):
+        """
+        Accessor. Grab a one line summary of the recent frame timings.
+
+        @return: the summary of the frame timings
+        @rtype: str
+        """
+        return 'FPS: %.1f  Frame: %.2f ms  Update: %.2f ms  Draw: %.2f ms  Ticks: %.2f' \
+               % (self.get_fps(), self.average(self.times_frame), self.average(self.times_update),
+                  self.average(self.times_draw), self.average(self.ticks_frame))
+
+
+class LoopScheduler(object):
+    """
+    Class. Used to run the simulation at a fixed tick rate no matter how fast the computer draws frames. Every frame
+    the time since the last frame is banked and spent on as many fixed ticks as it covers, the leftover fraction of a
+    tick is handed to the draw function so moving sprites can be drawn between their last two positions, and the clock
+    limits how many frames are drawn per second.
+    """
+    def __init__(self, tick_rate=None, fps=None, tick_max_per_frame=None):
+        """
+        Constructor. Used to set up the rates of the loop, defaulting to the ones in the settings.
+
+        @param tick_rate: the number of simulation ticks per second
+        @type tick_rate: int
+        @param fps: the most frames drawn per second, 0 for no limit
+        @type fps: int
+        @param tick_max_per_frame: the most ticks run in one frame before the engine gives up on catching up
+        @type tick_max_per_frame: int
+        """
+        self.accumulator = 0.0  # Seconds banked that haven't been spent on ticks yet
+        self.alpha = 0.0  # How far, from 0 to 1, the frame is between the last tick and the next one
+        self.clock = pygame.time.Clock()
+        self.fps = settings.FPS if fps is None else fps
+        self.stats = FrameStats()
+        self.tick_max_per_frame = settings.TICK_MAX_PER_FRAME if tick_max_per_frame is None else tick_max_per_frame
+        self.tick_rate = settings.TICK_RATE if tick_rate is None else tick_rate
+        self.tick_time = 1 / self.tick_rate  # Seconds of game time that pass every tick
+        self.ticks = 0  # Total ticks run, the simulation's notion of time
+
+    def reset(self):
+        """
+        A function to throw away banked time, such as after loading, so the simulation doesn't race to catch up.
+
+        @return: none
+        @rtype: none
+        """
+        self.accumulator = 0.0
+        self.alpha = 0.0
+        self.clock.tick()
+
+    def run_frame(self, function_tick, function_draw, function_frame=None):
+        """
+        A function to run one frame of the loop, a number of fixed ticks followed by one draw.
+
+        @param function_tick: the function that advances the simulation by exactly one tick
+        @type function_tick: function
+        @param function_draw: the function that draws the frame, given how far the frame is between two ticks
+        @type function_draw: function
+        @param function_frame: the function called once a frame, after frame limiting and before the ticks, or None
+        @type function_frame: function
+        @return: the number of ticks that were run
+        @rtype: int
+        """
+        # Frame limiting, this sleeps instead of spinning so the cpu isn't pinned
+        time_frame = self.clock.tick(self.fps)
+        # Never bank more than the maximum ticks worth of time, like after a long load or a dragged window
+        self.accumulator += min(time_frame / 1000, self.tick_time * self.tick_max_per_frame)
+        if function_frame is not None:
+            function_frame()
+        ticks = 0
+        time_start = time.perf_counter()
+        while self.accumulator >= self.tick_time and ticks < self.tick_max_per_frame:
+            function_tick()
+            self.accumulator -= self.tick_time
+            self.ticks += 1
+            ticks += 1
+        if self.accumulator >= self.tick_time:
+            # Too far behind, drop the ticks rather than spiraling further behind every frame
+            self.stats.ticks_dropped += int(self.accumulator / self.tick_time)
+            self.accumulator %= self.tick_time
+        time_update = time.perf_counter() - time_start
+        self.alpha = self.accumulator / self.tick_time
+        time_start = time.perf_counter()
+        function_draw(self.alpha)
+        time_draw = time.perf_counter() - time_start
+        self.stats.record(time_frame, time_update * 1000, time_draw * 1000, ticks)
+        return ticks
+
+
+class SpriteInterpolator(object):
+    """
+    Class. Used to draw sprites between their positions of the last two ticks so movement looks smooth even when the
+    number of frames drawn doesn't line up with the number of ticks.
+    """
+    def __init__(self, distance_max=settings.TILE_SIZE * 4):
+        """
+        Constructor. Used to initialize empty position records.
+
+        @param distance_max: moving further than this in one tick is treated as a teleport and isn't interpolated
+        @type distance_max: int
+        """
+        self.distance_max = distance_max
+        self.positions_previous = {}  # Sprite -> position at the start of the latest tick
+        self.positions_current = {}  # Sprite -> real position, held while the sprite is drawn at a blended one
+
+    def snapshot(self, sprites: pygame.sprite.Group):
+        """
+        A function to remember where every sprite is before a tick moves them.
+
+        @param sprites: the sprites that will be interpolated
+        @type sprites: pygame.sprite.Group
+        @return: none
+        @rtype: none
+        """
+        self.positions_previous = {sprite: sprite.rect.topleft for sprite in sprites}
+
+    def apply(self, sprites: pygame.sprite.Group, alpha: float):
+        """
+        A function to move every sprite to the blend of its previous and current positions for drawing.
+
+        @param sprites: the sprites that will be drawn
+        @type sprites: pygame.sprite.Group
+        @param alpha: how far, from 0 to 1, the frame is between the previous tick and the current one
+        @type alpha: float
+        @return: none
+        @rtype: none
+        """
+        self.positions_current = {}
+        for sprite in sprites:
+            position_previous = self.positions_previous.get(sprite)
+            if position_previous is None:
+                continue
+            x, y = sprite.rect.topleft
+            if abs(x - position_previous[0]) > self.distance_max or abs(y - position_previous[1]) > self.distance_max:
+                continue
+            self.positions_current[sprite] = (x, y)
+            # Alpha of 1 is the current position, the frame is drawn one tick behind the simulation
+            sprite.rect.topleft = (round(position_previous[0] + (x - position_previous[0]) * alpha),
+                                   round(position_previous[1] + (y - position_previous[1]) * alpha))
+
+    def restore(self):
+        """
+        A function to put every sprite back at its real position after drawing.
+
+        @return: none
+        @rtype: none
+        """
+        for sprite, position in self.positions_current.items():
+            sprite.rect.topleft = position
+        self.positions_current = {}
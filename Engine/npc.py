@@ -1,9 +1,22 @@
 # The npc module that handles specific events, actions, and information from the game in relation to npcs.
 # Tanner Fry
 # tefnq2@mst.edu
+import animations
+import collision
+import level
+import physics
 import settings
 
+import heapq
+import logging
+import math
 import pygame
+import time
+
+try:
+    import numpy
+except ImportError:
+    numpy = None  # Only needed for crowds, see NPCCrowd
 
 
 class NPCHandler(object):
@@ -16,8 +29,14 @@ class NPCHandler(object):
         @type engine_game: object
         """
         self.active_npcs = []
+        self.crowds = {}  # Sub-level number -> NPCCrowd of the simple npcs living in it
+        self.distances = {}  # Sub-level number -> distance from the current sub-level, for the simulated ones
         self.engine_game = engine_game
         self.max_npcs = 25
+        # A seeded game is being recorded or replayed, so every npc that's due thinks instead of as many as fit in the
+        # time budget, which would change from one run to the next
+        self.scheduler = AIScheduler(settings.NPC_AI_BUDGET_MS if engine_game.seed is None else None)
+        self.ticks = 0  # Ticks since the handler was made, used to fast forward frozen crowds
 
     def handler_cycle(self):
         """
@@ -27,9 +46,124 @@ class NPCHandler(object):
         @return: none
         @rtype: none
         """
+        self.ticks += 1
+        self.handle_crowds()
+        self.handle_thinking()
         # Test any other npc extremities
         self.test_reached_npc_capacity()
 
+    def handle_crowds(self):
+        """
+        A function to simulate each crowd as closely as its distance from the current sub-level needs. The crowd of
+        the current sub-level is fully simulated every tick, crowds of nearby sub-levels are moved coarsely every few
+        ticks once their sub-level is loaded, and crowds further away are frozen and fast forwarded when they come back
+        into range.
+
+        @return: none
+        @rtype: none
+        """
+        level_tiles = self.engine_game.level_tiles
+        distances = level_tiles.get_graph().get_distances(self.engine_game.level_sub_current,
+                                                          settings.NPC_LOD_DISTANCE_COARSE)
+        self.distances = distances
+        coarse_due = self.ticks % settings.NPC_LOD_COARSE_INTERVAL == 0
+        for level_sub, crowd in self.crowds.items():
+            distance = distances.get(level_sub)
+            if distance is None:
+                if crowd.frozen_tick is None:
+                    crowd.freeze(self.ticks)
+                continue
+            if distance == 0:
+                sub_level = level_tiles.get_sub_level(level_sub)
+            else:
+                # Reading a nearby sub-level here would hold up the frame, so its crowd waits, frozen, until it's
+                # prefetched
+                sub_level = level_tiles.get_loaded_sub_level(level_sub)
+                if sub_level is None:
+                    if crowd.frozen_tick is None:
+                        crowd.freeze(self.ticks)
+                    continue
+            if crowd.frozen_tick is not None:
+                crowd.thaw(sub_level, self.ticks)
+            if distance == 0:
+                crowd.tick(sub_level)
+            elif coarse_due:
+                crowd.tick_coarse(sub_level, settings.NPC_LOD_COARSE_INTERVAL)
+
+    def start_frame(self):
+        """
+        A function to give npc thinking a new share of time, called once at the start of every frame before its ticks.
+
+        @return: none
+        @rtype: none
+        """
+        self.scheduler.start_frame()
+
+    def handle_thinking(self):
+        """
+        A function to let the npcs that need to think do so, as many as fit in what's left of the frame's time budget.
+
+        @return: none
+        @rtype: none
+        """
+        thinkers = [npc for npc in self.active_npcs if npc.is_thinking_due()]
+        thinkers.extend(crowd for crowd in self.crowds.values() if crowd.is_thinking_due())
+        if len(thinkers) > 0:
+            self.scheduler.run(thinkers, self.get_distance)
+
+    def get_distance(self, thinker):
+        """
+        Accessor. Grab how far an npc or crowd is from the character. A crowd is a screen width away for every
+        sub-level between it and the current sub-level.
+
+        @param thinker: the npc or crowd
+        @type thinker: object
+        @return: the distance in pixels
+        @rtype: float
+        """
+        if isinstance(thinker, NPCCrowd):
+            return self.distances.get(thinker.level_sub, 0) * settings.SCREEN_WIDTH
+        rect_character = self.engine_game.character.rect
+        return math.hypot(thinker.rect.centerx - rect_character.centerx, thinker.rect.centery - rect_character.centery)
+
+    def spawn_crowd(self, level_sub: int, count: int):
+        """
+        A function to add simple npcs, spread across the top of a sub-level, to the sub-level's crowd.
+
+        @param level_sub: the sub-level the npcs live in
+        @type level_sub: int
+        @param count: the number of npcs to add
+        @type count: int
+        @return: the crowd of the sub-level or None if crowds can't be used
+        @rtype: NPCCrowd
+        """
+        if numpy is None:
+            logging.error('* Error - Crowds need numpy installed.')
+            return None
+        crowd = self.crowds.get(level_sub)
+        if crowd is None:
+            crowd = NPCCrowd(level_sub, None if self.engine_game.seed is None else (self.engine_game.seed, level_sub))
+            self.crowds[level_sub] = crowd
+        for x in numpy.linspace(0, settings.SCREEN_WIDTH - crowd.width, count):
+            crowd.add(x, 0)
+        return crowd
+
+    def draw(self, screen: pygame.Surface, alpha=1.0):
+        """
+        A function to draw the crowd of the current sub-level.
+
+        @param screen: the surface that holds all of the menu and game images/pixels
+        @type screen: pygame.Surface
+        @param alpha: how far, from 0 to 1, the frame is between the last two ticks, used to smooth movement
+        @type alpha: float
+        @return: the areas that were drawn over
+        @rtype: list
+        """
+        crowd = self.crowds.get(self.engine_game.level_sub_current)
+        if crowd is None:
+            return []
+        return crowd.draw(screen, alpha)
+
     def test_reached_npc_capacity(self):
         """
         A function that calculates whether or not the current list of active npcs is above or below the desired
@@ -42,10 +176,75 @@ class NPCHandler(object):
             print('[Debug - Error]: There are over 25 active NPCS. '
                   'There shouldn\'t be that many yet. '
                   'Check NPCHandler() class in npc.py.')
-            # TODO: Determine a way to reduce the npc count based on priority
+            # NOTE: Thinking stays within the scheduler's budget either way, the furthest npcs just think less often
+
+
+class AIScheduler(object):
+    """
+    Class. Used to give npc thinking a share of every frame. The npcs that need to think are queued nearest and most
+    important first and only as many as fit in the time budget think, the rest wait for a later frame. The budget is
+    shared by every tick of a frame, so a frame that runs several ticks to catch up doesn't think several times as
+    long. The longer an npc waits the further up the queue it starts, so npcs far from the character still get their
+    turn.
+    """
+    def __init__(self, budget_ms: float):
+        """
+        Constructor. Used to set up an empty schedule.
+
+        @param budget_ms: the milliseconds of every frame npcs can spend thinking, or None for no limit
+        @type budget_ms: float
+        """
+        self.budget_ms = budget_ms
+        self.deadline = None  # When the frame's budget runs out, None for no limit, see start_frame()
+        self.thought_frame = 0  # Npcs that thought so far this frame
+        self.thought_last = 0  # Npcs that thought in the last run, for debugging
+        self.waiting = {}  # Npc or crowd -> frames it's been waiting to think
 
+    def start_frame(self):
+        """
+        A function to start the budget of a new frame. The npcs left waiting by the last frame have waited one more.
+
+        @return: none
+        @rtype: none
+        """
+        self.deadline = None if self.budget_ms is None else time.perf_counter() + self.budget_ms / 1000
+        self.thought_frame = 0
+        self.waiting = {thinker: waited + 1 for thinker, waited in self.waiting.items()}
 
-class NPCSquishy(pygame.sprite.Sprite):
+    def run(self, thinkers: list, get_distance):
+        """
+        A function to let the most urgent npcs think until the frame's budget is spent, called every tick. The most
+        urgent npc always thinks in the first run of a frame so nothing waits forever on a budget that's too small.
+
+        @param thinkers: every npc or crowd that needs to think, each with think() and an importance
+        @type thinkers: list
+        @param get_distance: the function that grabs how far an npc or crowd is from the character
+        @type get_distance: function
+        @return: the number of npcs or crowds that thought
+        @rtype: int
+        """
+        deadline = self.deadline
+        queue = []
+        for order, thinker in enumerate(thinkers):
+            waited = self.waiting.get(thinker, 0)
+            priority = get_distance(thinker) / thinker.importance - waited * settings.NPC_AI_AGING
+            # The order breaks ties so thinkers themselves are never compared
+            queue.append((priority, order, thinker))
+        heapq.heapify(queue)
+        thought = 0
+        while len(queue) > 0:
+            if self.thought_frame > 0 and deadline is not None and time.perf_counter() >= deadline:
+                break
+            thinker = heapq.heappop(queue)[2]
+            thinker.think()
+            thought += 1
+            self.thought_frame += 1
+        self.waiting = {thinker: self.waiting.get(thinker, 0) for _, _, thinker in queue}
+        self.thought_last = thought
+        return thought
+
+
+class NPCSquishy(physics.PhysicsSprite):
     """
     Class. Creates an overall object to handle all interactions for a given npc.
 
@@ -67,12 +266,15 @@ class NPCSquishy(pygame.sprite.Sprite):
         """
         self.engine_game = engine_game
         self.groups = engine_game.sprites_important
-        pygame.sprite.Sprite.__init__(self, self.groups)
+        physics.PhysicsSprite.__init__(self, self.groups)
         self.name = name
+        self.aggro = False  # Whether the npc has seen the character
         self.health = 20
+        self.importance = 1  # How much sooner than others at the same distance the npc gets to think
         self.state = 'None'
         self.state_changed = False  # Used to clear images list and change animation. Code clarity
         self.direction = ''
+        self.climbing = False  # NPCs can't climb yet
         self.falling = True  # NPC can take damage as well
         self.jumping = False  # Npc can try and get to higher places to reach character
         self.x_velocity = 0
@@ -80,9 +282,9 @@ class NPCSquishy(pygame.sprite.Sprite):
 
         # Animation inits
         self.flipped_visually = False
-        self.images = []
-        self.images.append(pygame.image.load(settings.DIR_SPRITES_NPC
-                                             + '/Squishy/Idle/Sprite_NPC_Base_96_Trimmed_Idle.png').convert_alpha())
+        self.animations = animations.library.load_sprite('NPC_Squishy')
+        self.frame_set = self.animations['None']
+        self.images = self.frame_set.get_frames('Right')
         self.image_index = 0
         self.image = self.images[self.image_index]
         self.rect = self.image.get_rect()
@@ -93,6 +295,7 @@ class NPCSquishy(pygame.sprite.Sprite):
         # Timers
         self.timer_images = 0
         self.timer_images_trigger = 0
+        self.timer_think = 0  # Ticks since the npc last thought
 
     def handle_events(self):
         """
@@ -103,7 +306,31 @@ class NPCSquishy(pygame.sprite.Sprite):
         @rtype: none
         """
         # keys_pressed = pygame.key.get_pressed()
-        # Handle interactions by possibly having a "view" distance and then aggro'ing after found
+        # Handle interactions by possibly having a "view" distance and then aggro'ing after found, see think()
+
+    def is_thinking_due(self):
+        """
+        Accessor. Grab whether the npc has gone long enough without thinking.
+
+        @return: whether the npc should think
+        @rtype: bool
+        """
+        return self.timer_think >= settings.NPC_AI_THINK_INTERVAL
+
+    def think(self):
+        """
+        A function for the npc to look for the character and face it once it's close enough to be seen. Called by the
+        handler's scheduler when there's time for it.
+
+        @return: none
+        @rtype: none
+        """
+        self.timer_think = 0
+        rect_character = self.engine_game.character.rect
+        x_distance = rect_character.centerx - self.rect.centerx
+        self.aggro = math.hypot(x_distance, rect_character.centery - self.rect.centery) <= settings.NPC_VIEW_DISTANCE
+        if self.aggro and x_distance != 0:
+            self.direction = 'Right' if x_distance > 0 else 'Left'
 
     def check_state(self):
         """
@@ -129,80 +356,10 @@ class NPCSquishy(pygame.sprite.Sprite):
         if self.state_changed:
             print('State changed from:', state_old, 'to', self.state)
             # Reset values since we are changing animations
-            self.images.clear()
             self.image_index = 0
             self.state_changed = False
             self.timer_images = 0
-            # TODO: A work around at the moment below
-            if self.state == 'Idle':
-                for i in range(1, 3):
-                    self.images.append(pygame.image.load(settings.DIR_SPRITES_NPC
-                                                         + '/Squishy/Breathing/Sprite_NPC_Base_96_Trimmed_Breathing' + str(i)
-                                                         + '.png').convert_alpha())
-            elif self.state == 'Running':
-                for i in range(1, 7):
-                    self.images.append(pygame.image.load(settings.DIR_SPRITES_NPC
-                                                         + '/Squishy/Running/Sprite_NPC_Base_96_Trimmed_Running' + str(i)
-                                                         + '.png').convert_alpha())
-
-    def check_npc(self):
-        """
-        Check and update npc variables based on their state, traits, and velocity based on engine physics.
-
-        @return: none
-        @rtype: none
-        """
-        # TODO: Below
-        # Check if an enemy is near, if so lets focus otherwise random movement
-
-        # Check states
-        if self.jumping:
-            self.falling = False
-            self.rect.y -= self.y_velocity
-            self.y_velocity = self.y_velocity - settings.GRAVITY
-            if self.y_velocity < 0:
-                self.falling = True
-                self.jumping = False
-                self.y_velocity = 0
-            # Apply air resistance
-            # if self.x_velocity > 0:
-            #     self.x_velocity -= settings.AIR_RESISTANCE
-            # elif self.x_velocity < 0:
-            #     self.x_velocity += settings.AIR_RESISTANCE
-        elif self.falling is True:
-            self.jumping = False
-            self.rect.y += self.y_velocity
-            self.y_velocity = self.y_velocity + settings.GRAVITY
-            # Apply air resistance
-            # if self.x_velocity > 0:
-            #     self.x_velocity -= settings.AIR_RESISTANCE
-            # elif self.x_velocity < 0:
-            #     self.x_velocity += settings.AIR_RESISTANCE
-
-        if self.jumping is False and self.falling is False:
-            self.y_velocity = 0
-
-            # Apply friction and air resistance
-            if self.x_velocity > 0:
-                # Apply friction
-                if self.falling is False and self.jumping is False:
-                    self.x_velocity -= settings.FRICTION
-                # Apply air resistance
-                elif self.falling is True:
-                    self.x_velocity -= settings.AIR_RESISTANCE
-                if self.x_velocity <= 0.4:
-                    self.x_velocity = 0
-            elif self.x_velocity < 0:
-                # Apply friction
-                if self.falling is False and self.jumping is False:
-                    self.x_velocity += settings.FRICTION
-                # Apply air resistance
-                elif self.falling is True:
-                    self.x_velocity += settings.AIR_RESISTANCE
-                if self.x_velocity >= -0.4:
-                    self.x_velocity = 0
-            # Update character
-            self.rect.x += self.x_velocity
+            self.frame_set = self.animations.get(self.state, self.frame_set)
 
     def check_collision(self):
         """
@@ -212,68 +369,11 @@ class NPCSquishy(pygame.sprite.Sprite):
         @return: none
         @rtype: none
         """
-        wall_hit_list = pygame.sprite.spritecollide(self, self.engine_game.sprites_active_walls, False)
+        # Only the tiles under the npc are checked
+        wall_hit_list = self.engine_game.collision_layer.query(self.rect)
 
         if len(wall_hit_list) > 0:
-            for wall in wall_hit_list:
-                # Check falling/walking into a wall from above
-                if self.rect.collidepoint(wall.rect.midtop):
-                    self.rect.bottom = wall.rect.top + 1  # 1 works perfectly
-                    self.falling = False
-                # Check falling into corner, lets clip through it
-                if self.rect.collidepoint(wall.rect.topleft) and not self.rect.collidepoint(
-                        wall.rect.midleft) and self.falling is True:
-                    pass
-                # Check falling into corner, lets clip through it
-                if self.rect.collidepoint(wall.rect.topright) and not self.rect.collidepoint(
-                        wall.rect.midright) and self.falling is True:
-                    pass
-                # Check hitting into a wall from above-left
-                if self.rect.collidepoint(wall.rect.topleft) and not self.rect.collidepoint(wall.rect.midleft) \
-                        and self.falling is False:
-                    # Check if character is close to the corner of above-left and not trying to hang/climb down
-                    # TODO: Create the ability for the character to hang on the tile if they are at an edge to hang on whether left or right
-                    # TODO: NOTE - This could get intensive as it requires a function to determine if the character is at an edge.
-                    self.rect.bottom = wall.rect.top + 1  # 1 works perfectly
-                    self.falling = False
-                # Check hitting into a wall from above-right
-                if self.rect.collidepoint(wall.rect.topright) and not self.rect.collidepoint(wall.rect.midright) \
-                        and self.falling is False:
-                    # Check if character is close to the corner of above-right and not trying to hang/climb down
-                    # TODO: Create the ability for the character to hang on the tile if they are at an edge to hang on
-                    self.rect.bottom = wall.rect.top + 1  # 1 works perfectly
-                    self.falling = False
-                # Check hitting into a wall from the left
-                if self.rect.collidepoint(wall.rect.midleft):
-                    # Make sure new y velocity won't collide when going up
-                    if self.rect.collidepoint(wall.rect.bottomright) or self.rect.collidepoint(wall.rect.midbottom):
-                        self.rect.top = wall.rect.bottom + 1
-                    elif self.rect.collidepoint(wall.rect.topright) or self.rect.collidepoint(wall.rect.midtop):
-                        self.rect.bottom = wall.rect.top - 1
-                    if not self.rect.collidepoint(wall.rect.midtop):
-                        self.falling = True
-                    # Check if movement would have went through wall
-                    if self.rect.x + self.rect.width >= wall.rect.x:
-                        self.rect.right = wall.rect.left + 1
-                # Check hitting into a wall from the right
-                elif self.rect.collidepoint(wall.rect.midright):
-                    # Make sure new y velocity won't collide when going up
-                    if self.rect.collidepoint(wall.rect.bottomleft) or self.rect.collidepoint(wall.rect.midbottom):
-                        self.rect.top = wall.rect.bottom + 1
-                    elif self.rect.collidepoint(wall.rect.topleft) or self.rect.collidepoint(wall.rect.midtop):
-                        self.rect.bottom = wall.rect.top - 1
-                    if not self.rect.collidepoint(wall.rect.midtop):
-                        self.falling = True
-                    # Check if movement would have went through wall
-                    if self.rect.x <= wall.rect.x + wall.rect.width:
-                        self.rect.left = wall.rect.right - 1
-                # Check hitting into a wall from below
-                if self.rect.collidepoint(wall.rect.midbottom):
-                    self.y_velocity = 0
-                    self.rect.top = wall.rect.bottom + 1
-                    if not self.rect.collidepoint(
-                            wall.rect.midtop) and self.falling is False:
-                        self.falling = True
+            collision.resolve_walls(self, wall_hit_list)
         # Check if not touching anything
         else:
             # Not doing anything
@@ -290,22 +390,20 @@ class NPCSquishy(pygame.sprite.Sprite):
         @rtype: none
         """
         self.timer_images += 1
-        if self.state == 'Idle':
-            self.timer_images_trigger = 6
-        elif self.state == 'Running':
-            self.timer_images_trigger = 10
+        # The speed of each state comes from the animation table
+        if self.frame_set.get_speed() is not None:
+            self.timer_images_trigger = self.frame_set.get_speed()
         # Change animation image
         if self.timer_images >= self.timer_images_trigger:
             self.timer_images = 0
             # Make sure index isn't out of range
-            if self.image_index == len(self.images) - 1:
+            self.images = self.frame_set.get_frames(self.direction)
+            if self.image_index >= len(self.images) - 1:
                 self.image_index = 0
             else:
                 self.image_index += 1
-            # Set image and check direction, flip accordingly
+            # Set image, the frames facing left were flipped when they were loaded
             self.image = self.images[self.image_index]
-            if self.direction == 'Left':
-                self.image = pygame.transform.flip(self.image, True, False)
 
     def update(self):
         """
@@ -316,12 +414,506 @@ class NPCSquishy(pygame.sprite.Sprite):
         """
         # Check which animation to use
         self.check_state()
+        self.timer_think += 1
 
-        # Check and update npc variables
-        self.check_npc()
+        # TODO: Check if an enemy is near, if so lets focus otherwise random movement
+        # NOTE: The npc was already moved by physics.step() along with everything else
 
         # Check collisions with new updates
         self.check_collision()
 
         # Recheck and run animation
         self.check_animation()
+
+
+class NPCCrowd(object):
+    """
+    Class. Used to simulate many simple npcs at once. Instead of a sprite per npc, every npc is an entry in the same
+    numpy arrays, so moving, colliding, deciding, and animating the whole crowd is a handful of array operations per
+    tick and drawing it is one batched blit.
+    """
+    # States, the index of each state's frames in self.frames
+    STATE_IDLE = 0
+    STATE_RUNNING = 1
+    STATES = ('Idle', 'Running')
+
+    def __init__(self, level_sub=None, seed=None, capacity=64):
+        """
+        Constructor. Used to create an empty crowd.
+
+        @param level_sub: the sub-level the crowd lives in
+        @type level_sub: int
+        @param seed: the seed of the crowd's decisions, or None for different decisions every game
+        @type seed: object
+        @param capacity: the number of npcs the arrays start with room for, they grow when they're full
+        @type capacity: int
+        """
+        frame_sets = animations.library.load_sprite('NPC_Squishy')
+        # State -> (frames facing right, frames facing left)
+        self.frames = [(frame_sets[state].get_frames('Right'), frame_sets[state].get_frames('Left'))
+                       for state in self.STATES]
+        self.frames_count = numpy.array([len(frame_sets[state]) for state in self.STATES])
+        self.frames_speed = numpy.array([frame_sets[state].get_speed() for state in self.STATES])
+        self.width, self.height = self.frames[self.STATE_IDLE][0][0].get_size()
+        self.count = 0
+        self.frozen_tick = None  # The handler's tick the crowd was frozen on, None while it's simulated
+        self.importance = 1  # How much sooner than others at the same distance the crowd gets to think
+        self.level_sub = level_sub
+        self.random = numpy.random.default_rng(seed)
+        self.speed = 4  # Horizontal velocity of a running npc
+        self.allocate(capacity)
+
+    def allocate(self, capacity: int):
+        """
+        A function to make room in the arrays for more npcs, keeping the ones already in the crowd.
+
+        @param capacity: the number of npcs to make room for
+        @type capacity: int
+        @return: none
+        @rtype: none
+        """
+        def grow(array, dtype):
+            array_new = numpy.zeros(capacity, dtype=dtype)
+            if array is not None:
+                array_new[:self.count] = array[:self.count]
+            return array_new
+        self.capacity = capacity
+        self.x = grow(getattr(self, 'x', None), float)
+        self.y = grow(getattr(self, 'y', None), float)
+        self.x_previous = grow(getattr(self, 'x_previous', None), float)  # Position at the start of the last tick
+        self.y_previous = grow(getattr(self, 'y_previous', None), float)
+        self.x_velocity = grow(getattr(self, 'x_velocity', None), float)
+        self.y_velocity = grow(getattr(self, 'y_velocity', None), float)
+        self.climbing = grow(getattr(self, 'climbing', None), bool)  # Crowds can't climb, kept for the physics
+        self.falling = grow(getattr(self, 'falling', None), bool)
+        self.jumping = grow(getattr(self, 'jumping', None), bool)
+        self.direction = grow(getattr(self, 'direction', None), numpy.int8)  # 1 facing right, -1 facing left
+        self.running = grow(getattr(self, 'running', None), bool)  # Whether the npc decided to run
+        self.state = grow(getattr(self, 'state', None), numpy.int8)
+        self.image_index = grow(getattr(self, 'image_index', None), numpy.int16)
+        self.timer_decide = grow(getattr(self, 'timer_decide', None), numpy.int16)  # Ticks until the next decision
+        self.timer_images = grow(getattr(self, 'timer_images', None), numpy.int16)
+
+    def __len__(self):
+        return self.count
+
+    def add(self, x: float, y: float):
+        """
+        A function to add an npc to the crowd, falling until it lands on something.
+
+        @param x: the horizontal location of the npc
+        @type x: float
+        @param y: the vertical location of the npc
+        @type y: float
+        @return: the index of the npc in the arrays
+        @rtype: int
+        """
+        if self.count == self.capacity:
+            self.allocate(self.capacity * 2)
+        i = self.count
+        self.count += 1
+        self.x[i] = self.x_previous[i] = x
+        self.y[i] = self.y_previous[i] = y
+        self.x_velocity[i] = 0
+        self.y_velocity[i] = 0
+        self.climbing[i] = False
+        self.falling[i] = True
+        self.jumping[i] = False
+        self.direction[i] = 1
+        self.running[i] = False
+        self.state[i] = self.STATE_IDLE
+        self.image_index[i] = 0
+        self.timer_decide[i] = self.random.integers(1, 60)
+        self.timer_images[i] = 0
+        return i
+
+    def get_grid(self, sub_level):
+        """
+        Accessor. Grab the tiles of a sub-level as a grid of rows and columns.
+
+        @param sub_level: the sub-level whose tiles the npcs collide with, or None for no walls
+        @type sub_level: level.SubLevel
+        @return: the tile id of every cell, indexed by row then column
+        @rtype: numpy.ndarray
+        """
+        if sub_level is None:
+            return numpy.zeros((level.TILES_HIGH, level.TILES_WIDE), dtype=numpy.uint8)
+        # A view of the sub-level's tiles, nothing is copied
+        return numpy.frombuffer(sub_level.tiles, dtype=numpy.uint8).reshape(level.TILES_HIGH, level.TILES_WIDE)
+
+    def is_solid(self, grid, cols, rows):
+        """
+        A function to check many cells of a grid at once. Cells off the grid are empty.
+
+        @param grid: the tiles of the sub-level, see get_grid()
+        @type grid: numpy.ndarray
+        @param cols: the column of each cell
+        @type cols: numpy.ndarray
+        @param rows: the row of each cell
+        @type rows: numpy.ndarray
+        @return: whether each cell has a tile
+        @rtype: numpy.ndarray
+        """
+        solid = numpy.zeros(len(cols), dtype=bool)
+        inside = (cols >= 0) & (cols < level.TILES_WIDE) & (rows >= 0) & (rows < level.TILES_HIGH)
+        solid[inside] = grid[rows[inside], cols[inside]] != level.TILE_EMPTY
+        return solid
+
+    def is_blocked(self, grid, cols, y):
+        """
+        A function to check whether a column has a tile anywhere from each npc's head down to just above the floor
+        it's sunk into.
+
+        @param grid: the tiles of the sub-level, see get_grid()
+        @type grid: numpy.ndarray
+        @param cols: the column to check for each npc
+        @type cols: numpy.ndarray
+        @param y: the vertical location of each npc
+        @type y: numpy.ndarray
+        @return: whether each npc would be in a tile
+        @rtype: numpy.ndarray
+        """
+        blocked = numpy.zeros(len(cols), dtype=bool)
+        for offset in list(range(0, self.height - 2, settings.TILE_SIZE)) + [self.height - 2]:
+            blocked |= self.is_solid(grid, cols, ((y + offset) // settings.TILE_SIZE).astype(int))
+        return blocked
+
+    def is_floor(self, grid, x, rows):
+        """
+        A function to check whether a row has a tile anywhere under each npc's feet, from its left edge to its right.
+
+        @param grid: the tiles of the sub-level, see get_grid()
+        @type grid: numpy.ndarray
+        @param x: the horizontal location of each npc
+        @type x: numpy.ndarray
+        @param rows: the row to check for each npc
+        @type rows: numpy.ndarray
+        @return: whether each npc would be standing on a tile
+        @rtype: numpy.ndarray
+        """
+        floor = numpy.zeros(len(rows), dtype=bool)
+        # Npcs wider than a tile have columns between their edges that a narrow wall could be under
+        for offset in list(range(0, self.width - 1, settings.TILE_SIZE)) + [self.width - 1]:
+            floor |= self.is_solid(grid, ((x + offset) // settings.TILE_SIZE).astype(int), rows)
+        return floor
+
+    def tick(self, sub_level=None):
+        """
+        A function to advance every npc in the crowd by one tick: moving, colliding, and animating. Decisions are
+        made separately, see think().
+
+        @param sub_level: the sub-level whose tiles the npcs collide with, or None for no walls
+        @type sub_level: level.SubLevel
+        @return: none
+        @rtype: none
+        """
+        n = self.count
+        if n == 0:
+            return
+        self.x_previous[:n] = self.x[:n]
+        self.y_previous[:n] = self.y[:n]
+        self.move(n)
+        physics.integrate_arrays(self.x[:n], self.y[:n], self.x_velocity[:n], self.y_velocity[:n],
+                                 self.jumping[:n], self.falling[:n], self.climbing[:n], settings.GRAVITY,
+                                 settings.FRICTION, settings.AIR_RESISTANCE)
+        self.collide(n, self.get_grid(sub_level))
+        self.animate(n)
+
+    def tick_coarse(self, sub_level, ticks: int):
+        """
+        A function to advance every npc in the crowd by several ticks at once, for crowds that can't be seen. Running
+        npcs cover the ground they would have in those ticks and falling npcs land straight away, nothing is animated.
+        Walls are only checked where the npcs end up, so a run has to be shorter than a tile to not go through one.
+
+        @param sub_level: the sub-level whose tiles the npcs collide with, or None for no walls
+        @type sub_level: level.SubLevel
+        @param ticks: the number of ticks to advance by
+        @type ticks: int
+        @return: none
+        @rtype: none
+        """
+        n = self.count
+        if n == 0:
+            return
+        grid = self.get_grid(sub_level)
+        self.settle(n, grid)
+        self.move(n, ticks)
+        x_velocity = self.x_velocity[:n]
+        # A running npc's velocity after friction every tick, see move() and physics.integrate_arrays()
+        x_velocity[~self.running[:n]] = 0
+        x_velocity[self.running[:n]] -= numpy.sign(x_velocity[self.running[:n]]) * settings.FRICTION
+        self.x[:n] = physics.round_like_rect(self.x[:n] + x_velocity * ticks)
+        self.y_previous[:n] = self.y[:n]
+        self.collide(n, grid)
+        # Anything that walked off a ledge lands too
+        self.settle(n, grid)
+        self.x_previous[:n] = self.x[:n]
+        self.y_previous[:n] = self.y[:n]
+
+    def fast_forward(self, sub_level, ticks: int):
+        """
+        A function to work out where the npcs of a crowd that was frozen would be after some ticks without simulating
+        them. Every npc lands on the floor under it then wanders, at most as far as it could run in that time, along
+        that floor.
+
+        @param sub_level: the sub-level whose tiles the npcs collide with, or None for no walls
+        @type sub_level: level.SubLevel
+        @param ticks: the number of ticks the crowd was frozen for
+        @type ticks: int
+        @return: none
+        @rtype: none
+        """
+        n = self.count
+        if n == 0 or ticks <= 0:
+            return
+        tile_size = settings.TILE_SIZE
+        grid = self.get_grid(sub_level)
+        self.settle(n, grid)
+        x = self.x[:n]
+        y = self.y[:n]
+        # The floor each npc stands on, from the column under its middle out to a gap or a wall on either side
+        row_feet = ((y + self.height - 1) // tile_size).astype(int)
+        on_grid = row_feet < level.TILES_HIGH  # The bottom of the screen has no tiles to follow
+        col_start = ((x + self.width / 2) // tile_size).astype(int)
+        col_left = col_start.copy()
+        col_right = col_start.copy()
+        extending_left = on_grid.copy()
+        extending_right = on_grid.copy()
+        for _ in range(level.TILES_WIDE):
+            if not (extending_left.any() or extending_right.any()):
+                break
+            col = col_left - 1
+            extending_left &= (col >= 0) & self.is_solid(grid, col, row_feet) & ~self.is_blocked(grid, col, y)
+            col_left[extending_left] = col[extending_left]
+            col = col_right + 1
+            extending_right &= ((col < level.TILES_WIDE) & self.is_solid(grid, col, row_feet)
+                                & ~self.is_blocked(grid, col, y))
+            col_right[extending_right] = col[extending_right]
+        x_min = numpy.where(on_grid, col_left * tile_size, 0)
+        x_max = numpy.where(on_grid, (col_right + 1) * tile_size - self.width, settings.SCREEN_WIDTH - self.width)
+        # Floors narrower than the npc leave it where it is
+        narrow = x_max < x_min
+        x_min[narrow] = x[narrow]
+        x_max[narrow] = x[narrow]
+        # Anywhere it could have reached along the floor is as likely as anywhere else
+        reach = ticks * max(self.speed - settings.FRICTION, 0)
+        x_low = numpy.clip(x - reach, x_min, x_max)
+        x_high = numpy.clip(x + reach, x_min, x_max)
+        x[:] = physics.round_like_rect(self.random.uniform(x_low, x_high))
+        self.x_velocity[:n] = 0
+        self.direction[:n] = self.random.choice(numpy.array([-1, 1], dtype=numpy.int8), n)
+        self.running[:n] = False
+        self.state[:n] = self.STATE_IDLE
+        self.image_index[:n] = 0
+        self.timer_images[:n] = 0
+        self.timer_decide[:n] = self.random.integers(1, 60, n)
+        self.x_previous[:n] = x
+        self.y_previous[:n] = y
+
+    def freeze(self, tick: int):
+        """
+        A function to stop simulating the crowd and trim its arrays down to the npcs in it, until thaw() is called.
+
+        @param tick: the handler's tick the crowd was frozen on
+        @type tick: int
+        @return: none
+        @rtype: none
+        """
+        self.frozen_tick = tick
+        self.allocate(max(self.count, 1))
+
+    def thaw(self, sub_level, tick: int):
+        """
+        A function to start simulating a frozen crowd again, fast forwarded to the current tick.
+
+        @param sub_level: the sub-level whose tiles the npcs collide with, or None for no walls
+        @type sub_level: level.SubLevel
+        @param tick: the handler's current tick
+        @type tick: int
+        @return: none
+        @rtype: none
+        """
+        self.fast_forward(sub_level, tick - self.frozen_tick)
+        self.frozen_tick = None
+
+    def is_thinking_due(self):
+        """
+        Accessor. Grab whether any npc in the crowd is waiting on a decision.
+
+        @return: whether think() has anything to do
+        @rtype: bool
+        """
+        return self.count > 0 and self.frozen_tick is None and bool((self.timer_decide[:self.count] <= 0).any())
+
+    def think(self):
+        """
+        A function for the npcs whose decision timer ran out to pick, at random, to stand still or run a direction.
+        Called by the handler's scheduler when there's time for it, until then the npcs keep doing what they were.
+
+        @return: none
+        @rtype: none
+        """
+        n = self.count
+        timer_decide = self.timer_decide[:n]
+        deciding = timer_decide <= 0
+        count_deciding = int(deciding.sum())
+        if count_deciding > 0:
+            self.running[:n][deciding] = self.random.random(count_deciding) < 0.5
+            self.direction[:n][deciding] = self.random.choice(numpy.array([-1, 1], dtype=numpy.int8),
+                                                              count_deciding)
+            timer_decide[deciding] = self.random.integers(30, 180, count_deciding)
+
+    def move(self, n: int, ticks=1):
+        """
+        A function to keep the running npcs running and count down to each npc's next decision.
+
+        @param n: the number of npcs in the crowd
+        @type n: int
+        @param ticks: the number of ticks since the last move
+        @type ticks: int
+        @return: none
+        @rtype: none
+        """
+        timer_decide = self.timer_decide[:n]
+        # Stops at 0 so npcs waiting on the scheduler to think don't count down forever
+        timer_decide[:] = numpy.maximum(timer_decide - ticks, 0)
+        # Running on the ground is like holding a key down, the velocity is kept up against friction
+        pushing = self.running[:n] & ~self.falling[:n] & ~self.jumping[:n]
+        self.x_velocity[:n][pushing] = self.direction[:n][pushing] * self.speed
+
+    def collide(self, n: int, grid):
+        """
+        A function to land the npcs on the tiles under their feet, turn them around at walls and the edges of the
+        screen, and drop the ones that walked off a ledge. Only the cells under the feet and ahead of each npc are
+        looked at, on the sub-level's grid.
+
+        @param n: the number of npcs in the crowd
+        @type n: int
+        @param grid: the tiles of the sub-level, see get_grid()
+        @type grid: numpy.ndarray
+        @return: none
+        @rtype: none
+        """
+        tile_size = settings.TILE_SIZE
+        x = self.x[:n]
+        y = self.y[:n]
+        x_velocity = self.x_velocity[:n]
+        direction = self.direction[:n]
+        # Walls ahead, checked from the npc's head down to just above the floor it's sunk into
+        moving_right = x_velocity > 0
+        moving_left = x_velocity < 0
+        col_ahead = numpy.where(moving_right, (x + self.width - 1) // tile_size, x // tile_size).astype(int)
+        blocked = self.is_blocked(grid, col_ahead, y)
+        blocked &= moving_right | moving_left
+        blocked_right = blocked & moving_right
+        blocked_left = blocked & moving_left
+        x[blocked_right] = col_ahead[blocked_right] * tile_size - self.width
+        x[blocked_left] = (col_ahead[blocked_left] + 1) * tile_size
+        # The edges of the screen are walls too
+        off_left = x < 0
+        off_right = x > settings.SCREEN_WIDTH - self.width
+        x[off_left] = 0
+        x[off_right] = settings.SCREEN_WIDTH - self.width
+        turning = blocked | off_left | off_right
+        direction[turning] = -direction[turning]
+        x_velocity[turning] = 0
+
+        # Floors, checked under both feet along every row the feet passed through this tick so fast falls can't go
+        # through a floor
+        row_feet = ((y + self.height - 1) // tile_size).astype(int)
+        row_feet_previous = numpy.minimum((self.y_previous[:n] + self.height - 1) // tile_size, row_feet).astype(int)
+        on_floor = numpy.zeros(n, dtype=bool)
+        row_floor = row_feet.copy()
+        for rows_down in range(int((row_feet - row_feet_previous).max()) + 1):
+            row = row_feet_previous + rows_down
+            hit = ~on_floor & (row <= row_feet) & self.is_floor(grid, x, row)
+            row_floor[hit] = row[hit]
+            on_floor |= hit
+        on_floor &= ~self.jumping[:n]
+        # Left sunk by 1 so it keeps touching the floor, like the character
+        y[on_floor] = row_floor[on_floor] * tile_size - self.height + 1
+        self.falling[:n][on_floor] = False
+        self.y_velocity[:n][on_floor] = 0
+        # The bottom of the screen is a floor too
+        off_bottom = y > settings.SCREEN_HEIGHT - self.height
+        y[off_bottom] = settings.SCREEN_HEIGHT - self.height
+        self.falling[:n][off_bottom] = False
+        self.y_velocity[:n][off_bottom] = 0
+        # Walked off a ledge
+        self.falling[:n][~on_floor & ~off_bottom & ~self.jumping[:n]] = True
+
+    def settle(self, n: int, grid):
+        """
+        A function to drop every falling npc straight onto the first floor under its feet, or the bottom of the screen.
+
+        @param n: the number of npcs in the crowd
+        @type n: int
+        @param grid: the tiles of the sub-level, see get_grid()
+        @type grid: numpy.ndarray
+        @return: none
+        @rtype: none
+        """
+        tile_size = settings.TILE_SIZE
+        x = self.x[:n]
+        y = self.y[:n]
+        dropping = self.falling[:n] & ~self.jumping[:n]
+        if not dropping.any():
+            return
+        row_feet = ((y + self.height - 1) // tile_size).astype(int)
+        on_floor = numpy.zeros(n, dtype=bool)
+        row_floor = numpy.zeros(n, dtype=int)
+        for row_number in range(max(int(row_feet[dropping].min()), 0), level.TILES_HIGH):
+            row = numpy.full(n, row_number)
+            hit = dropping & ~on_floor & (row >= row_feet) & self.is_floor(grid, x, row)
+            row_floor[hit] = row_number
+            on_floor |= hit
+        # Left sunk by 1 so it keeps touching the floor, like the character
+        y[on_floor] = row_floor[on_floor] * tile_size - self.height + 1
+        y[dropping & ~on_floor] = settings.SCREEN_HEIGHT - self.height
+        self.falling[:n][dropping] = False
+        self.y_velocity[:n][dropping] = 0
+
+    def animate(self, n: int):
+        """
+        A function to change the state of each npc from its velocity and move its animation along, like
+        NPCSquishy.check_state() and NPCSquishy.check_animation() do for one npc.
+
+        @param n: the number of npcs in the crowd
+        @type n: int
+        @return: none
+        @rtype: none
+        """
+        state = numpy.where((self.x_velocity[:n] != 0) & (self.y_velocity[:n] == 0), self.STATE_RUNNING,
+                            self.STATE_IDLE).astype(numpy.int8)
+        changed = state != self.state[:n]
+        self.state[:n] = state
+        image_index = self.image_index[:n]
+        timer_images = self.timer_images[:n]
+        image_index[changed] = 0
+        timer_images[changed] = 0
+        timer_images += 1
+        turning = timer_images >= self.frames_speed[state]
+        timer_images[turning] = 0
+        image_index[turning] = (image_index[turning] + 1) % self.frames_count[state[turning]]
+
+    def draw(self, screen: pygame.Surface, alpha=1.0):
+        """
+        A function to draw every npc in the crowd with one batched blit.
+
+        @param screen: the surface that holds all of the menu and game images/pixels
+        @type screen: pygame.Surface
+        @param alpha: how far, from 0 to 1, the frame is between the last two ticks, used to smooth movement
+        @type alpha: float
+        @return: the areas that were drawn over
+        @rtype: list
+        """
+        n = self.count
+        if n == 0:
+            return []
+        x = numpy.rint(self.x_previous[:n] + (self.x[:n] - self.x_previous[:n]) * alpha).astype(int).tolist()
+        y = numpy.rint(self.y_previous[:n] + (self.y[:n] - self.y_previous[:n]) * alpha).astype(int).tolist()
+        frames = self.frames
+        facing_left = (self.direction[:n] < 0).tolist()
+        return screen.blits([(frames[state][left][index], (x[i], y[i]))
+                             for i, (state, left, index)
+                             in enumerate(zip(self.state[:n].tolist(), facing_left, self.image_index[:n].tolist()))])
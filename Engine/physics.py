@@ -0,0 +1,202 @@
+# The physics module that handles moving every character and npc with gravity, friction, and air resistance.
+# Tanner Fry
+# tefnq2@mst.edu
+import settings
+
+import pygame
+
+try:
+    import numpy
+except ImportError:
+    numpy = None  # Only needed to integrate crowds, see integrate_arrays()
+
+
+class PhysicsBody(object):
+    """Class. Used to hold the position, velocity, and whether it's in the air, of anything moved by the physics."""
+    def __init__(self, rect=None):
+        """
+        Constructor. Used to create a body that is falling until it lands on something.
+
+        @param rect: the position and size of the body
+        @type rect: pygame.Rect
+        """
+        self.climbing = False
+        self.falling = True
+        self.jumping = False
+        self.rect = rect
+        self.x_velocity = 0
+        self.y_velocity = 0
+
+
+def body_attribute(name: str):
+    """
+    A function to make a property that reads and writes an attribute of a sprite's physics body, so a sprite's code can
+    keep using self.x_velocity and the like while the body owns them.
+
+    @param name: the name of the attribute of the body
+    @type name: str
+    @return: the property
+    @rtype: property
+    """
+    return property(lambda self: getattr(self.body, name), lambda self, value: setattr(self.body, name, value))
+
+
+class PhysicsSprite(pygame.sprite.Sprite):
+    """
+    Class. Used as the base of every sprite moved by the physics. The sprite's position, velocity, and states live in
+    its body so every body is integrated the same way by step().
+    """
+    climbing = body_attribute('climbing')
+    falling = body_attribute('falling')
+    jumping = body_attribute('jumping')
+    rect = body_attribute('rect')
+    x_velocity = body_attribute('x_velocity')
+    y_velocity = body_attribute('y_velocity')
+
+    def __init__(self, *groups):
+        """
+        Constructor. Used to give the sprite its body before adding it to its groups.
+
+        @param groups: the groups the sprite is added to
+        @type groups: pygame.sprite.Group
+        """
+        self.body = PhysicsBody()
+        pygame.sprite.Sprite.__init__(self, *groups)
+
+
+def integrate(body: PhysicsBody, gravity: float, friction: float, air_resistance: float):
+    """
+    A function to move one body by one tick of its velocity and apply gravity, friction, and air resistance.
+
+    @param body: the body to move
+    @type body: PhysicsBody
+    @param gravity: the change in vertical velocity every tick while in the air
+    @type gravity: float
+    @param friction: the change in horizontal velocity every tick while on the ground
+    @type friction: float
+    @param air_resistance: the change in horizontal velocity every tick while falling
+    @type air_resistance: float
+    @return: none
+    @rtype: none
+    """
+    rect = body.rect
+    # Gravity
+    if body.jumping:
+        body.falling = False
+        rect.y -= body.y_velocity
+        body.y_velocity -= gravity
+        if body.y_velocity < 0:
+            body.falling = True
+            body.jumping = False
+            body.y_velocity = 0
+    elif body.falling is True and body.climbing is False:
+        rect.y += body.y_velocity
+        body.y_velocity += gravity
+
+    if body.climbing:
+        rect.y += body.y_velocity
+    elif body.jumping is False and body.falling is False:
+        body.y_velocity = 0
+
+    # Apply friction and air resistance
+    if body.x_velocity > 0:
+        if body.falling is False and body.jumping is False:
+            body.x_velocity -= friction
+        elif body.falling is True:
+            body.x_velocity -= air_resistance
+        if body.x_velocity <= 0.4:
+            body.x_velocity = 0
+    elif body.x_velocity < 0:
+        if body.falling is False and body.jumping is False:
+            body.x_velocity += friction
+        elif body.falling is True:
+            body.x_velocity += air_resistance
+        if body.x_velocity >= -0.4:
+            body.x_velocity = 0
+    rect.x += body.x_velocity
+
+
+def round_like_rect(values):
+    """
+    A function to round positions the way a pygame.Rect does when it's given a float, halves away from zero.
+
+    @param values: the positions to round
+    @type values: numpy.ndarray
+    @return: the rounded positions
+    @rtype: numpy.ndarray
+    """
+    return numpy.copysign(numpy.floor(numpy.abs(values) + 0.5), values)
+
+
+def integrate_arrays(x, y, x_velocity, y_velocity, jumping, falling, climbing, gravity: float, friction: float,
+                     air_resistance: float):
+    """
+    A function to do what integrate() does to every body at once, in place, on numpy arrays with one entry per body.
+    Positions are rounded after every move, like a pygame.Rect would, so both give the same results.
+
+    @param x: the horizontal positions
+    @type x: numpy.ndarray
+    @param y: the vertical positions
+    @type y: numpy.ndarray
+    @param x_velocity: the horizontal velocities
+    @type x_velocity: numpy.ndarray
+    @param y_velocity: the vertical velocities
+    @type y_velocity: numpy.ndarray
+    @param jumping: whether each body is jumping
+    @type jumping: numpy.ndarray
+    @param falling: whether each body is falling
+    @type falling: numpy.ndarray
+    @param climbing: whether each body is climbing
+    @type climbing: numpy.ndarray
+    @param gravity: the change in vertical velocity every tick while in the air
+    @type gravity: float
+    @param friction: the change in horizontal velocity every tick while on the ground
+    @type friction: float
+    @param air_resistance: the change in horizontal velocity every tick while falling
+    @type air_resistance: float
+    @return: none
+    @rtype: none
+    """
+    # Gravity
+    rising = jumping.copy()
+    y[rising] = round_like_rect(y[rising] - y_velocity[rising])
+    y_velocity[rising] -= gravity
+    peaked = rising & (y_velocity < 0)
+    falling[rising] = peaked[rising]
+    jumping[peaked] = False
+    y_velocity[peaked] = 0
+    dropping = ~rising & falling & ~climbing
+    y[dropping] = round_like_rect(y[dropping] + y_velocity[dropping])
+    y_velocity[dropping] += gravity
+
+    y[climbing] = round_like_rect(y[climbing] + y_velocity[climbing])
+    y_velocity[~climbing & ~jumping & ~falling] = 0
+
+    # Apply friction and air resistance
+    grounded = ~falling & ~jumping
+    slowing = numpy.where(grounded, friction, numpy.where(falling, air_resistance, 0.0))
+    moving_right = x_velocity > 0
+    moving_left = x_velocity < 0
+    x_velocity[moving_right] -= slowing[moving_right]
+    x_velocity[moving_left] += slowing[moving_left]
+    x_velocity[moving_right & (x_velocity <= 0.4)] = 0
+    x_velocity[moving_left & (x_velocity >= -0.4)] = 0
+    x[:] = round_like_rect(x + x_velocity)
+
+
+def step(sprites: pygame.sprite.Group):
+    """
+    A function to move every sprite with a physics body by one tick, with the settings looked up once for every body.
+    Crowds keep their bodies in arrays of their own and move them with integrate_arrays(), see npc.NPCCrowd.
+
+    @param sprites: the sprites to move, the ones without a body are skipped
+    @type sprites: pygame.sprite.Group
+    @return: none
+    @rtype: none
+    """
+    gravity = settings.GRAVITY
+    friction = settings.FRICTION
+    air_resistance = settings.AIR_RESISTANCE
+    for sprite in sprites:
+        if isinstance(sprite, PhysicsSprite):
+            integrate(sprite.body, gravity, friction, air_resistance)
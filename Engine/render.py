@@ -0,0 +1,259 @@
+# The render module that handles pre-baked level surfaces and other ways of cutting down on per frame drawing.
+# Tanner Fry
+# tefnq2@mst.edu
+import settings
+
+import collections
+import logging
+import pygame
+
+
+class LevelSurfaceCache(object):
+    """Class. Used to pre-bake the static tiles of a sub-level into one surface so that drawing them is a single blit."""
+    def __init__(self, engine_game: object, size_max=settings.LEVEL_CACHE_SIZE):
+        """
+        Constructor. Used to initialize an empty cache of sub-level surfaces.
+
+        @param engine_game: the engine which controls the network/functions of the game when it starts after the menu
+        @type engine_game: object
+        @param size_max: the most sub-level surfaces kept at once, the least recently used is thrown away first
+        @type size_max: int
+        """
+        self.engine_game = engine_game
+        self.size_max = size_max
+        self.backgrounds = {}  # Sub-level number -> opaque surface of the tiles over the background color
+        # Sub-level number -> (sub-level, revision) the surface was baked from. A sub-level that was let go of and
+        # loaded again starts counting its revisions over, so the revision alone can't tell if the tiles changed
+        self.baked = {}
+        self.surfaces = collections.OrderedDict()  # Sub-level number -> surface holding every tile of that sub-level
+
+    def bake(self, level_sub: int):
+        """
+        A function to render every tile of a sub-level, once, onto a transparent surface the size of the screen.
+
+        @param level_sub: the sub-level whose tiles are rendered
+        @type level_sub: int
+        @return: the surface holding all of the tiles of the sub-level
+        @rtype: surface
+        """
+        surface = pygame.Surface((settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT), pygame.SRCALPHA, 32)
+        sub_level = self.engine_game.level_tiles.get_sub_level(level_sub)
+        if sub_level is not None:
+            tileset = self.engine_game.level_tiles.tileset
+            tile_size = tileset.tile_size
+            surface.blits([(tileset.get_image(tile_id), (col * tile_size, row * tile_size))
+                           for col, row, tile_id in sub_level.iter_tiles()], 0)
+            self.baked[level_sub] = (sub_level, sub_level.revision)
+        logging.debug('Baked the tiles of sub-level %s into one surface.', level_sub)
+        return surface.convert_alpha()
+
+    def get_surface(self, level_sub: int):
+        """
+        Accessor. Grab the baked surface of a sub-level, baking it first if it isn't cached yet.
+
+        @param level_sub: the sub-level whose surface is wanted
+        @type level_sub: int
+        @return: the surface holding all of the tiles of the sub-level
+        @rtype: surface
+        """
+        surface = self.surfaces.get(level_sub)
+        sub_level = self.engine_game.level_tiles.get_sub_level(level_sub)
+        if surface is not None and sub_level is not None:
+            sub_level_baked, revision = self.baked.get(level_sub, (None, -1))
+            if sub_level is not sub_level_baked or sub_level.revision != revision:
+                # The tiles changed, or the sub-level was loaded again, since the surface was baked
+                self.invalidate(level_sub)
+                surface = None
+        if surface is None:
+            surface = self.bake(level_sub)
+            self.surfaces[level_sub] = surface
+            while len(self.surfaces) > self.size_max:
+                self.invalidate(next(iter(self.surfaces)))
+        else:
+            self.surfaces.move_to_end(level_sub)
+        return surface
+
+    def invalidate(self, level_sub=None):
+        """
+        A function to throw away baked surfaces once the tiles they were made from have changed.
+
+        @param level_sub: the sub-level to throw away, or None to throw away every sub-level
+        @type level_sub: int
+        @return: none
+        @rtype: none
+        """
+        if level_sub is None:
+            self.backgrounds.clear()
+            self.baked.clear()
+            self.surfaces.clear()
+        else:
+            self.backgrounds.pop(level_sub, None)
+            self.baked.pop(level_sub, None)
+            self.surfaces.pop(level_sub, None)
+
+    def draw(self, screen: object, level_sub: int):
+        """
+        A function to draw all of the tiles of a sub-level to the screen with one blit.
+
+        @param screen: the surface that holds all of the menu and game images/pixels
+        @type screen: object
+        @param level_sub: the sub-level to draw
+        @type level_sub: int
+        @return: none
+        @rtype: none
+        """
+        screen.blit(self.get_surface(level_sub), (0, 0))
+
+    def get_background(self, level_sub: int):
+        """
+        Accessor. Grab an opaque surface of the sub-level's tiles over the level's background color. Used by the dirty
+        rectangle renderer to restore the areas that moving objects drew over.
+
+        @param level_sub: the sub-level whose background is wanted
+        @type level_sub: int
+        @return: the opaque background surface of the sub-level
+        @rtype: surface
+        """
+        surface = self.get_surface(level_sub)
+        background = self.backgrounds.get(level_sub)
+        if background is None:
+            background = pygame.Surface((settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT)).convert()
+            background.fill(settings.DARK_GRAY)
+            background.blit(surface, (0, 0))
+            self.backgrounds[level_sub] = background
+        return background
+
+
+class DirtySurface(pygame.Surface):
+    """Class. A surface that remembers every area that was drawn onto it so only those areas need to be displayed."""
+    def __init__(self, size: tuple, *args):
+        """
+        Constructor. Used to create the surface with an empty list of drawn areas.
+
+        @param size: the width and height of the surface
+        @type size: tuple
+        """
+        pygame.Surface.__init__(self, size, *args)
+        self.dirty_rects = []  # Areas drawn onto since the last frame was pushed to the display
+        self.recording = False  # Only True while a DirtyRectRenderer is handling the frame
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        rect = pygame.Surface.blit(self, source, dest, area, special_flags)
+        if self.recording:
+            self.dirty_rects.append(rect)
+        return rect
+
+    def blits(self, blit_sequence, doreturn=1):
+        rects = pygame.Surface.blits(self, blit_sequence, 1)
+        if self.recording:
+            self.dirty_rects.extend(rects)
+        if doreturn:
+            return rects
+
+    def fill(self, color, rect=None, special_flags=0):
+        rect = pygame.Surface.fill(self, color, rect, special_flags)
+        if self.recording:
+            self.dirty_rects.append(rect)
+        return rect
+
+    def mark(self, rect: pygame.Rect):
+        """
+        A function to remember an area that was drawn onto without a blit, such as the rect returned by pygame.draw.
+
+        @param rect: the area that was drawn onto
+        @type rect: pygame.Rect
+        @return: the same area so the call can wrap a pygame.draw call
+        @rtype: pygame.Rect
+        """
+        if self.recording:
+            self.dirty_rects.append(rect)
+        return rect
+
+
+class DirtyRectRenderer(object):
+    """
+    Class. Used to push only the areas of the screen that changed since the last frame to the display instead of
+    clearing, redrawing, scaling, and flipping the whole screen every frame.
+    """
+    def __init__(self, screen: DirtySurface):
+        """
+        Constructor. Used to set up the renderer for a screen. The screen is scaled onto whichever window is currently
+        displayed so changing resolutions doesn't leave the renderer with an old window.
+
+        @param screen: the surface that holds all of the menu and game images/pixels
+        @type screen: DirtySurface
+        """
+        self.background = None  # The last background restored from, a different one means a full redraw
+        self.full_redraw = True
+        self.rects_last = []  # Areas drawn during the last frame, they are restored from the background this frame
+        self.screen = screen
+
+    def invalidate(self):
+        """
+        A function to force the next frame to redraw and display the whole screen, such as after a screen change.
+
+        @return: none
+        @rtype: none
+        """
+        self.full_redraw = True
+
+    def begin_frame(self, background: object):
+        """
+        A function to restore the areas the last frame drew over and start remembering what this frame draws.
+
+        @param background: an opaque surface, the size of the screen, of everything that doesn't move
+        @type background: object
+        @return: none
+        @rtype: none
+        """
+        if background is not self.background:
+            self.background = background
+            self.full_redraw = True
+        self.screen.recording = False
+        if self.full_redraw:
+            self.screen.blit(background, (0, 0))
+        else:
+            for rect in self.rects_last:
+                self.screen.blit(background, rect, rect)
+        self.screen.dirty_rects = []
+        self.screen.recording = True
+
+    def end_frame(self):
+        """
+        A function to scale the changed areas of the screen onto the window and push only those to the display.
+
+        @return: none
+        @rtype: none
+        """
+        screen_rect = self.screen.get_rect()
+        window = pygame.display.get_surface()
+        # Pad each area a little since lines and scaled edges can land a pixel outside of what was reported
+        rects_drawn = [rect.inflate(4, 4).clip(screen_rect) for rect in self.screen.dirty_rects if rect.width > 0
+                       and rect.height > 0]
+        self.screen.dirty_rects = []
+        self.screen.recording = False
+        rects = rects_drawn + self.rects_last
+        self.rects_last = rects_drawn
+        area = 0
+        for rect in rects:
+            area += rect.width * rect.height
+        if self.full_redraw or area > screen_rect.width * screen_rect.height / 2:
+            # Not worth the bookkeeping, just push the whole screen
+            self.full_redraw = False
+            pygame.transform.scale(self.screen, window.get_size(), window)
+            pygame.display.flip()
+            return
+        ratio_x = window.get_width() / screen_rect.width
+        ratio_y = window.get_height() / screen_rect.height
+        window_rect = window.get_rect()
+        rects_window = []
+        for rect in rects:
+            x = int(rect.x * ratio_x)
+            y = int(rect.y * ratio_y)
+            rect_window = pygame.Rect(x, y, int(rect.right * ratio_x + 0.5) - x,
+                                      int(rect.bottom * ratio_y + 0.5) - y).clip(window_rect)
+            if rect_window.width > 0 and rect_window.height > 0:
+                pygame.transform.scale(self.screen.subsurface(rect), rect_window.size,
+                                       window.subsurface(rect_window))
+                rects_window.append(rect_window)
+        pygame.display.update(rects_window)
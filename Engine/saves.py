@@ -0,0 +1,500 @@
+# The saves module that reads and writes saved games as a journal of compressed and checksummed records.
+# Tanner Fry
+# tefnq2@mst.edu
+import level
+import settings
+import settings_store
+
+import ast
+import collections
+import concurrent.futures
+import json
+import logging
+import os
+import struct
+import time
+import zlib
+
+DIR_SAVES = 'Bin/Saves'
+SAVE_EXTENSION = '.sav'
+SAVE_EXTENSION_OLD = '.py'  # Saves from before this format, a copy of settings.py, read once and converted
+# Save file format, little endian:
+#   header: magic, version
+#   records, one after another: type, length of the data, crc32 of the data, then the data, zlib compressed json
+#   The first record is the whole state of the game and every record after it only the parts that changed, so saving
+#   again only adds what changed to the end of the file. A record cut short by a crash, or with the wrong checksum,
+#   ends the file and everything before it is still loaded.
+SAVE_HEADER = struct.Struct('<4sH')
+SAVE_MAGIC = b'SSAV'
+SAVE_VERSION = 1
+SAVE_RECORD = struct.Struct('<BII')
+RECORD_FULL = 0
+RECORD_CHANGES = 1
+SAVE_METRICS_SIZE = 32  # Autosaves whose timings and size are kept
+# The settings that belong to the character instead of the user, saved with the character
+PROFILE_SETTINGS = tuple(sorted(name for name in dir(settings) if name.startswith('CHAR_'))) + \
+    ('BLINK', 'DOUBLE_JUMP', 'TUMBLE', 'WALL_RUN_JUMP')
+# The character's attributes that change in game
+CHARACTER_ATTRIBUTES = ('direction', 'health', 'trait_endurance', 'trait_influence', 'trait_resolve',
+                        'trait_strength')
+
+
+def get_path(file_save_name: str, extension=SAVE_EXTENSION):
+    """
+    Accessor. Grab the file location of a save.
+
+    @param file_save_name: the name of the save
+    @type file_save_name: str
+    @param extension: the extension of the save's file
+    @type extension: str
+    @return: the file location of the save
+    @rtype: str
+    """
+    return DIR_SAVES + '/' + file_save_name + extension
+
+
+def get_save_names():
+    """
+    Accessor. Grab the names of every save, including old saves that haven't been converted yet.
+
+    @return: the names of the saves, sorted
+    @rtype: list
+    """
+    if not os.path.isdir(DIR_SAVES):
+        return []
+    names = set()
+    for file_name in os.listdir(DIR_SAVES):
+        name, extension = os.path.splitext(file_name)
+        if extension in (SAVE_EXTENSION, SAVE_EXTENSION_OLD):
+            names.add(name)
+    return sorted(names)
+
+
+def diff_state(state_old: dict, state_new: dict):
+    """
+    A function to find what changed between two states of a game.
+
+    @param state_old: the state before
+    @type state_old: dict
+    @param state_new: the state after
+    @type state_new: dict
+    @return: section -> {key: new value} of every value that changed, None for a value that's gone
+    @rtype: dict
+    """
+    changes = {}
+    for section in state_old.keys() | state_new.keys():
+        values_old = state_old.get(section, {})
+        values_new = state_new.get(section, {})
+        changed = {key: values_new.get(key) for key in values_old.keys() | values_new.keys()
+                   if values_old.get(key) != values_new.get(key)}
+        if len(changed) > 0:
+            changes[section] = changed
+    return changes
+
+
+def merge_state(state: dict, changes: dict):
+    """
+    A function to apply what changed to a state of a game, in place.
+
+    @param state: the state to change
+    @type state: dict
+    @param changes: what changed, see diff_state()
+    @type changes: dict
+    @return: none
+    @rtype: none
+    """
+    for section, changed in changes.items():
+        values = state.setdefault(section, {})
+        for key, value in changed.items():
+            if value is None:
+                values.pop(key, None)
+            else:
+                values[key] = value
+
+
+def encode_record(record_type: int, data: dict):
+    """
+    A function to turn data into a record of a save file.
+
+    @param record_type: RECORD_FULL or RECORD_CHANGES
+    @type record_type: int
+    @param data: the state or the changes to it
+    @type data: dict
+    @return: the record
+    @rtype: bytes
+    """
+    payload = zlib.compress(json.dumps(data, separators=(',', ':'), sort_keys=True).encode('utf-8'))
+    return SAVE_RECORD.pack(record_type, len(payload), zlib.crc32(payload)) + payload
+
+
+class SaveFile(object):
+    """
+    Class. Used to read and write a save file. The state of the game as of the last record is kept so the next save
+    only has to write what changed since, see append().
+    """
+    def __init__(self, path: str):
+        """
+        Constructor. Used to create a save that has nothing in it yet.
+
+        @param path: the location of the save's file
+        @type path: str
+        """
+        self.path = path
+        self.records = 0  # Records in the file
+        self.size = 0  # Bytes of the file that were read or written, anything after them is broken
+        self.state = {}  # Section -> {key: value} of the game as of the last record
+
+    @classmethod
+    def load(cls, path: str):
+        """
+        A function to read a save, applying every record in order.
+
+        @param path: the location of the save's file
+        @type path: str
+        @return: the save
+        @rtype: SaveFile
+        @raise ValueError: if the file isn't a save or is from another version
+        """
+        with open(path, 'rb') as file:
+            data = file.read()
+        if len(data) < SAVE_HEADER.size:
+            raise ValueError('Save is too short: ' + path)
+        magic, version = SAVE_HEADER.unpack_from(data)
+        if magic != SAVE_MAGIC or version != SAVE_VERSION:
+            raise ValueError('Not a save of this version: ' + path)
+        save_file = cls(path)
+        offset = SAVE_HEADER.size
+        while offset + SAVE_RECORD.size <= len(data):
+            record_type, length, checksum = SAVE_RECORD.unpack_from(data, offset)
+            payload = data[offset + SAVE_RECORD.size:offset + SAVE_RECORD.size + length]
+            if len(payload) != length or zlib.crc32(payload) != checksum:
+                break
+            changes = json.loads(zlib.decompress(payload).decode('utf-8'))
+            if record_type == RECORD_FULL:
+                save_file.state = changes
+            else:
+                merge_state(save_file.state, changes)
+            save_file.records += 1
+            offset += SAVE_RECORD.size + length
+        if offset != len(data):
+            logging.error('* Error - Save is damaged after record %s, the rest is ignored: %s.', save_file.records,
+                          path)
+        if save_file.records == 0:
+            raise ValueError('Save has no records: ' + path)
+        save_file.size = offset
+        return save_file
+
+    def write(self, state: dict):
+        """
+        A function to write the whole state as the only record of the save. The file is written next to the old one
+        and then moved over it, so a crash part way through never leaves a broken save.
+
+        @param state: the state of the game, see capture_state()
+        @type state: dict
+        @return: the number of bytes written
+        @rtype: int
+        """
+        data = SAVE_HEADER.pack(SAVE_MAGIC, SAVE_VERSION) + encode_record(RECORD_FULL, state)
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        path_temp = self.path + '.tmp'
+        with open(path_temp, 'wb') as file:
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(path_temp, self.path)
+        self.records = 1
+        self.size = len(data)
+        self.state = state
+        return len(data)
+
+    def append(self, state: dict):
+        """
+        A function to save only what changed since the last record, added to the end of the file. Once the save has
+        settings.SAVE_JOURNAL_MAX records, or if its end was damaged, it's written again as one record instead.
+
+        @param state: the state of the game, see capture_state()
+        @type state: dict
+        @return: the number of bytes written
+        @rtype: int
+        """
+        if self.records == 0 or self.records >= settings.SAVE_JOURNAL_MAX or \
+                not os.path.isfile(self.path) or os.path.getsize(self.path) != self.size:
+            return self.write(state)
+        changes = diff_state(self.state, state)
+        if len(changes) == 0:
+            return 0
+        data = encode_record(RECORD_CHANGES, changes)
+        with open(self.path, 'ab') as file:
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+        self.records += 1
+        self.size += len(data)
+        self.state = state
+        return len(data)
+
+
+def read_old_save(path: str):
+    """
+    A function to read the character's settings from an old save, a copy of settings.py, without running it.
+
+    @param path: the location of the old save
+    @type path: str
+    @return: the state of the game, with only the character's settings
+    @rtype: dict
+    """
+    with open(path, 'r') as file:
+        tree = ast.parse(file.read(), path)
+    profile = {}
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name) and \
+                node.targets[0].id in PROFILE_SETTINGS:
+            try:
+                profile[node.targets[0].id] = ast.literal_eval(node.value)
+            except ValueError:
+                logging.error('* Error - Unable to read the setting %s from the old save %s.', node.targets[0].id,
+                              path)
+    return {'profile': profile}
+
+
+def capture_profile():
+    """
+    A function to copy the character's settings as they are now.
+
+    @return: setting name -> value of every setting that belongs to the character
+    @rtype: dict
+    """
+    profile = {}
+    for name in PROFILE_SETTINGS:
+        value = getattr(settings, name)
+        profile[name] = list(value) if isinstance(value, list) else value
+    return profile
+
+
+def get_world_key(level_number: int, level_sub: int):
+    """
+    Accessor. Grab the key of a sub-level's changed tiles in the world section of a state.
+
+    @param level_number: the level number
+    @type level_number: int
+    @param level_sub: the sub-level number
+    @type level_sub: int
+    @return: the key
+    @rtype: str
+    """
+    return str(level_number) + '.' + str(level_sub)
+
+
+def capture_snapshot(engine_game: object):
+    """
+    A function to take a snapshot of a running game that's turned into a state later, see get_state(). Only the few
+    values that change every tick are copied. The tiles changed in game are shared since they're never changed in
+    place, see level.Level.set_tile(), so a snapshot is cheap enough to take between two ticks.
+
+    @param engine_game: the game, with a save loaded, see EngineHandler.load_saved_game()
+    @type engine_game: engine.Game
+    @return: the state without the tiles changed in game, the level number, and sub-level number -> changed tiles
+    @rtype: tuple
+    """
+    character_main = engine_game.character
+    state = {'character': {name: getattr(character_main, name) for name in CHARACTER_ATTRIBUTES},
+             'position': {'level': engine_game.level_current, 'level_sub': engine_game.level_sub_current,
+                          'x': character_main.rect.x, 'y': character_main.rect.y},
+             'profile': capture_profile()}
+    return state, engine_game.level_current, dict(engine_game.level_tiles.changes)
+
+
+def get_state(snapshot: tuple, state_saved: dict):
+    """
+    A function to turn a snapshot of a game into plain values that can be saved. Safe to run on a background worker.
+
+    @param snapshot: the snapshot, see capture_snapshot()
+    @type snapshot: tuple
+    @param state_saved: the state as of the last save, the tiles changed in other levels are kept as they were saved
+    @type state_saved: dict
+    @return: section -> {key: value} of the character, its position, its settings, and the tiles changed in game
+    @rtype: dict
+    """
+    state, level_number, changes_level = snapshot
+    state['world'] = dict(state_saved.get('world', {}))
+    for level_sub, changes in changes_level.items():
+        state['world'][get_world_key(level_number, level_sub)] = \
+            [[index, tile_id] for index, tile_id in sorted(changes.items())]
+    return state
+
+
+def capture_state(engine_game: object):
+    """
+    A function to copy the state of a running game into plain values that can be saved.
+
+    @param engine_game: the game, with a save loaded, see EngineHandler.load_saved_game()
+    @type engine_game: engine.Game
+    @return: section -> {key: value} of the character, its position, its settings, and the tiles changed in game
+    @rtype: dict
+    """
+    return get_state(capture_snapshot(engine_game), engine_game.save_file.state)
+
+
+def apply_profile(state: dict):
+    """
+    A function to make the character's settings from a state the ones being played with, in memory only.
+
+    @param state: the state of the game
+    @type state: dict
+    @return: none
+    @rtype: none
+    """
+    settings_store.store.set_profile({name: value for name, value in state.get('profile', {}).items()
+                                      if name in PROFILE_SETTINGS})
+
+
+def apply_position(engine_game: object, state: dict):
+    """
+    A function to put the game back in the level and sub-level of a state, before the level is loaded.
+
+    @param engine_game: the game
+    @type engine_game: engine.Game
+    @param state: the state of the game
+    @type state: dict
+    @return: none
+    @rtype: none
+    """
+    position = state.get('position', {})
+    # A new character starts at the start of the first level
+    engine_game.level_current = position.get('level', 1)
+    engine_game.level_sub_current = position.get('level_sub', 1)
+
+
+def apply_state(engine_game: object, state: dict):
+    """
+    A function to put the character, and the tiles changed in the current level, back the way they are in a state,
+    once the level and character are made.
+
+    @param engine_game: the game
+    @type engine_game: engine.Game
+    @param state: the state of the game
+    @type state: dict
+    @return: none
+    @rtype: none
+    """
+    character_main = engine_game.character
+    for name, value in state.get('character', {}).items():
+        if name in CHARACTER_ATTRIBUTES:
+            setattr(character_main, name, value)
+    position = state.get('position', {})
+    character_main.rect.x = position.get('x', character_main.rect.x)
+    character_main.rect.y = position.get('y', character_main.rect.y)
+    for key, changes in state.get('world', {}).items():
+        level_number, level_sub = (int(number) for number in key.split('.'))
+        if level_number != engine_game.level_current:
+            continue
+        for index, tile_id in changes:
+            engine_game.level_tiles.set_tile(level_sub, index % level.TILES_WIDE, index // level.TILES_WIDE, tile_id)
+
+
+class AutosaveService(object):
+    """
+    Class. Used to save the game every so often without holding up the game. A snapshot is taken between two ticks and
+    a background worker turns it into a state, compresses it, and writes it, one save at a time. How long each save
+    took and how big it was are kept, see get_metrics().
+    """
+    def __init__(self, save_file: SaveFile, interval=None):
+        """
+        Constructor. Used to create the service, the worker is started the first time it's needed.
+
+        @param save_file: the save being played
+        @type save_file: SaveFile
+        @param interval: the ticks between autosaves, or None to only save when save() is called
+        @type interval: int
+        """
+        self.executor = None  # Background worker that writes the saves
+        self.future = None  # The save being written, if there is one
+        self.interval = interval
+        self.metrics = collections.deque(maxlen=SAVE_METRICS_SIZE)  # Timings and size of the latest saves
+        self.save_file = save_file
+        self.ticks = 0  # Ticks since the last autosave
+
+    def update(self, engine_game: object):
+        """
+        A function to count a tick and save the game once it's been interval ticks since the last autosave. Has to be
+        called between two ticks so the snapshot is of one tick.
+
+        @param engine_game: the game
+        @type engine_game: engine.Game
+        @return: none
+        @rtype: none
+        """
+        if self.interval is None:
+            return
+        self.ticks += 1
+        # A save that's still being written when the next one is due pushes it back a tick
+        if self.ticks >= self.interval and self.save(engine_game) is True:
+            self.ticks = 0
+
+    def save(self, engine_game: object):
+        """
+        A function to take a snapshot of the game now and write it in the background.
+
+        @param engine_game: the game
+        @type engine_game: engine.Game
+        @return: whether the save was started, not if the last save is still being written
+        @rtype: bool
+        """
+        if self.future is not None and not self.future.done():
+            return False
+        time_start = time.perf_counter()
+        snapshot = capture_snapshot(engine_game)
+        ms_snapshot = (time.perf_counter() - time_start) * 1000
+        if self.executor is None:
+            self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self.future = self.executor.submit(self.write, snapshot, ms_snapshot)
+        return True
+
+    def write(self, snapshot: tuple, ms_snapshot: float):
+        """
+        A function to turn a snapshot into a state and add what changed to the save. Runs on the background worker.
+
+        @param snapshot: the snapshot of the game, see capture_snapshot()
+        @type snapshot: tuple
+        @param ms_snapshot: the milliseconds it took to take the snapshot
+        @type ms_snapshot: float
+        @return: none
+        @rtype: none
+        """
+        try:
+            time_start = time.perf_counter()
+            size = self.save_file.append(get_state(snapshot, self.save_file.state))
+            self.metrics.append({'bytes': size, 'ms_snapshot': ms_snapshot,
+                                 'ms_write': (time.perf_counter() - time_start) * 1000,
+                                 'records': self.save_file.records})
+        except Exception:
+            # The game goes on, the save still has everything up to the last save that worked
+            logging.exception('* Error - Unable to autosave: %s.', self.save_file.path)
+
+    def get_metrics(self):
+        """
+        Accessor. Grab the timings and size of the latest saves, oldest first.
+
+        @return: for each save, the bytes written, the milliseconds the snapshot took on the game's thread, the
+                 milliseconds the worker took to write it, and the records in the save after it
+        @rtype: list
+        """
+        return list(self.metrics)
+
+    def close(self, engine_game=None):
+        """
+        A function to stop the background worker once the save being written, if there is one, is done.
+
+        @param engine_game: the game to save one last time before stopping, or None to not save it
+        @type engine_game: engine.Game
+        @return: none
+        @rtype: none
+        """
+        if self.future is not None:
+            self.future.result()
+        if engine_game is not None:
+            self.save(engine_game)
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+            self.executor = None
+        self.future = None
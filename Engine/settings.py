@@ -2,8 +2,8 @@
 # Tanner Fry
 # tefnq2@mst.edu
 
-# NOTE: If any setting is added into this file then please double check that it is added into the settings_defaults.py
-# NOTE: file as well as the Bin/Backups/settings_defaults.py file
+# NOTE: This file is only read. The user's changes and the character's settings are layered over these defaults in
+# NOTE: memory, see settings_store.py
 # Colors base
 RED = (255, 0, 0)
 ORANGE = (255, 127, 0)
@@ -35,19 +35,27 @@ UI_FEEDBACK_TEXT = DARKER_GRAY
 # TODO: Finish directory changes to streamline the ease of location changing later.
 # CONT: Change any directories with the name 'Test' in it and add from them any of the
 # CONT: sprites we will be using.
+DIR_LEVELS = 'Levels'
 DIR_SPRITES_CHAR_BASE = 'Bin/Sprites/Char_Base'
 DIR_SPRITES_GAME_ENVI = 'Bin/Sprites/Game_Environment'
 DIR_SPRITES_GAME_INV = 'Bin/Sprites/Game_Inventory_Items'
 DIR_SPRITES_NPC = 'Bin/Sprites/NPCs/Test'
 DIR_SPRITES_UI = 'Bin/Sprites/User_Interface'
+FILE_TILESET = 'Levels/tileset.json'  # Shared with the tile editor
+FILE_SETTINGS = 'Bin/settings.json'  # The settings the user changed from these defaults
 
 # Game
 # Novice Casual Master Godlike
 DIFFICULTY = 'Casual'
 FPS = 60
 GRAPHICS = 'High'
+RENDER_DIRTY_RECTS = False  # Only push the areas of the screen that changed to the display
+TICK_MAX_PER_FRAME = 5  # The most ticks run in one frame before the game stops trying to catch up
+TICK_RATE = 60  # Fixed simulation ticks per second, FPS only limits how often frames are drawn
+TEXT_CACHE_SIZE = 256  # The most rendered text surfaces kept around for reuse
 TITLE_GAME = 'Sedation'
 TOTAL_LEVELS = 2
+LEVEL_CACHE_SIZE = 9  # The most sub-levels, and their baked surfaces, kept loaded at once
 TOTAL_LEVEL_ASSETS = 0  # Tells how many blocks a tile map level will be using. Could use to optimize for bigger maps
 
 # Game obstacle endurance requirements
@@ -98,6 +106,16 @@ JUMP_STRENGTH = 15
 AIR_RESISTANCE = 1
 GRAVITY = 1
 FRICTION = 0.7
+NPC_CROWD_SIZE = 0  # Simple npcs simulated together in every sub-level, needs numpy
+NPC_LOD_COARSE_INTERVAL = 4  # Ticks between the coarse moves of crowds in nearby sub-levels
+NPC_LOD_DISTANCE_COARSE = 1  # Sub-levels this close to the current one have their crowds moved coarsely
+NPC_AI_AGING = 64  # Pixels closer an npc counts as for every frame it waited to think
+NPC_AI_BUDGET_MS = 2  # Milliseconds of every frame npcs can spend thinking
+NPC_AI_THINK_INTERVAL = 10  # Ticks between an npc's thoughts
+NPC_VIEW_DISTANCE = 320  # How close the character has to be for an npc to see it
+SETTINGS_FLUSH_DELAY = 2  # Seconds after the last change to the settings before they are saved
+SAVE_AUTOSAVE_INTERVAL = 1800  # Ticks between autosaves, 30 seconds at the tick rate
+SAVE_JOURNAL_MAX = 32  # Saves added to the end of a save file before it's written again as one record
 '''
 Character traits: These are all defaults!
     1. Agility - A trait representing the character's ability to perform physical tasks.
@@ -0,0 +1,189 @@
+# The settings store module that keeps the user's changes to the settings in memory and saves them all at once.
+# Tanner Fry
+# tefnq2@mst.edu
+import settings
+
+import json
+import logging
+import os
+import time
+import types
+
+
+class SettingsStore(object):
+    """
+    Class. Used to hold the settings in three layers: the defaults, which never change, the settings the user changed
+    from them, and the settings of the character being played. The layers are set on the settings module whenever
+    they change, so reading a setting is still settings.NAME. The user's changes since the last save are written to
+    the settings file together, a while after the last one or when flush() is called. The character's settings are
+    saved with the character, see saves.py.
+    """
+    def __init__(self, file_location=None):
+        """
+        Constructor. Used to take the defaults of every setting from the settings module, with nothing changed yet.
+
+        @param file_location: the location of the file the changes are saved to, settings.FILE_SETTINGS by default
+        @type file_location: str
+        """
+        self.changes = {}  # Setting name = value the user changed it to
+        self.defaults = types.MappingProxyType({name: copy_value(getattr(settings, name)) for name in dir(settings)
+                                                if name.isupper()})
+        self.dirty = False  # Whether there are changes that aren't saved yet
+        self.file_location = file_location if file_location is not None else settings.FILE_SETTINGS
+        self.profile = types.MappingProxyType({})  # Setting name = value of the character being played
+        self.time_changed = 0.0  # When the last change was made, in seconds
+
+    def coerce(self, setting: str, value: object):
+        """
+        A function to turn a value into the type of a setting's default, so '1440' is stored as 1440 for a number.
+
+        @param setting: the name of the setting
+        @type setting: str
+        @param value: the value to turn into the setting's type
+        @type value: object
+        @return: the value as the setting's type
+        @rtype: object
+        @raise ValueError: if the value can't be turned into the setting's type
+        """
+        default = self.defaults[setting]
+        if isinstance(default, bool):
+            if isinstance(value, str):
+                if value not in ('True', 'False'):
+                    raise ValueError('Not a bool: ' + value)
+                return value == 'True'
+            return bool(value)
+        if isinstance(default, (int, float)):
+            # Ratios are numbers too, so a number setting keeps whatever kind of number it's given
+            number = float(value)
+            return int(number) if number.is_integer() and isinstance(default, int) else number
+        if isinstance(default, tuple):
+            return tuple(value)
+        if isinstance(default, list):
+            return list(value)
+        return str(value)
+
+    def set(self, setting: str, value: object):
+        """
+        A function to change a setting. The change is set on the settings module right away and saved later.
+
+        @param setting: the name of the setting
+        @type setting: str
+        @param value: the new value of the setting, turned into the type of its default
+        @type value: object
+        @return: whether the setting was changed
+        @rtype: bool
+        """
+        if setting not in self.defaults:
+            logging.error('* Error - Unknown setting: %s.', setting)
+            return False
+        try:
+            value = self.coerce(setting, value)
+        except (TypeError, ValueError):
+            logging.error('* Error - Invalid value for the setting %s: %s.', setting, value)
+            return False
+        if setting not in self.profile:
+            setattr(settings, setting, value)
+        if value == self.defaults[setting]:
+            self.changes.pop(setting, None)
+        else:
+            self.changes[setting] = value
+        self.dirty = True
+        self.time_changed = time.monotonic()
+        return True
+
+    def get_base(self, setting: str):
+        """
+        Accessor. Grab the value of a setting without the character's settings, the user's change or the default.
+
+        @param setting: the name of the setting
+        @type setting: str
+        @return: the value of the setting
+        @rtype: object
+        """
+        return self.changes.get(setting, self.defaults[setting])
+
+    def set_profile(self, profile: dict):
+        """
+        A function to swap the character's settings for another character's, such as when a save is loaded. The
+        settings the last character had and the new one doesn't go back to the user's changes or their defaults.
+
+        @param profile: setting name -> value of the new character, empty to go back to the defaults
+        @type profile: dict
+        @return: none
+        @rtype: none
+        """
+        profile_old = self.profile
+        self.profile = types.MappingProxyType({setting: value for setting, value in profile.items()
+                                               if setting in self.defaults})
+        for setting in profile_old:
+            if setting not in self.profile:
+                setattr(settings, setting, copy_value(self.get_base(setting)))
+        for setting, value in self.profile.items():
+            setattr(settings, setting, copy_value(value))
+
+    def load(self):
+        """
+        A function to read the changes from the settings file and set them on the settings module. Without a file, or
+        with one that can't be read, every setting keeps its default.
+
+        @return: none
+        @rtype: none
+        """
+        if not os.path.isfile(self.file_location):
+            return
+        try:
+            with open(self.file_location, 'r') as file:
+                changes = json.load(file)
+        except (OSError, ValueError):
+            logging.error('* Error - Unable to read the settings file, using the default settings.')
+            return
+        for setting, value in changes.items():
+            self.set(setting, value)
+        self.dirty = False
+
+    def flush(self):
+        """
+        A function to save every change to the settings file now. The file is written next to the old one and then
+        moved over it, so a crash part way through never leaves a broken settings file.
+
+        @return: none
+        @rtype: none
+        """
+        if self.dirty is False:
+            return
+        directory = os.path.dirname(self.file_location)
+        if directory != '':
+            os.makedirs(directory, exist_ok=True)
+        path_temp = self.file_location + '.tmp'
+        with open(path_temp, 'w') as file:
+            json.dump(self.changes, file, indent=4, sort_keys=True)
+        os.replace(path_temp, self.file_location)
+        self.dirty = False
+
+    def update(self):
+        """
+        A function to save the changes once none have been made for settings.SETTINGS_FLUSH_DELAY seconds, so a burst
+        of changes is saved only once.
+
+        @return: none
+        @rtype: none
+        """
+        if self.dirty is True and time.monotonic() - self.time_changed >= settings.SETTINGS_FLUSH_DELAY:
+            self.flush()
+
+
+def copy_value(value: object):
+    """
+    A function to copy a setting's value if it can be changed in place, so changing a setting in game, such as adding
+    to the inventory, never changes a layer.
+
+    @param value: the value of the setting
+    @type value: object
+    @return: the value, or a copy of it
+    @rtype: object
+    """
+    return list(value) if isinstance(value, list) else value
+
+
+# The store shared by the whole engine
+store = SettingsStore()
@@ -0,0 +1,28 @@
+# A unit test for the benchmark module.
+# Tanner Fry
+# tefnq2@mst.edu
+from benchmark import compare, time_function
+
+import unittest
+
+
+class TestBenchmark(unittest.TestCase):
+
+    def test_compare(self):
+        baseline = {'faster': {'ms': 2.0}, 'slower': {'ms': 1.0}, 'removed': {'ms': 1.0}}
+        results = {'faster': {'ms': 1.0}, 'slower': {'ms': 1.5}, 'new': {'ms': 1.0}}
+        self.assertEqual(compare(results, baseline, 0.1), [('faster', 2.0, 1.0, -0.5, False),
+                                                           ('slower', 1.0, 1.5, 0.5, True)])
+        # Within the threshold isn't a regression
+        self.assertFalse(compare(results, baseline, 0.6)[1][4])
+
+    def test_time_function(self):
+        calls = []
+        timing = time_function(lambda: calls.append(1), 10, repeats=3)
+        self.assertEqual(len(calls), 30)
+        self.assertEqual(timing['calls'], 30)
+        self.assertLessEqual(timing['ms_min'], timing['ms'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+# A unit test for the collision module.
+# Tanner Fry
+# tefnq2@mst.edu
+from collision import CollisionLayer, resolve_walls
+from level import SubLevel, TILES_HIGH, TILES_WIDE
+
+import pygame
+import types
+import unittest
+
+
+class TestCollision(unittest.TestCase):
+
+    def setUp(self):
+        # A floor along the bottom row, a pillar on it, and a block in the top left corner. The pillar is merged down
+        # through the floor, splitting the floor in two
+        self.sub_level = SubLevel(1)
+        for col in range(TILES_WIDE):
+            self.sub_level.set_tile(col, TILES_HIGH - 1, 1)
+        for row in range(TILES_HIGH - 5, TILES_HIGH - 1):
+            self.sub_level.set_tile(10, row, 1)
+        for col in range(2):
+            for row in range(2):
+                self.sub_level.set_tile(col, row, 1)
+        self.layer = CollisionLayer(self.sub_level, 32)
+
+    def make_entity(self, rect, falling=False):
+        return types.SimpleNamespace(rect=rect, falling=falling, climbing=False, y_velocity=5)
+
+    def test_query_clipped_to_grid(self):
+        corner = pygame.Rect(0, 0, 64, 64)
+        # Hanging off the top left and the bottom right of the screen
+        self.assertEqual(self.layer.query(pygame.Rect(-50, -50, 60, 60)), [corner])
+        self.assertEqual(self.layer.query(pygame.Rect(1270, 950, 40, 40)), [pygame.Rect(352, 928, 928, 32)])
+        # Completely off the screen
+        self.assertEqual(self.layer.query(pygame.Rect(-200, 100, 50, 50)), [])
+        self.assertEqual(self.layer.query(pygame.Rect(1300, 100, 50, 50)), [])
+        self.assertEqual(self.layer.query(pygame.Rect(100, 1000, 50, 50)), [])
+        self.assertEqual(CollisionLayer().query(corner), [])
+
+    def test_query_merged_walls(self):
+        pillar = pygame.Rect(320, 800, 32, 160)
+        floor_left = pygame.Rect(0, 928, 320, 32)
+        floor_right = pygame.Rect(352, 928, 928, 32)
+        # Covers many cells of each wall but each wall is only found once
+        self.assertEqual(self.layer.query(pygame.Rect(250, 780, 150, 160)), [pillar, floor_left, floor_right])
+        # Just touching a wall's edge isn't overlapping it
+        self.assertEqual(self.layer.query(pygame.Rect(352, 800, 32, 128)), [])
+        # The walls are made again once the tiles change
+        self.sub_level.set_tile(11, TILES_HIGH - 2, 1)
+        self.assertEqual(len(self.layer.query(pygame.Rect(250, 780, 150, 160))), 4)
+
+    def test_resolve_least_penetration(self):
+        floor = pygame.Rect(352, 928, 928, 32)
+        pillar = pygame.Rect(320, 800, 32, 160)
+        # Landing on the floor, sunk in less than it's across it
+        entity = self.make_entity(pygame.Rect(500, 870, 32, 64), falling=True)
+        resolve_walls(entity, [floor])
+        self.assertEqual(entity.rect.bottom, floor.top + 1)
+        self.assertFalse(entity.falling)
+        # Walking into the side of the pillar, pushed back out the side it came from
+        entity = self.make_entity(pygame.Rect(292, 820, 32, 64))
+        resolve_walls(entity, [pillar])
+        self.assertEqual(entity.rect.right, pillar.left + 1)
+        self.assertTrue(entity.falling)
+        entity = self.make_entity(pygame.Rect(348, 820, 32, 64))
+        resolve_walls(entity, [pillar], can_climb=True)
+        self.assertEqual(entity.rect.left, pillar.right - 1)
+        self.assertTrue(entity.climbing)
+        # Jumping into the corner block from below
+        entity = self.make_entity(pygame.Rect(10, 60, 32, 64))
+        resolve_walls(entity, [pygame.Rect(0, 0, 64, 64)])
+        self.assertEqual(entity.rect.top, 65)
+        self.assertEqual(entity.y_velocity, 0)
+        self.assertTrue(entity.falling)
+        # Something falling fast enough to go more than halfway through still lands on top
+        entity = self.make_entity(pygame.Rect(500, 936, 32, 64), falling=True)
+        resolve_walls(entity, [floor])
+        self.assertEqual(entity.rect.bottom, floor.top + 1)
+        self.assertFalse(entity.falling)
+
+
+if __name__ == '__main__':
+    unittest.main()
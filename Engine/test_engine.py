@@ -10,6 +10,11 @@ class TestEngine(unittest.TestCase):
     def test_main(self):
         self.assertEqual(engine.main(), 0)
 
+    def test_start_headless_without_save(self):
+        # A game that can't be set up is logged instead of crashing the run
+        self.assertIsNone(engine.start_headless('Not_A_Save'))
+        self.assertIsNone(engine.run_headless('Not_A_Save', 10))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -3,8 +3,13 @@
 # tefnq2@mst.edu
 import engine
 from engine import Game
-from engineLib import EngineHandler
+from engineLib import EngineHandler, SpriteSheet, load_tileset
 
+import json
+import os
+import pygame
+import settings
+import tempfile
 import unittest
 
 
@@ -13,6 +18,21 @@ class TestEngineLib(unittest.TestCase):
     def test_engine_handler(self):
         self.assertRaises(FileNotFoundError, EngineHandler.generate_level, EngineHandler, Game, 1, 1)
 
+    def test_tileset_colorkey(self):
+        tileset = load_tileset(settings.FILE_TILESET)
+        self.assertIsInstance(tileset['colorkey'], tuple)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'tileset.json')
+            with open(path, 'w') as file:
+                json.dump({'sheet': 'Sheet.png', 'tile_size': 32, 'colorkey': [255, 0, 255], 'tiles': []}, file)
+            self.assertEqual(load_tileset(path)['colorkey'], (255, 0, 255))
+            # The sprite sheet is drawn without the manifest's color
+            pygame.display.init()
+            pygame.display.set_mode((1, 1))
+            path_sheet = os.path.join(directory, 'Sheet.png')
+            pygame.image.save(pygame.Surface((2, 2)), path_sheet)
+            self.assertEqual(SpriteSheet(path_sheet, (255, 0, 255)).sprite_sheet.get_colorkey()[:3], (255, 0, 255))
+
 
 if __name__ == '__main__':
     unittest.main()
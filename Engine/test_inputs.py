@@ -0,0 +1,47 @@
+# A unit test for the inputs module.
+# Tanner Fry
+# tefnq2@mst.edu
+from inputs import InputRecording, KeysHeld, get_keys_mask, make_event
+
+import os
+import pygame
+import tempfile
+import unittest
+
+
+class TestInputs(unittest.TestCase):
+
+    def test_keys_held(self):
+        keys_held = KeysHeld(get_keys_mask({pygame.K_SPACE: True, pygame.K_LEFT: True, pygame.K_d: False,
+                                            pygame.K_LCTRL: False, pygame.K_LSHIFT: False, pygame.K_w: False,
+                                            pygame.K_a: False, pygame.K_s: False, pygame.K_g: False,
+                                            pygame.K_RIGHT: False}))
+        self.assertTrue(keys_held[pygame.K_SPACE])
+        self.assertTrue(keys_held[pygame.K_LEFT])
+        self.assertFalse(keys_held[pygame.K_d])
+        # Keys the game doesn't check are never held
+        self.assertFalse(keys_held[pygame.K_z])
+
+    def test_recording_round_trip(self):
+        recording = InputRecording('Save_1', 2, 5, 123456789)
+        recording.ticks.append((0, (10, 20), []))
+        recording.ticks.append((3, (-5, 700), [make_event(pygame.KEYDOWN, pygame.K_RIGHT, (0, 0), 'é'),
+                                               make_event(pygame.MOUSEBUTTONDOWN, 1, (40, 50), ''),
+                                               make_event(pygame.QUIT, 0, (0, 0), '')]))
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'recording.inp')
+            recording.save(path)
+            loaded = InputRecording.load(path)
+        self.assertEqual((loaded.file_save_name, loaded.level_number, loaded.level_sub, loaded.seed),
+                         ('Save_1', 2, 5, 123456789))
+        self.assertEqual(len(loaded), 2)
+        self.assertEqual(loaded.ticks[0], (0, (10, 20), []))
+        mask, mouse_pos, events = loaded.ticks[1]
+        self.assertEqual((mask, mouse_pos), (3, (-5, 700)))
+        self.assertEqual([event.type for event in events], [pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, pygame.QUIT])
+        self.assertEqual((events[0].key, events[0].unicode), (pygame.K_RIGHT, 'é'))
+        self.assertEqual((events[1].button, events[1].pos), (1, (40, 50)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,158 @@
+# A unit test for the level module.
+# Tanner Fry
+# tefnq2@mst.edu
+from level import Level, LevelGraph, SubLevel, Tileset, MATRIX_EMPTY, TILES_HIGH, TILES_WIDE, compile_level, \
+    get_compiled_path, is_compiled_current, load_level, merge_tiles
+
+import os
+import settings
+import tempfile
+import unittest
+
+
+class TestLevel(unittest.TestCase):
+
+    def setUp(self):
+        # 1 2 ######
+        # ###### 3 4
+        # 5 ###### 6
+        self.graph = LevelGraph([[1, 2, MATRIX_EMPTY],
+                                 [MATRIX_EMPTY, 3, 4],
+                                 [5, MATRIX_EMPTY, 6]])
+
+    def test_level_graph_neighbours(self):
+        self.assertEqual(self.graph.get_position(4), (1, 2))
+        self.assertEqual(self.graph.get_neighbours(2), {'Left': 1, 'Down': 3})
+        self.assertEqual(self.graph.get_neighbours(4), {'Left': 3, 'Down': 6})
+        # The edges of the matrix don't wrap around to the other side
+        self.assertEqual(self.graph.get_neighbours(1), {'Right': 2})
+        self.assertEqual(self.graph.get_neighbours(5), {})
+        self.assertIsNone(self.graph.get_position(7))
+
+    def test_level_graph_distances(self):
+        self.assertEqual(self.graph.get_distances(1), {1: 0, 2: 1, 3: 2, 4: 3, 6: 4})
+        self.assertEqual(self.graph.get_distances(1, 2), {1: 0, 2: 1, 3: 2})
+        self.assertEqual(self.graph.get_distances(7), {})
+
+    def test_sub_level_tiles(self):
+        sub_level = SubLevel(1)
+        sub_level.set_tile(3, 2, 5)
+        sub_level.set_tile(3, 2, 5)
+        self.assertEqual(sub_level.get_tile(3, 2), 5)
+        self.assertEqual(sub_level.revision, 1)
+        self.assertEqual(list(sub_level.iter_tiles()), [(3, 2, 5)])
+
+    def test_merge_tiles(self):
+        sub_level = SubLevel(1)
+        # A floor along the bottom two rows and a wall up the left side
+        for col in range(40):
+            sub_level.set_tile(col, 28, 1)
+            sub_level.set_tile(col, 29, 1)
+        for row in range(20, 28):
+            sub_level.set_tile(0, row, 2)
+        self.assertEqual(merge_tiles(sub_level.tiles), [(0, 20, 1, 10), (1, 28, 39, 2)])
+        self.assertEqual(sub_level.get_rects(), merge_tiles(sub_level.tiles))
+        self.assertEqual(merge_tiles(SubLevel(2).tiles), [])
+
+
+class TestLevelFiles(unittest.TestCase):
+
+    def setUp(self):
+        self.dir_levels = settings.DIR_LEVELS
+        self.directory = tempfile.TemporaryDirectory()
+        settings.DIR_LEVELS = self.directory.name
+        self.path_level = self.directory.name + '/Level_1'
+        os.makedirs(self.path_level)
+        with open(self.path_level + '/level_matrix.lvl', 'w') as file:
+            file.write('LVL1 ######\n###### LVL2')
+        # Sub-level 1 has a floor along the bottom row, sub-level 2 a wall up the left side
+        self.write_sub_level(1, {(col, TILES_HIGH - 1): 'GL0' for col in range(TILES_WIDE)})
+        self.write_sub_level(2, {(0, row): 'GR1' for row in range(TILES_HIGH)})
+        self.tileset = Tileset({'tile_size': 32, 'tiles': [{'id': 1, 'code': 'GL0'}, {'id': 2, 'code': 'GR1'}]})
+        self.levels = []
+
+    def tearDown(self):
+        for level in self.levels:
+            level.close()
+        settings.DIR_LEVELS = self.dir_levels
+        self.directory.cleanup()
+
+    def write_sub_level(self, level_sub, tiles):
+        with open(self.path_level + '/Sub_Level_' + str(level_sub) + '.txt', 'w') as file:
+            for row in range(TILES_HIGH):
+                file.write(' '.join(tiles.get((col, row), 'N/A') for col in range(TILES_WIDE)) + '\n')
+
+    def load(self, load_function):
+        level = load_function(1, self.tileset)
+        self.levels.append(level)
+        return level
+
+    def test_compile_round_trip(self):
+        compile_level(1, self.tileset)
+        self.assertTrue(is_compiled_current(1))
+        level_compiled = self.load(Level.load_compiled)
+        level_text = self.load(Level)
+        self.assertEqual(level_compiled.get_matrix(), [[1, MATRIX_EMPTY], [MATRIX_EMPTY, 2]])
+        self.assertEqual(level_compiled.get_matrix(), level_text.get_matrix())
+        self.assertEqual(sorted(level_compiled.offsets), [1, 2])
+        for level_sub in (1, 2):
+            sub_level_compiled = level_compiled.get_sub_level(level_sub)
+            sub_level_text = level_text.get_sub_level(level_sub)
+            self.assertEqual(sub_level_compiled.tiles, sub_level_text.tiles)
+            self.assertEqual(sub_level_compiled.get_rects(), sub_level_text.get_rects())
+        self.assertEqual(level_compiled.get_sub_level(1).get_rects(), [(0, TILES_HIGH - 1, TILES_WIDE, 1)])
+        # Tiles copied out of the compiled level can still be changed
+        level_compiled.set_tile(1, 0, 0, 2)
+        self.assertEqual(level_compiled.get_sub_level(1).get_tile(0, 0), 2)
+
+    def test_compiled_bad_checksum(self):
+        path_compiled = compile_level(1, self.tileset)
+        with open(path_compiled, 'r+b') as file:
+            file.seek(-1, os.SEEK_END)
+            byte = file.read(1)
+            file.seek(-1, os.SEEK_END)
+            file.write(bytes([byte[0] ^ 0xFF]))
+        with self.assertRaises(ValueError):
+            Level.load_compiled(1, self.tileset)
+        # The corrupted file is made again from the text files
+        level = self.load(load_level)
+        self.assertEqual(level.get_sub_level(2).get_tile(0, 0), 2)
+        self.assertEqual(level.get_sub_level(2).get_rects(), [(0, 0, 1, TILES_HIGH)])
+
+    def test_compiled_out_of_date(self):
+        path_compiled = compile_level(1, self.tileset)
+        time_compiled = os.path.getmtime(path_compiled)
+        # Made before the sub-level was edited
+        os.utime(path_compiled, (time_compiled - 10, time_compiled - 10))
+        self.write_sub_level(2, {(5, 5): 'GL0'})
+        self.assertFalse(is_compiled_current(1))
+        level = self.load(load_level)
+        self.assertEqual(level.get_sub_level(2).get_tile(0, 0), 0)
+        self.assertEqual(level.get_sub_level(2).get_tile(5, 5), 1)
+        self.assertTrue(is_compiled_current(1))
+
+    def test_loaded_sub_level(self):
+        level = self.load(Level)
+        # Never read just to be looked at
+        self.assertIsNone(level.get_loaded_sub_level(1))
+        self.assertNotIn(1, level.sub_levels)
+        level.prefetch([1, 7])
+        for future in list(level.pending.values()):
+            future.result()
+        sub_level = level.get_loaded_sub_level(1)
+        self.assertEqual(sub_level.get_tile(0, TILES_HIGH - 1), 1)
+        self.assertIs(level.get_sub_level(1), sub_level)
+        # Sub-level 7 doesn't have a file
+        self.assertIsNone(level.get_loaded_sub_level(7))
+        self.assertIn(7, level.missing)
+        self.assertEqual(level.pending, {})
+
+    def test_compiled_missing(self):
+        self.assertFalse(is_compiled_current(1))
+        self.assertFalse(os.path.isfile(get_compiled_path(1)))
+        with self.assertRaises(FileNotFoundError):
+            Level.load_compiled(1, self.tileset)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,191 @@
+# A unit test for the npc module.
+# Tanner Fry
+# tefnq2@mst.edu
+from collision import CollisionLayer
+from level import Level, SubLevel, Tileset, TILES_HIGH, TILES_WIDE
+from npc import AIScheduler, NPCCrowd, NPCHandler, numpy
+
+import animations
+import os
+import pygame
+import settings
+import tempfile
+import time
+import types
+import unittest
+
+
+class Thinker(object):
+    """Class. Used to stand in for an npc that only records when it thinks."""
+    def __init__(self, name: str, distance: float, thoughts: list, importance=1, seconds=0.0):
+        self.distance = distance
+        self.importance = importance
+        self.name = name
+        self.seconds = seconds  # How long each thought takes
+        self.thoughts = thoughts
+
+    def think(self):
+        if self.seconds > 0:
+            time.sleep(self.seconds)
+        self.thoughts.append(self.name)
+
+
+class TestNPC(unittest.TestCase):
+
+    def setUp(self):
+        self.thoughts = []
+        self.near = Thinker('near', 10, self.thoughts)
+        self.far = Thinker('far', 10 + 3 * settings.NPC_AI_AGING, self.thoughts)
+        self.important = Thinker('important', 40, self.thoughts, importance=8)
+
+    def test_scheduler_order(self):
+        scheduler = AIScheduler(budget_ms=1000)
+        self.assertEqual(scheduler.run([self.far, self.near, self.important], lambda thinker: thinker.distance), 3)
+        self.assertEqual(self.thoughts, ['important', 'near', 'far'])
+        self.assertEqual(scheduler.waiting, {})
+
+    def test_scheduler_budget(self):
+        # Only the most urgent thinker fits in an empty budget, the others wait and move up the queue
+        scheduler = AIScheduler(budget_ms=0)
+        for _ in range(5):
+            scheduler.start_frame()
+            scheduler.run([self.far, self.near], lambda thinker: thinker.distance)
+        self.assertEqual(self.thoughts, ['near', 'near', 'near', 'far', 'near'])
+        # The far npc was left waiting by this frame, it counts once the next frame starts
+        self.assertEqual(scheduler.waiting, {self.far: 0})
+        scheduler.start_frame()
+        self.assertEqual(scheduler.waiting, {self.far: 1})
+
+    def test_scheduler_budget_per_frame(self):
+        # Every tick of a frame that's catching up shares the one budget
+        budget_ms = 6
+        thinkers = [Thinker(str(i), i, self.thoughts, seconds=0.002) for i in range(20)]
+        scheduler = AIScheduler(budget_ms=budget_ms)
+        scheduler.start_frame()
+        time_start = time.perf_counter()
+        counts = [scheduler.run(thinkers, lambda thinker: thinker.distance) for _ in range(settings.TICK_MAX_PER_FRAME)]
+        time_thinking = (time.perf_counter() - time_start) * 1000
+        self.assertGreater(counts[0], 0)
+        self.assertEqual(counts[1:], [0] * (settings.TICK_MAX_PER_FRAME - 1))
+        # Only the thought started before the budget ran out can go over it, a budget for every tick would be spent
+        # several times over
+        self.assertLess(time_thinking, budget_ms * 2)
+        # Waiting ticks of the same frame don't count as waiting frames
+        self.assertEqual(set(scheduler.waiting.values()), {0})
+        scheduler.start_frame()
+        self.assertGreater(scheduler.run(thinkers, lambda thinker: thinker.distance), 0)
+
+
+@unittest.skipIf(numpy is None, 'Crowds need numpy')
+class TestNPCCrowd(unittest.TestCase):
+
+    def setUp(self):
+        # Frames of a known size, wider than a tile, in place of the sprite's images
+        self.sprites = dict(animations.library.sprites)
+        frame = pygame.Surface((40, 64))
+        animations.library.sprites['NPC_Squishy'] = {
+            'None': animations.FrameSet([frame]),
+            'Idle': animations.FrameSet([frame] * 2, 6),
+            'Running': animations.FrameSet([frame] * 6, 10)
+        }
+
+    def tearDown(self):
+        animations.library.sprites.clear()
+        animations.library.sprites.update(self.sprites)
+
+    def make_crowd(self, x_list, seed):
+        crowd = NPCCrowd(1, seed)
+        for x in x_list:
+            crowd.add(x, 0)
+        return crowd
+
+    def test_crowd_never_in_wall(self):
+        # A floor, a pillar one tile wide, a ledge, and a wall that doesn't reach the top of the screen
+        sub_level = SubLevel(1)
+        for col in range(TILES_WIDE):
+            sub_level.set_tile(col, TILES_HIGH - 1, 1)
+        for row in range(20, TILES_HIGH - 1):
+            sub_level.set_tile(8, row, 1)
+        for col in range(14, 22):
+            sub_level.set_tile(col, 22, 1)
+        for row in range(10, TILES_HIGH - 1):
+            sub_level.set_tile(30, row, 1)
+        layer = CollisionLayer(sub_level, settings.TILE_SIZE)
+        crowd = self.make_crowd(numpy.linspace(0, settings.SCREEN_WIDTH - 40, 120), 16)
+        for tick in range(400):
+            crowd.think()
+            crowd.tick(sub_level)
+            for i in range(len(crowd)):
+                # Left sunk into the floor by 1, so the bottom row of pixels doesn't count
+                rect = pygame.Rect(int(crowd.x[i]), int(crowd.y[i]), crowd.width, crowd.height - 1)
+                self.assertEqual(layer.query(rect), [], 'npc ' + str(i) + ' on tick ' + str(tick))
+                self.assertTrue(pygame.Rect(0, 0, settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT).contains(rect))
+
+    def test_crowd_thaw_matches_ticks(self):
+        # A floor split into three by walls as tall as the screen, so every npc stays on the part it lands on
+        sub_level = SubLevel(1)
+        for col in range(TILES_WIDE):
+            sub_level.set_tile(col, TILES_HIGH - 1, 1)
+        for row in range(TILES_HIGH - 1):
+            sub_level.set_tile(10, row, 1)
+            sub_level.set_tile(25, row, 1)
+
+        def get_part(x):
+            for part, (x_min, x_max) in enumerate(((0, 320), (352, 800), (832, settings.SCREEN_WIDTH))):
+                if x_min <= x and x + 40 <= x_max:
+                    return part
+            return None
+        x_list = [x for x in numpy.linspace(0, settings.SCREEN_WIDTH - 40, 80) if get_part(x) is not None]
+        ticks = 200
+        ticked = self.make_crowd(x_list, 16)
+        for _ in range(ticks):
+            ticked.think()
+            ticked.tick(sub_level)
+        thawed = self.make_crowd(x_list, 16)
+        thawed.freeze(0)
+        thawed.thaw(sub_level, ticks)
+        self.assertIsNone(thawed.frozen_tick)
+        reach = ticks * (thawed.speed - settings.FRICTION)
+        for i, x in enumerate(x_list):
+            self.assertEqual(thawed.y[i], ticked.y[i])
+            self.assertFalse(thawed.falling[i] or ticked.falling[i])
+            self.assertEqual(get_part(thawed.x[i]), get_part(x))
+            self.assertEqual(get_part(ticked.x[i]), get_part(x))
+            self.assertLessEqual(abs(thawed.x[i] - x), reach + 0.5)
+            self.assertLessEqual(abs(ticked.x[i] - x), reach + 0.5)
+
+    def test_coarse_crowd_waits_for_prefetch(self):
+        dir_levels = settings.DIR_LEVELS
+        directory = tempfile.TemporaryDirectory()
+        settings.DIR_LEVELS = directory.name
+        os.makedirs(directory.name + '/Level_1')
+        with open(directory.name + '/Level_1/level_matrix.lvl', 'w') as file:
+            file.write('LVL1 LVL2')
+        for level_sub in (1, 2):
+            with open(directory.name + '/Level_1/Sub_Level_' + str(level_sub) + '.txt', 'w') as file:
+                file.write('\n'.join(' '.join(['GL0' if row == TILES_HIGH - 1 else 'N/A'] * TILES_WIDE)
+                                     for row in range(TILES_HIGH)) + '\n')
+        level_tiles = Level(1, Tileset({'tile_size': 32, 'tiles': [{'id': 1, 'code': 'GL0'}]}))
+        try:
+            handler = NPCHandler(types.SimpleNamespace(level_tiles=level_tiles, level_sub_current=1, seed=16))
+            crowd = handler.spawn_crowd(2, 10)
+            for _ in range(settings.NPC_LOD_COARSE_INTERVAL):
+                handler.handler_cycle()
+            # The nearby sub-level isn't read just to move its crowd
+            self.assertNotIn(2, level_tiles.sub_levels)
+            self.assertEqual(crowd.frozen_tick, 1)
+            level_tiles.prefetch([2])
+            level_tiles.pending[2].result()
+            handler.handler_cycle()
+            self.assertIn(2, level_tiles.sub_levels)
+            self.assertIsNone(crowd.frozen_tick)
+            # Fast forwarded onto the floor of the sub-level
+            self.assertTrue((crowd.y[:len(crowd)] == (TILES_HIGH - 1) * 32 - crowd.height + 1).all())
+        finally:
+            level_tiles.close()
+            settings.DIR_LEVELS = dir_levels
+            directory.cleanup()
+
+
+if __name__ == '__main__':
+    unittest.main()
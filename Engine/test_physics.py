@@ -0,0 +1,63 @@
+# A unit test for the physics module.
+# Tanner Fry
+# tefnq2@mst.edu
+from physics import PhysicsBody, PhysicsSprite, integrate, integrate_arrays, numpy, step
+
+import pygame
+import random
+import settings
+import unittest
+
+
+class TestPhysics(unittest.TestCase):
+
+    def make_bodies(self, count, seed):
+        generator = random.Random(seed)
+        bodies = []
+        for _ in range(count):
+            body = PhysicsBody(pygame.Rect(generator.randint(-100, 1400), generator.randint(-100, 1000), 32, 64))
+            body.x_velocity = generator.choice([0, generator.uniform(-12, 12)])
+            body.y_velocity = generator.choice([0, generator.uniform(-5, 15)])
+            body.jumping = generator.random() < 0.3
+            body.falling = generator.random() < 0.5
+            body.climbing = generator.random() < 0.2
+            bodies.append(body)
+        return bodies
+
+    @unittest.skipIf(numpy is None, 'integrate_arrays() needs numpy')
+    def test_integrate_arrays_matches_integrate(self):
+        bodies = self.make_bodies(200, 15)
+        x = numpy.array([body.rect.x for body in bodies], dtype=float)
+        y = numpy.array([body.rect.y for body in bodies], dtype=float)
+        x_velocity = numpy.array([body.x_velocity for body in bodies], dtype=float)
+        y_velocity = numpy.array([body.y_velocity for body in bodies], dtype=float)
+        jumping = numpy.array([body.jumping for body in bodies], dtype=bool)
+        falling = numpy.array([body.falling for body in bodies], dtype=bool)
+        climbing = numpy.array([body.climbing for body in bodies], dtype=bool)
+        for tick in range(40):
+            for body in bodies:
+                integrate(body, settings.GRAVITY, settings.FRICTION, settings.AIR_RESISTANCE)
+            integrate_arrays(x, y, x_velocity, y_velocity, jumping, falling, climbing, settings.GRAVITY,
+                             settings.FRICTION, settings.AIR_RESISTANCE)
+            for i, body in enumerate(bodies):
+                message = 'body ' + str(i) + ' on tick ' + str(tick)
+                self.assertEqual((int(x[i]), int(y[i])), body.rect.topleft, message)
+                self.assertAlmostEqual(x_velocity[i], body.x_velocity, msg=message)
+                self.assertAlmostEqual(y_velocity[i], body.y_velocity, msg=message)
+                self.assertEqual((jumping[i], falling[i], climbing[i]), (body.jumping, body.falling, body.climbing),
+                                 message)
+
+    def test_step_skips_sprites_without_body(self):
+        sprite = PhysicsSprite()
+        sprite.rect = pygame.Rect(0, 0, 32, 64)
+        sprite.x_velocity = 5
+        other = pygame.sprite.Sprite()
+        other.rect = pygame.Rect(0, 0, 32, 64)
+        step(pygame.sprite.Group(sprite, other))
+        self.assertEqual(sprite.rect.x, 4)
+        self.assertEqual(sprite.y_velocity, settings.GRAVITY)
+        self.assertEqual(other.rect.topleft, (0, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+# A unit test for the render module.
+# Tanner Fry
+# tefnq2@mst.edu
+from level import Level, Tileset, TILES_HIGH, TILES_WIDE
+from render import LevelSurfaceCache
+
+import os
+import pygame
+import settings
+import tempfile
+import types
+import unittest
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+
+class TestRender(unittest.TestCase):
+
+    def setUp(self):
+        pygame.init()
+        pygame.display.set_mode((settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT))
+        self.dir_levels = settings.DIR_LEVELS
+        self.directory = tempfile.TemporaryDirectory()
+        settings.DIR_LEVELS = self.directory.name
+        os.makedirs(self.directory.name + '/Level_1')
+        for level_sub in (1, 2):
+            with open(self.directory.name + '/Level_1/Sub_Level_' + str(level_sub) + '.txt', 'w') as file:
+                file.write('\n'.join(' '.join(['N/A'] * TILES_WIDE) for _ in range(TILES_HIGH)) + '\n')
+        images = {}
+        for code, color in (('RED', settings.RED), ('GRN', settings.GREEN)):
+            images[code] = pygame.Surface((32, 32))
+            images[code].fill(color)
+        manifest = {'tile_size': 32, 'tiles': [{'id': 1, 'code': 'RED'}, {'id': 2, 'code': 'GRN'}]}
+        # Only one sub-level is kept so going to the other one lets go of it
+        self.level_tiles = Level(1, Tileset(manifest, images), cache_size=1)
+        self.cache = LevelSurfaceCache(types.SimpleNamespace(level_tiles=self.level_tiles))
+
+    def tearDown(self):
+        self.level_tiles.close()
+        settings.DIR_LEVELS = self.dir_levels
+        self.directory.cleanup()
+        pygame.quit()
+
+    def test_surface_rebaked_after_reload(self):
+        self.level_tiles.get_sub_level(1)
+        self.level_tiles.set_tile(1, 0, 0, 1)
+        self.level_tiles.set_tile(1, 0, 0, 2)
+        self.assertEqual(self.level_tiles.get_sub_level(1).revision, 2)
+        self.assertEqual(self.cache.get_surface(1).get_at((0, 0))[:3], settings.GREEN)
+        # Let go of the sub-level and load it again, its one change is put back so it's back at revision 1
+        self.level_tiles.get_sub_level(2)
+        self.assertNotIn(1, self.level_tiles.sub_levels)
+        self.assertEqual(self.level_tiles.get_sub_level(1).revision, 1)
+        # One more change brings it to the revision the surface was baked from, with different tiles
+        self.level_tiles.set_tile(1, 1, 0, 1)
+        self.assertEqual(self.level_tiles.get_sub_level(1).revision, 2)
+        surface = self.cache.get_surface(1)
+        self.assertEqual(surface.get_at((0, 0))[:3], settings.GREEN)
+        self.assertEqual(surface.get_at((32, 0))[:3], settings.RED)
+
+    def test_surface_kept_until_changed(self):
+        surface = self.cache.get_surface(1)
+        self.assertIs(self.cache.get_surface(1), surface)
+        self.level_tiles.set_tile(1, 0, 0, 1)
+        surface = self.cache.get_surface(1)
+        self.assertEqual(surface.get_at((0, 0))[:3], settings.RED)
+        self.assertIs(self.cache.get_surface(1), surface)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,131 @@
+# A unit test for the saves module.
+# Tanner Fry
+# tefnq2@mst.edu
+from saves import AutosaveService, SaveFile, capture_snapshot, diff_state, get_state, merge_state, read_old_save
+
+import level
+import os
+import pygame
+import settings
+import tempfile
+import types
+import unittest
+
+
+class TestSaves(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'Save_1.sav')
+        self.state = {'character': {'health': 100, 'trait_endurance': 50},
+                      'position': {'level': 1, 'level_sub': 3, 'x': 640, 'y': 480},
+                      'profile': {'CHAR_NAME': 'Lasutriv', 'CHAR_INVENTORY': ['Bowl_Half']},
+                      'world': {}}
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def get_state_changed(self):
+        return {'character': {'health': 80, 'trait_endurance': 50},
+                'position': {'level': 1, 'level_sub': 4, 'x': 12, 'y': 480},
+                'profile': {'CHAR_NAME': 'Lasutriv', 'CHAR_INVENTORY': ['Bowl_Half', 'Bowl_Full']},
+                'world': {'1.4': [[61, 2]]}}
+
+    def test_diff_and_merge(self):
+        state_changed = self.get_state_changed()
+        changes = diff_state(self.state, state_changed)
+        self.assertEqual(changes['character'], {'health': 80})
+        self.assertNotIn('trait_endurance', changes['character'])
+        merge_state(self.state, changes)
+        self.assertEqual(self.state, state_changed)
+        # A value that's gone is removed
+        merge_state(self.state, diff_state(self.state, {'world': {}}))
+        self.assertEqual(self.state['world'], {})
+
+    def test_append_only_writes_changes(self):
+        save_file = SaveFile(self.path)
+        size_full = save_file.write(self.state)
+        size_changes = save_file.append(self.get_state_changed())
+        self.assertGreater(size_changes, 0)
+        self.assertEqual(save_file.append(self.get_state_changed()), 0)
+        self.assertEqual(os.path.getsize(self.path), save_file.size)
+        self.assertEqual(save_file.size, size_full + size_changes)
+
+        save_loaded = SaveFile.load(self.path)
+        self.assertEqual(save_loaded.records, 2)
+        self.assertEqual(save_loaded.state, self.get_state_changed())
+
+    def test_damaged_end_is_ignored(self):
+        save_file = SaveFile(self.path)
+        save_file.write(self.state)
+        save_file.append(self.get_state_changed())
+        # A crash part way through adding a record
+        with open(self.path, 'r+b') as file:
+            file.truncate(save_file.size - 3)
+        save_loaded = SaveFile.load(self.path)
+        self.assertEqual(save_loaded.records, 1)
+        self.assertEqual(save_loaded.state, self.state)
+        # The next save writes the whole file again instead of adding to the damaged end
+        save_loaded.append(self.get_state_changed())
+        self.assertEqual(SaveFile.load(self.path).state, self.get_state_changed())
+        self.assertEqual(save_loaded.records, 1)
+
+    def test_journal_is_compacted(self):
+        save_file = SaveFile(self.path)
+        save_file.write(self.state)
+        for health in range(settings.SAVE_JOURNAL_MAX):
+            state = self.get_state_changed()
+            state['character']['health'] = health
+            save_file.append(state)
+        self.assertLessEqual(save_file.records, settings.SAVE_JOURNAL_MAX)
+        self.assertEqual(SaveFile.load(self.path).state['character']['health'], settings.SAVE_JOURNAL_MAX - 1)
+
+    def test_not_a_save(self):
+        with open(self.path, 'wb') as file:
+            file.write(b'CHAR_NAME = \'Lasutriv\'\n')
+        with self.assertRaises(ValueError):
+            SaveFile.load(self.path)
+
+    def test_read_old_save(self):
+        path_old = os.path.join(self.directory.name, 'Save_1.py')
+        with open(path_old, 'w') as file:
+            file.write('RED = (255, 0, 0)\nCHAR_NAME = \'Tanner\'\nCHAR_INVENTORY = [\'Bowl_Half\']\nBLINK = True\n'
+                       'CHAR_STRENGTH_MAX = CHAR_STRENGTH * 2\n')
+        profile = read_old_save(path_old)['profile']
+        self.assertEqual(profile, {'CHAR_NAME': 'Tanner', 'CHAR_INVENTORY': ['Bowl_Half'], 'BLINK': True})
+
+    def get_game(self):
+        character_main = types.SimpleNamespace(direction='Right', health=100, trait_endurance=50, trait_influence=5,
+                                               trait_resolve=5, trait_strength=5, rect=pygame.Rect(640, 480, 32, 64))
+        return types.SimpleNamespace(character=character_main, level_current=1, level_sub_current=3,
+                                     level_tiles=level.Level(1, None), save_file=SaveFile(self.path))
+
+    def test_snapshot_is_not_changed_by_the_game(self):
+        engine_game = self.get_game()
+        engine_game.level_tiles.set_tile(3, 2, 1, 5)
+        snapshot = capture_snapshot(engine_game)
+        engine_game.level_tiles.set_tile(3, 4, 1, 6)
+        engine_game.character.health = 10
+        state = get_state(snapshot, {'world': {'2.1': [[0, 1]]}})
+        self.assertEqual(state['world'], {'1.3': [[42, 5]], '2.1': [[0, 1]]})
+        self.assertEqual(state['character']['health'], 100)
+
+    def test_autosave(self):
+        engine_game = self.get_game()
+        engine_game.save_file.write(self.state)
+        autosave = AutosaveService(engine_game.save_file, 2)
+        autosave.update(engine_game)
+        self.assertIsNone(autosave.future)
+        autosave.update(engine_game)
+        engine_game.character.health = 50
+        # The last save is written before stopping
+        autosave.close(engine_game)
+        self.assertEqual(SaveFile.load(self.path).state['character']['health'], 50)
+        metrics = autosave.get_metrics()
+        self.assertEqual(len(metrics), 2)
+        self.assertGreater(metrics[0]['bytes'], 0)
+        self.assertEqual(metrics[-1]['records'], 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
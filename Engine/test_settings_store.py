@@ -0,0 +1,81 @@
+# A unit test for the settings store module.
+# Tanner Fry
+# tefnq2@mst.edu
+from settings_store import SettingsStore, copy_value
+
+import os
+import settings
+import tempfile
+import unittest
+
+
+class TestSettingsStore(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.file_location = os.path.join(self.directory.name, 'settings.json')
+        self.store = SettingsStore(self.file_location)
+
+    def tearDown(self):
+        # Put back every setting the test changed
+        for setting in self.store.defaults:
+            setattr(settings, setting, copy_value(self.store.defaults[setting]))
+        self.directory.cleanup()
+
+    def test_set_coerces_types(self):
+        self.assertTrue(self.store.set('WINDOW_WIDTH', '1440'))
+        self.assertEqual(settings.WINDOW_WIDTH, 1440)
+        self.assertIsInstance(settings.WINDOW_WIDTH, int)
+        self.assertTrue(self.store.set('RES_WIDTH_RATIO', str(1440 / settings.SCREEN_WIDTH)))
+        self.assertEqual(settings.RES_WIDTH_RATIO, 1440 / settings.SCREEN_WIDTH)
+        self.assertTrue(self.store.set('RES_CHANGED', 'True'))
+        self.assertIs(settings.RES_CHANGED, True)
+        self.assertFalse(self.store.set('WINDOW_WIDTH', 'wide'))
+        self.assertFalse(self.store.set('NOT_A_SETTING', 1))
+        self.assertEqual(settings.WINDOW_WIDTH, 1440)
+
+    def test_flush_and_load(self):
+        self.store.set('GRAPHICS', 'Low')
+        self.store.set('WINDOW_HEIGHT', 768)
+        # Nothing is written until the changes are flushed
+        self.assertFalse(os.path.isfile(self.file_location))
+        self.store.flush()
+        self.assertFalse(self.store.dirty)
+        self.assertEqual(os.listdir(self.directory.name), ['settings.json'])
+
+        # A new game starts with every setting at its default
+        for setting in ('GRAPHICS', 'WINDOW_HEIGHT'):
+            setattr(settings, setting, self.store.defaults[setting])
+        store_loaded = SettingsStore(self.file_location)
+        store_loaded.load()
+        self.assertEqual(settings.GRAPHICS, 'Low')
+        self.assertEqual(store_loaded.changes, {'GRAPHICS': 'Low', 'WINDOW_HEIGHT': 768})
+        self.assertFalse(store_loaded.dirty)
+
+    def test_default_value_is_not_a_change(self):
+        self.store.set('GRAPHICS', 'Low')
+        self.store.set('GRAPHICS', self.store.defaults['GRAPHICS'])
+        self.assertEqual(self.store.changes, {})
+
+    def test_set_profile(self):
+        self.store.set('GRAPHICS', 'Low')
+        self.store.set_profile({'CHAR_NAME': 'Tanner', 'GRAPHICS': 'Medium', 'NOT_A_SETTING': 1})
+        self.assertEqual(settings.CHAR_NAME, 'Tanner')
+        self.assertEqual(settings.GRAPHICS, 'Medium')
+        self.assertFalse(hasattr(settings, 'NOT_A_SETTING'))
+        # The user's changes are kept under the character's settings
+        self.store.set_profile({'CHAR_NAME': 'Lasutriv'})
+        self.assertEqual(settings.GRAPHICS, 'Low')
+        self.store.set_profile({})
+        self.assertEqual(settings.CHAR_NAME, self.store.defaults['CHAR_NAME'])
+
+    def test_defaults_never_change(self):
+        with self.assertRaises(TypeError):
+            self.store.defaults['GRAPHICS'] = 'Low'
+        self.store.set_profile({})
+        settings.CHAR_INVENTORY.append('Bowl_Empty')
+        self.assertNotIn('Bowl_Empty', self.store.defaults['CHAR_INVENTORY'])
+
+
+if __name__ == '__main__':
+    unittest.main()
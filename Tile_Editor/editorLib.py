@@ -3,6 +3,7 @@
 # tefnq2@mst.edu
 import settings
 
+import json
 import math
 import os
 import pygame
@@ -35,56 +36,11 @@ class TileMap(object):
         # TODO: Fix this predefined setup. The spritesheet size should be calculated (from name),
         # CONT: broken down into separate tiles, stored into objects that are placeable, place
         # CONT: those objects, save it, store it, and finally be able to transfer it.
-        environment_spritesheet = SpriteSheet('Assets/Game_Environment/Ground_Grass_384_432_Spritesheet.png')
-        self.tile_types = {'GL0': environment_spritesheet.get_image(0, 0, 32, 32),
-                           'GL1': environment_spritesheet.get_image(0, 32, 32, 32),
-                           'GL2': environment_spritesheet.get_image(0, 64, 32, 32),
-                           'GL3': environment_spritesheet.get_image(0, 96, 32, 32),
-                           'GL4': environment_spritesheet.get_image(0, 128, 32, 32),
-                           'GL5': environment_spritesheet.get_image(0, 160, 32, 32),
-                           'GL6': environment_spritesheet.get_image(0, 192, 32, 32),
-                           'GM0': environment_spritesheet.get_image(32, 32, 32, 32),
-                           'GM1': environment_spritesheet.get_image(64, 32, 32, 32),
-                           'GM2': environment_spritesheet.get_image(96, 32, 32, 32),
-                           'GM3': environment_spritesheet.get_image(128, 32, 32, 32),
-                           'GM4': environment_spritesheet.get_image(160, 32, 32, 32),
-                           'GM5': environment_spritesheet.get_image(192, 32, 32, 32),
-                           'GM6': environment_spritesheet.get_image(224, 32, 32, 32),
-                           'GT0': environment_spritesheet.get_image(32, 0, 32, 32),
-                           'GT1': environment_spritesheet.get_image(64, 0, 32, 32),
-                           'GT2': environment_spritesheet.get_image(96, 0, 32, 32),
-                           'GT3': environment_spritesheet.get_image(128, 0, 32, 32),
-                           'GT4': environment_spritesheet.get_image(160, 0, 32, 32),
-                           'GT5': environment_spritesheet.get_image(192, 0, 32, 32),
-                           'GT6': environment_spritesheet.get_image(224, 0, 32, 32),
-                           'GR0': environment_spritesheet.get_image(256, 0, 32, 32),
-                           'GR1': environment_spritesheet.get_image(256, 32, 32, 32),
-                           'GR2': environment_spritesheet.get_image(256, 64, 32, 32),
-                           'GR3': environment_spritesheet.get_image(256, 96, 32, 32),
-                           'GR4': environment_spritesheet.get_image(256, 128, 32, 32),
-                           'GR5': environment_spritesheet.get_image(256, 160, 32, 32),
-                           'GR6': environment_spritesheet.get_image(256, 192, 32, 32),
-                           'HL0': environment_spritesheet.get_image(96, 240, 32, 32),
-                           'HL1': environment_spritesheet.get_image(96, 272, 32, 32),
-                           'HL2': environment_spritesheet.get_image(96, 304, 32, 32),
-                           'HL3': environment_spritesheet.get_image(96, 336, 32, 32),
-                           'HL4': environment_spritesheet.get_image(96, 368, 32, 32),
-                           'HL5': environment_spritesheet.get_image(96, 400, 32, 32),
-                           'HT0': environment_spritesheet.get_image(0, 336, 32, 32),
-                           'HT1': environment_spritesheet.get_image(32, 336, 32, 32),
-                           'HT2': environment_spritesheet.get_image(64, 336, 32, 32),
-                           'HT3': environment_spritesheet.get_image(128, 240, 32, 32),
-                           'HT4': environment_spritesheet.get_image(160, 240, 32, 32),
-                           'HT5': environment_spritesheet.get_image(224, 240, 32, 32),
-                           'HT6': environment_spritesheet.get_image(288, 336, 32, 32),
-                           'HT7': environment_spritesheet.get_image(320, 336, 32, 32),
-                           'HT8': environment_spritesheet.get_image(352, 336, 32, 32),
-                           'HR0': environment_spritesheet.get_image(256, 240, 32, 32),
-                           'HR1': environment_spritesheet.get_image(256, 272, 32, 32),
-                           'HR2': environment_spritesheet.get_image(256, 304, 32, 32),
-                           'HR3': environment_spritesheet.get_image(256, 336, 32, 32),
-                           'HR4': environment_spritesheet.get_image(352, 368, 32, 32),
-                           'HR5': environment_spritesheet.get_image(352, 400, 32, 32)}
+        # The tile codes and where they are on the sprite sheet are shared with the engine
+        tileset = load_tileset(settings.FILE_TILESET)
+        environment_spritesheet = SpriteSheet(settings.DIR_SPRITES_GAME_ENVI + '/' + tileset['sheet'],
+                                              tileset['colorkey'])
+        self.tile_types = environment_spritesheet.get_tiles(tileset)
 
     def handle_events(self, event: object):
         """
@@ -863,15 +819,19 @@ class Animation(object):
 
 class SpriteSheet(object):
     """Class. Used to grab images out of a sprite sheet."""
-    def __init__(self, file_name: str):
+    def __init__(self, file_name: str, colorkey=settings.BLACK):
         """
         Constructor. Used to initialize the SpriteSheet for later use.
 
         @param file_name: the full file location of the sprite sheet relative the engineLib.py file
         @type file_name: str
+        @param colorkey: the color drawn as transparent, such as the tileset manifest's colorkey
+        @type colorkey: tuple
         """
         # Load the sprite sheet.
         self.sprite_sheet = pygame.image.load(file_name).convert()
+        # It's set on the sheet so every image grabbed out of it shares it
+        self.sprite_sheet.set_colorkey(colorkey)
 
     def get_image(self, x: int, y: int, width: int, height: int):
         """
@@ -891,17 +851,23 @@ class SpriteSheet(object):
                  and functionality as a whole.
         @rtype: surface
         """
-        # Create a new blank image
-        image = pygame.Surface([width, height]).convert()
+        # A view into the sheet instead of a copy of it, it shares the sheet's pixels and transparent color
+        return self.sprite_sheet.subsurface((x, y, width, height))
 
-        # Copy the sprite from the large sheet onto the smaller image
-        image.blit(self.sprite_sheet, (0, 0), (x, y, width, height))
-
-        # Assuming black works as the transparent color
-        image.set_colorkey(settings.BLACK)
+    def get_tiles(self, tileset: dict):
+        """
+        Accessor. Grab every tile listed in a tileset manifest out of the sprite sheet.
 
-        # Return the image
-        return image
+        @param tileset: the tileset manifest, see load_tileset()
+        @type tileset: dict
+        @return: the tile codes, such as 'GL0', and their images
+        @rtype: dict
+        """
+        tile_size = tileset['tile_size']
+        tiles = {}
+        for tile in tileset['tiles']:
+            tiles[tile['code']] = self.get_image(tile['x'], tile['y'], tile_size, tile_size)
+        return tiles
 
 
 class TileSpriteInit(pygame.sprite.Sprite):
@@ -931,3 +897,20 @@ class TileSpriteInit(pygame.sprite.Sprite):
         self.rect = self.image.get_rect()
         self.rect.x = x
         self.rect.y = y
+
+
+def load_tileset(file_location: str):
+    """
+    A function to load the tileset manifest shared by the engine and the tile editor. The manifest names the sprite
+    sheet, the color on it that's drawn as transparent, and lists, in order, every tile's id, code, and location on
+    the sheet. Ids are what compiled levels store so new tiles are only ever added to the end of the list.
+
+    @param file_location: the file location of the tileset manifest
+    @type file_location: str
+    @return: the tileset manifest, with its colorkey as a tuple, black if it doesn't have one
+    @rtype: dict
+    """
+    with open(file_location, 'r') as file:
+        tileset = json.load(file)
+    tileset['colorkey'] = tuple(tileset.get('colorkey', settings.BLACK))
+    return tileset
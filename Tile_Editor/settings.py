@@ -4,6 +4,8 @@
 # File/folder locations
 DIR_SPRITES_ASSETS = 'Assets'
 DIR_SPRITES_ANIMATION = 'Assets/Animation'
+DIR_SPRITES_GAME_ENVI = 'Assets/Game_Environment'
+FILE_TILESET = '../Engine/Levels/tileset.json'  # Shared with the engine
 
 # Game constants
 SCREEN_HEIGHT = 960